@@ -0,0 +1,254 @@
+"""
+In-memory index answering APPLICATION_COMMAND_AUTOCOMPLETE interactions from large option sources.
+"""
+
+import bisect
+import heapq
+import unicodedata
+
+from ._datamodels import (
+    Locales, ApplicationCommandOptionChoice, InteractionResponse, InteractionCallbackTypes, InteractionCallbackData,
+)
+
+#Maximum number of choices discord accepts in an autocomplete result.
+AUTOCOMPLETE_CHOICES_LIMIT = 25
+
+def fold(text):
+    """
+    Case and accent insensitive form of text used for matching.
+    """
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(character for character in decomposed if not unicodedata.combining(character))
+
+def _trigrams(folded):
+    padded = f"  {folded} "
+    return {padded[n:n + 3] for n in range(len(padded) - 2)}
+
+def _sort_key(folded, value):
+    #Values of one option are int, float or str, numbers sort before strings so mixed values never get compared.
+    return (folded, isinstance(value, str), value)
+
+def _entry(name, value, name_localizations=None, weight=0):
+    return name, value, name_localizations, weight
+
+def focused_option(options):
+    """
+    Returns the focused AppCommandIntOption of an autocomplete interaction, searching nested subcommand options.
+    """
+    for option in options:
+        if(option.focused):
+            return option
+        found = focused_option(option.options)
+        if(found is not None):
+            return found
+    return None
+
+class _LocaleIndex():
+    """
+    Sorted array of (folded name, is str, value) for prefix lookups and a trigram posting list for fuzzy lookups.
+    """
+
+    def __init__(self):
+        self.keys = []
+        self.names = {}  # value -> folded name
+        self.trigrams = {}  # trigram -> set of values
+
+    def add(self, value, name):
+        folded = fold(name)
+        self.names[value] = folded
+        bisect.insort(self.keys, _sort_key(folded, value))
+        for trigram in _trigrams(folded):
+            self.trigrams.setdefault(trigram, set()).add(value)
+
+    def extend(self, entries):
+        """
+        Adds (value, name) pairs and sorts the array once, instead of an insertion per entry.
+        """
+        for value, name in entries:
+            folded = fold(name)
+            self.names[value] = folded
+            self.keys.append(_sort_key(folded, value))
+            for trigram in _trigrams(folded):
+                self.trigrams.setdefault(trigram, set()).add(value)
+        self.keys.sort()
+
+    def _discard_trigrams(self, value, folded):
+        for trigram in _trigrams(folded):
+            postings = self.trigrams[trigram]
+            postings.discard(value)
+            if(not postings):
+                del self.trigrams[trigram]
+
+    def remove(self, value):
+        folded = self.names.pop(value)
+        index = bisect.bisect_left(self.keys, _sort_key(folded, value))
+        del self.keys[index]
+        self._discard_trigrams(value, folded)
+
+    def remove_many(self, values):
+        """
+        Removes a set of values with one pass over the array.
+        """
+        for value in values:
+            self._discard_trigrams(value, self.names.pop(value))
+        self.keys = [key for key in self.keys if key[-1] not in values]
+
+    def prefix(self, folded):
+        low = bisect.bisect_left(self.keys, (folded,))
+        high = bisect.bisect_left(self.keys, (folded + "\U0010ffff",), low)
+        return self.keys, low, high
+
+    def fuzzy(self, folded, min_similarity):
+        query = _trigrams(folded)
+        counts = {}
+        for trigram in query:
+            for value in self.trigrams.get(trigram, ()):
+                counts[value] = counts.get(value, 0) + 1
+        threshold = max(1, int(len(query) * min_similarity))
+        return {value: count / len(query) for value, count in counts.items() if count >= threshold}
+
+class AutocompleteIndex():
+    """
+    Autocomplete choices kept in one index per locale, names are matched case and accent insensitively.
+    Entries whose name starts with the query come first, the rest of the top limit is filled with fuzzy(trigram) matches,
+    ties are broken by the weight given to each entry. Results are cached as ready to encode choice lists
+    until the next update. Queries in locales without an index of their own use the default locale.
+    Prefixes matching more than scan_threshold entries(e.g the empty query) walk the entries by descending weight
+    instead of ranking the whole range.
+    """
+
+    def __init__(self, locales=(), default_locale=Locales.ENGLISH_US, limit=AUTOCOMPLETE_CHOICES_LIMIT, min_similarity=0.5, cache_size=4096, scan_threshold=4096):
+        if(limit > AUTOCOMPLETE_CHOICES_LIMIT):
+            raise ValueError(f"discord accepts at most {AUTOCOMPLETE_CHOICES_LIMIT} autocomplete choices")
+        self.default_locale = Locales(default_locale)
+        self.locales = {self.default_locale: _LocaleIndex(), **{Locales(locale): _LocaleIndex() for locale in locales}}
+        self.limit = limit
+        self.min_similarity = min_similarity
+        self.cache_size = cache_size
+        self.scan_threshold = scan_threshold
+        self._choices = {}  # value -> (weight, ApplicationCommandOptionChoice)
+        self._ranked = []  # (-weight, sequence, value) sorted
+        self._rank_keys = {}  # value -> its key in _ranked
+        self._sequence = 0
+        self._cache = {}
+
+    def __len__(self):
+        return len(self._choices)
+
+    def __contains__(self, value):
+        return value in self._choices
+
+    def _store(self, name, value, name_localizations, weight):
+        """
+        Records the choice and rank key of a new entry, returns its names by locale.
+        """
+        name_localizations = {Locales(locale): localized for locale, localized in (name_localizations or {}).items()}
+        self._choices[value] = (weight, ApplicationCommandOptionChoice(name=name, name_localizations=name_localizations, value=value))
+        self._sequence += 1
+        self._rank_keys[value] = (-weight, self._sequence, value)
+        return {locale: name_localizations.get(locale, name) for locale in self.locales}
+
+    def add(self, name, value, name_localizations=None, weight=0):
+        """
+        Adds an entry or replaces the entry with the same value.
+        """
+        if(value in self._choices):
+            self.remove(value)
+        names = self._store(name, value, name_localizations, weight)
+        bisect.insort(self._ranked, self._rank_keys[value])
+        for locale, index in self.locales.items():
+            index.add(value, names[locale])
+        self._cache.clear()
+
+    def update(self, entries):
+        """
+        Adds an iterable of (name, value) or (name, value, name_localizations, weight) tuples, replacing the entries
+        with the same values. The indexes are sorted once for the whole batch, so bulk loads cost O(n log n).
+        """
+        batch = {}
+        for entry in entries:
+            name, value, name_localizations, weight = _entry(*entry)
+            #A value repeated in the batch keeps its last entry, ranked as if it had been added last.
+            batch.pop(value, None)
+            batch[value] = (name, name_localizations, weight)
+        if(not batch):
+            return
+        replaced = {value for value in batch if value in self._choices}
+        if(replaced):
+            for value in replaced:
+                del self._choices[value]
+                del self._rank_keys[value]
+            self._ranked = [key for key in self._ranked if key[2] not in replaced]
+            for index in self.locales.values():
+                index.remove_many(replaced)
+
+        names = {
+            value: self._store(name, value, name_localizations, weight)
+            for value, (name, name_localizations, weight) in batch.items()
+        }
+        self._ranked.extend(self._rank_keys[value] for value in batch)
+        self._ranked.sort()
+        for locale, index in self.locales.items():
+            index.extend((value, localized[locale]) for value, localized in names.items())
+        self._cache.clear()
+
+    def remove(self, value):
+        del self._choices[value]
+        del self._ranked[bisect.bisect_left(self._ranked, self._rank_keys.pop(value))]
+        for index in self.locales.values():
+            index.remove(value)
+        self._cache.clear()
+
+    def search(self, query, locale=None):
+        """
+        Returns up to limit ApplicationCommandOptionChoice for the text typed in the focused option.
+        """
+        if(locale not in self.locales):
+            locale = self.default_locale
+        index = self.locales[locale]
+        folded = fold(str(query)).strip()
+        key = (locale, folded)
+        cached = self._cache.get(key)
+        if(cached is not None):
+            return cached
+
+        choices = self._choices
+        keys, low, high = index.prefix(folded)
+        if(high - low <= self.limit):
+            matches = [key[-1] for key in keys[low:high]]
+            matches.sort(key=lambda value: -choices[value][0])
+        elif(high - low > self.scan_threshold):
+            names = index.names
+            matches = []
+            for _, _, value in self._ranked:
+                if(names[value].startswith(folded)):
+                    matches.append(value)
+                    if(len(matches) == self.limit):
+                        break
+        else:
+            matches = [key[-1] for key in heapq.nlargest(self.limit, keys[low:high], key=lambda key: choices[key[-1]][0])]
+
+        if(len(matches) < self.limit and len(folded) >= 2):
+            prefixed = set(matches)
+            similar = index.fuzzy(folded, self.min_similarity)
+            ranked = heapq.nlargest(
+                self.limit - len(matches),
+                (value for value in similar if value not in prefixed),
+                key=lambda value: (similar[value], choices[value][0]),
+            )
+            matches.extend(ranked)
+
+        result = [choices[value][1] for value in matches]
+        if(len(self._cache) >= self.cache_size):
+            self._cache.clear()
+        self._cache[key] = result
+        return result
+
+    def respond(self, query, locale=None):
+        """
+        InteractionResponse answering an autocomplete interaction with the choices for query.
+        """
+        return InteractionResponse(
+            type=InteractionCallbackTypes.APPLICATION_COMMAND_AUTOCOMPLETE_RESULT,
+            data=InteractionCallbackData(choices=self.search(query, locale)),
+        )
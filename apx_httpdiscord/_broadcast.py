@@ -0,0 +1,102 @@
+"""
+Fan-out of one message to many channel webhooks.
+"""
+
+import asyncio
+
+from ._datamodels import HttpMethods, Channel, JSONErrorCodes
+from ._errors import ApxHttpDiscordError, HTTPException
+from ._retry import RETRYABLE_ERRORS
+
+class DeliveryFailure():
+    """
+    A webhook the message could not be delivered to, removed is set when the webhook was dropped from the broadcaster.
+    """
+
+    __slots__ = ("webhook", "error", "removed")
+
+    def __init__(self, webhook, error, removed=False):
+        self.webhook = webhook
+        self.error = error
+        self.removed = removed
+
+    def __repr__(self):
+        return f"DeliveryFailure(webhook={self.webhook.id}, error={self.error!r}, removed={self.removed})"
+
+class WebhookBroadcaster():
+    """
+    Executes the same Channel.ExecuteWebhookJSONParams on every webhook(a Webhook or any object with id and token)
+    with up to concurrency requests in flight. The payload is encoded once, the encoded body is reused for every target.
+    Every request waits for the bucket of its webhook and the global limit through the rate limiter of support.
+    Webhooks answering Unknown Webhook(JSONErrorCodes.UNKNOWN_WEBHOOK) are dropped from webhooks.
+    """
+
+    def __init__(self, support, webhooks=(), concurrency=256):
+        self.support = support
+        self.webhooks = {webhook.id: webhook for webhook in webhooks}
+        self.concurrency = concurrency
+        self.delivered = 0
+        self.failed = 0
+        self.removed = []
+
+    def add(self, webhook):
+        self.webhooks[webhook.id] = webhook
+
+    def discard(self, webhook_id):
+        return self.webhooks.pop(webhook_id, None)
+
+    async def broadcast(self, payload, query_params=None):
+        """
+        Async generator sending payload to every webhook and yielding a DeliveryFailure per failed target as it happens.
+        The delivered and failed counters hold the totals of the broadcast once the generator is exhausted.
+        """
+        body, _ = self.support.encode_payload(payload)
+        targets = iter(list(self.webhooks.values()))
+        failures = asyncio.Queue()
+        self.delivered = self.failed = 0
+
+        async def worker():
+            for webhook in targets:
+                failure = await self._deliver(webhook, body, query_params)
+                if(failure is None):
+                    self.delivered += 1
+                else:
+                    self.failed += 1
+                    failures.put_nowait(failure)
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(min(self.concurrency, len(self.webhooks)) or 1)]
+        done = asyncio.gather(*workers)
+        done.add_done_callback(lambda _: failures.put_nowait(None))
+        try:
+            while((failure := await failures.get()) is not None):
+                yield failure
+            await done
+        finally:
+            #A failed worker completes done while the others are still sending, stop them as well.
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(done, *workers, return_exceptions=True)
+
+    async def _deliver(self, webhook, body, query_params):
+        if(webhook.token is None):
+            return DeliveryFailure(webhook, ValueError("webhook has no token"))
+        try:
+            await self.support.send(
+                Channel.WebhookUrls.EXECUTE_WEBHOOK, HttpMethods.POST, {"webhook": webhook},
+                query_params=query_params, payload=body,
+            )
+        except HTTPException as error:
+            if(error.code == JSONErrorCodes.UNKNOWN_WEBHOOK):
+                self.discard(webhook.id)
+                self.removed.append(webhook)
+                return DeliveryFailure(webhook, error, removed=True)
+            return DeliveryFailure(webhook, error)
+        except (ApxHttpDiscordError, *RETRYABLE_ERRORS) as error:
+            return DeliveryFailure(webhook, error)
+        return None
+
+    async def run(self, payload, query_params=None):
+        """
+        Broadcasts payload and returns the list of DeliveryFailure.
+        """
+        return [failure async for failure in self.broadcast(payload, query_params)]
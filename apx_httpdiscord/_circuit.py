@@ -0,0 +1,117 @@
+"""
+Circuit breakers of the rate limit buckets, failing requests fast while the endpoints of a bucket are down.
+"""
+
+import time
+
+from ._errors import CircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+class _Circuit():
+
+    __slots__ = ("state", "failures", "opened_until", "cooldown", "probes", "successes", "opened")
+
+    def __init__(self, cooldown):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_until = 0.0
+        self.cooldown = cooldown
+        self.probes = 0
+        self.successes = 0
+        self.opened = 0
+
+class CircuitBreaker():
+    """
+    One circuit per rate limit bucket, so a failing endpoint does not stop the other buckets.
+    A circuit opens after failure_threshold consecutive failures(5xx responses, timeouts and connection errors), then
+    requests to the bucket raise CircuitOpenError without being sent for cooldown seconds. After the cooldown the circuit
+    is half open: half_open_probes requests at a time are sent as probes, half_open_successes successful probes close
+    the circuit and a failed probe opens it again for twice the previous cooldown, at most max_cooldown.
+    Only failing buckets are tracked, a success on a closed circuit forgets it.
+    """
+
+    def __init__(self, failure_threshold=5, cooldown=10.0, max_cooldown=120.0, half_open_probes=1, half_open_successes=1):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.half_open_probes = half_open_probes
+        self.half_open_successes = half_open_successes
+        self.rejected = 0
+        self.circuits = {}
+
+    def before(self, key):
+        """
+        Called before sending a request of the bucket key, raises CircuitOpenError when the circuit is open.
+        Returns whether the request is a probe of a half open circuit, to pass to after.
+        """
+        circuit = self.circuits.get(key)
+        if(circuit is None or circuit.state == CLOSED):
+            return False
+        now = time.monotonic()
+        if(circuit.state == OPEN):
+            if(circuit.opened_until > now):
+                self.rejected += 1
+                raise CircuitOpenError(key, circuit.opened_until - now)
+            circuit.state = HALF_OPEN
+            circuit.successes = 0
+        if(circuit.probes >= self.half_open_probes):
+            self.rejected += 1
+            raise CircuitOpenError(key, 0.0)
+        circuit.probes += 1
+        return True
+
+    def after(self, key, probe, failed):
+        """
+        Records the outcome of a request of the bucket key: failed is True for a failure, False for a success and
+        None when the request ended without telling about the endpoint(e.g it was cancelled).
+        """
+        circuit = self.circuits.get(key)
+        if(circuit is None):
+            if(failed):
+                circuit = self.circuits[key] = _Circuit(self.cooldown)
+            else:
+                return
+        if(probe):
+            circuit.probes -= 1
+
+        if(failed is None):
+            return
+        if(not failed):
+            if(circuit.state == CLOSED):
+                del self.circuits[key]
+            elif(probe):
+                circuit.successes += 1
+                if(circuit.successes >= self.half_open_successes):
+                    del self.circuits[key]
+            return
+
+        if(circuit.state == HALF_OPEN and probe):
+            self._open(circuit, min(self.max_cooldown, circuit.cooldown * 2))
+        elif(circuit.state == CLOSED):
+            circuit.failures += 1
+            if(circuit.failures >= self.failure_threshold):
+                self._open(circuit, self.cooldown)
+
+    @staticmethod
+    def _open(circuit, cooldown):
+        circuit.state = OPEN
+        circuit.cooldown = cooldown
+        circuit.opened_until = time.monotonic() + cooldown
+        circuit.opened += 1
+
+    def snapshot(self):
+        """
+        Pull API: one dict per tracked bucket with the state of its circuit.
+        """
+        now = time.monotonic()
+        return [
+            {
+                "bucket": key[0], "major": key[1], "state": circuit.state, "failures": circuit.failures,
+                "retry_after": max(circuit.opened_until - now, 0.0) if circuit.state == OPEN else 0.0,
+                "cooldown": circuit.cooldown, "probes": circuit.probes, "opened": circuit.opened,
+            }
+            for key, circuit in self.circuits.items()
+        ]
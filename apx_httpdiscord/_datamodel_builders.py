@@ -0,0 +1,205 @@
+from ._datamodels import Embed, EmbedField, EmbedFooter, EmbedAuthor
+from ._errors import EmbedLimitError
+
+#Embed limits-
+EMBED_TITLE_LIMIT = 256
+EMBED_DESCRIPTION_LIMIT = 4096
+EMBED_FIELDS_LIMIT = 25
+EMBED_FIELD_NAME_LIMIT = 256
+EMBED_FIELD_VALUE_LIMIT = 1024
+EMBED_FOOTER_TEXT_LIMIT = 2048
+EMBED_AUTHOR_NAME_LIMIT = 256
+EMBEDS_TOTAL_LIMIT = 6000  # sum of titles, descriptions, field names and values, footer texts and author names of a message
+MESSAGE_EMBEDS_LIMIT = 10
+MESSAGE_CONTENT_LIMIT = 2000
+
+def _split_point(text, capacity):
+    """
+    Returns where to cut text so the first part fits capacity, after the last line break that fits or 0 when none does.
+    """
+    if(len(text) <= capacity):
+        return len(text)
+    return text.rfind("\n", 0, capacity) + 1
+
+class _EmbedState():
+    """
+    Content of one embed being built, with the running total of its text length.
+    """
+
+    def __init__(self, message, color=None):
+        self.message = message
+        self.title = None
+        self.url = None
+        self.color = color
+        self.description_parts = []
+        self.description_length = 0
+        self.fields = []
+        self.footer = None
+        self.author = None
+        self.length = 0
+
+    def build(self):
+        return Embed(
+            title=self.title,
+            url=self.url,
+            color=self.color,
+            description="".join(self.description_parts) if self.description_parts else None,
+            fields=self.fields,
+            footer=self.footer,
+            author=self.author,
+        )
+
+class EmbedBuilder():
+    """
+    Builds embeds incrementally while keeping running totals of the text lengths, so checking the 6000 characters
+    and 25 fields limits costs O(1) per append instead of re-serializing the embeds.
+    Content overflowing an embed continues in a new embed of the same message(up to 10 embeds per message), and content
+    overflowing the 6000 characters of a message continues in the embeds of a new message.
+    The title and author stay on the first embed and the footer moves to the last embed.
+    """
+
+    def __init__(self, title=None, description=None, url=None, color=None, max_messages=None):
+        self.max_messages = max_messages
+        self.color = color
+        self._embeds = [_EmbedState(0, color)]
+        self._message_lengths = [0]
+        self._message_sizes = [1]  # embeds per message
+        if(title is not None):
+            self.set_title(title, url)
+        if(description is not None):
+            self.append_description(description)
+
+    @property
+    def current(self):
+        return self._embeds[-1]
+
+    @property
+    def embed_count(self):
+        return len(self._embeds)
+
+    @property
+    def message_count(self):
+        return len(self._message_lengths)
+
+    @property
+    def length(self):
+        """
+        Text length of the embeds of the current message, discord rejects messages above 6000.
+        """
+        return self._message_lengths[-1]
+
+    def _grow(self, state, length):
+        state.length += length
+        self._message_lengths[state.message] += length
+
+    def _new_embed(self, new_message=False):
+        previous = self.current
+        message = previous.message
+        if(new_message or self._message_sizes[message] >= MESSAGE_EMBEDS_LIMIT):
+            if(self.max_messages is not None and len(self._message_lengths) >= self.max_messages):
+                raise EmbedLimitError(f"content does not fit in {self.max_messages} messages")
+            message += 1
+            self._message_lengths.append(0)
+            self._message_sizes.append(0)
+        state = _EmbedState(message, self.color)
+        self._message_sizes[message] += 1
+        self._embeds.append(state)
+        if(previous.footer is not None):
+            footer = previous.footer
+            self._grow(previous, -len(footer.text))
+            previous.footer = None
+            state.footer = footer
+            self._grow(state, len(footer.text))
+        return state
+
+    def _reserve(self, length):
+        """
+        Returns the embed whose message has room for length more characters, opening a new message if needed.
+        """
+        state = self.current
+        if(self._message_lengths[state.message] + length > EMBEDS_TOTAL_LIMIT):
+            state = self._new_embed(new_message=True)
+            if(self._message_lengths[state.message] + length > EMBEDS_TOTAL_LIMIT):
+                raise EmbedLimitError(f"{length} characters cannot fit in a single message")
+        return state
+
+    def _set_header(self, attribute, value, length):
+        state = self._embeds[0]
+        current = getattr(state, attribute)
+        previous_length = 0 if current is None else len(current if isinstance(current, str) else current.name)
+        if(self._message_lengths[0] - previous_length + length > EMBEDS_TOTAL_LIMIT):
+            raise EmbedLimitError(f"embed {attribute} does not fit the first message")
+        setattr(state, attribute, value)
+        self._grow(state, length - previous_length)
+
+    def set_title(self, title, url=None):
+        if(len(title) > EMBED_TITLE_LIMIT):
+            raise EmbedLimitError(f"embed title exceeds {EMBED_TITLE_LIMIT} characters")
+        self._set_header("title", title, len(title))
+        self._embeds[0].url = url
+        return self
+
+    def set_author(self, name, url=None, icon_url=None):
+        if(len(name) > EMBED_AUTHOR_NAME_LIMIT):
+            raise EmbedLimitError(f"embed author name exceeds {EMBED_AUTHOR_NAME_LIMIT} characters")
+        self._set_header("author", EmbedAuthor(name=name, url=url, icon_url=icon_url), len(name))
+        return self
+
+    def set_footer(self, text, icon_url=None):
+        if(len(text) > EMBED_FOOTER_TEXT_LIMIT):
+            raise EmbedLimitError(f"embed footer text exceeds {EMBED_FOOTER_TEXT_LIMIT} characters")
+        state = self.current
+        if(state.footer is not None):
+            self._grow(state, -len(state.footer.text))
+            state.footer = None
+        state = self._reserve(len(text))
+        state.footer = EmbedFooter(text=text, icon_url=icon_url)
+        self._grow(state, len(text))
+        return self
+
+    def append_description(self, text):
+        """
+        Appends text to the description, continuing in new embeds when the description or total limit is reached.
+        Text is split on line breaks, a line which does not fit moves whole to the next embed and only lines longer
+        than an embed can hold are cut.
+        """
+        while(text):
+            state = self.current
+            message_capacity = EMBEDS_TOTAL_LIMIT - self._message_lengths[state.message]
+            capacity = min(EMBED_DESCRIPTION_LIMIT - state.description_length, message_capacity)
+            cut = 0 if state.fields else _split_point(text, max(capacity, 0))
+            if(cut == 0):
+                line = text.find("\n") + 1 or len(text)
+                new_message = message_capacity < min(line, EMBED_DESCRIPTION_LIMIT)
+                #The description is rendered above the fields and a line which does not fit moves whole, so the text
+                #continues in a new embed unless this one is as empty as a new one would be.
+                if(state.fields or state.description_length or (new_message and self._message_lengths[state.message] > state.length)):
+                    self._new_embed(new_message=new_message)
+                    continue
+                cut = capacity
+            state.description_parts.append(text[:cut])
+            state.description_length += cut
+            self._grow(state, cut)
+            text = text[cut:]
+        return self
+
+    def add_field(self, name, value, inline=None):
+        if(len(name) > EMBED_FIELD_NAME_LIMIT):
+            raise EmbedLimitError(f"embed field name exceeds {EMBED_FIELD_NAME_LIMIT} characters")
+        if(len(value) > EMBED_FIELD_VALUE_LIMIT):
+            raise EmbedLimitError(f"embed field value exceeds {EMBED_FIELD_VALUE_LIMIT} characters")
+        if(len(self.current.fields) >= EMBED_FIELDS_LIMIT):
+            self._new_embed()
+        state = self._reserve(len(name) + len(value))
+        state.fields.append(EmbedField(name=name, value=value, inline=inline))
+        self._grow(state, len(name) + len(value))
+        return self
+
+    def build(self):
+        """
+        Returns one list of Embed objects per message, each ready for the embeds field of a message payload.
+        """
+        messages = [[] for _ in self._message_lengths]
+        for state in self._embeds:
+            messages[state.message].append(state.build())
+        return messages
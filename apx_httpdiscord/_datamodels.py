@@ -1,8 +1,3 @@
-import msgspec
-from typing import Any, ClassVar
-from datetime import datetime
-import enum
-
 """
 Please refer to the discord documentation at: https://discord.com/developers/docs/intro, for more details on the classes.
 The documentation in this package aims to be minimal due to the high probability of changing discord documentation on the official site.
@@ -26,10 +21,17 @@ class SetActivityArgument(msgspec.Struct, kw_only=True):
     activity: 'Activity'  # rich presence to assign to the user (limited to Playing, Listening, Watching, or Competing).
 
 """
+
+import msgspec
+from typing import Any, ClassVar
+from datetime import datetime
+import enum
+
 #Auxillary classes for msgspec classes
 class HttpMethods(enum.StrEnum):
     GET = "GET"
     POST = "POST"
+    PUT = "PUT"
     PATCH = "PATCH"
     DELETE = "DELETE"
 
@@ -134,7 +136,7 @@ class Interaction(msgspec.Struct, kw_only=True):
         content: str | None = None
         embeds: list["Embed"] | None = None
         flags: int | None = None  # class MessageFlags
-        allowed_mentions: "AllowedMentions" | None = None
+        allowed_mentions: "AllowedMentions | None" = None
         components: list["Component"] | None = None
         file_locations: list[str] | None = None
         attachments: list["Attachment"] | None = None
@@ -145,7 +147,7 @@ class Interaction(msgspec.Struct, kw_only=True):
         """
         content: str | None = None  # Max 2000 characters
         embeds: list["Embed"] | None = None  # Up to 10 embeds
-        allowed_mentions: "AllowedMentions" | None = None
+        allowed_mentions: "AllowedMentions | None" = None
         components: list["Component"] | None = None  # Requires IS_COMPONENTS_V2 flag
         attachments: list["Attachment"] | None = None
         file_locations: list[str] | None = None
@@ -155,7 +157,7 @@ class Interaction(msgspec.Struct, kw_only=True):
     class EditFollowupMessageJSONParams(msgspec.Struct, omit_defaults=True):
         content: str | None = None  # Max 2000 characters
         embeds: list["Embed"] | None = None  # Up to 10 embeds
-        allowed_mentions: "AllowedMentions" | None = None
+        allowed_mentions: "AllowedMentions | None" = None
         components: list["Component"] | None = None  # Requires IS_COMPONENTS_V2 flag
         attachments: list["Attachment"] | None = None
         file_locations: list[str] | None = None
@@ -172,7 +174,7 @@ class Interaction(msgspec.Struct, kw_only=True):
                     cls.InteractionUrls.CREATE_INTERACTION_RESPONSE : {
                         HttpMethods.POST : {
                             "url_params" :  ("interaction"),
-                            "query_params": CreateInteractionResponseQueryStringParams,
+                            "query_params": cls.CreateInteractionResponseQueryStringParams,
                             "payload" : InteractionResponse,
                             "additional_properties": {},
                             "statuscode_returntype_map" : {
@@ -183,29 +185,27 @@ class Interaction(msgspec.Struct, kw_only=True):
                     },
                     #SAME AS GET_WEBHOOK_MESSAGE
                     cls.InteractionUrls.GET_ORIGINAL_INTERACTION_RESPONSE : {
+                        #GET_ORIGINAL_INTERACTION_RESPONSE
                         HttpMethods.GET : {
                             "url_params" :  ("application", "interaction"),
-                            "query_params": GetOriginalInteractionResponseQueryStringParams,
+                            "query_params": cls.GetOriginalInteractionResponseQueryStringParams,
                             "payload" : None, 
                             "additional_properties": {},
                             "statuscode_returntype_map" : {
                                     200 : Message,
                                 }
-                            }
-                    },
-                    #SAME AS EDIT_WEBHOOK_MESSAGE
-                    cls.InteractionUrls.EDIT_ORIGINAL_INTERACTION_RESPONSE : {
+                            },
+                        #EDIT_ORIGINAL_INTERACTION_RESPONSE, SAME AS EDIT_WEBHOOK_MESSAGE
                         HttpMethods.PATCH : {
                             "url_params" :  ("application", "interaction"),
-                            "query_params": EditOriginalInteractionResponseQueryStringParams,
-                            "payload" : EditOriginalInteractionResponseJSONParams, 
+                            "query_params": cls.EditOriginalInteractionResponseQueryStringParams,
+                            "payload" : cls.EditOriginalInteractionResponseJSONParams, 
                             "additional_properties": {},
                             "statuscode_returntype_map" : {
                                     200 : Message,
                                 }
-                            }
-                    },
-                    cls.InteractionUrls.DELETE_ORIGINAL_INTERACTION_RESPONSE : {
+                            },
+                        #DELETE_ORIGINAL_INTERACTION_RESPONSE
                         HttpMethods.DELETE : {
                             "url_params" :  ("application", "interaction"),
                             "query_params": None,
@@ -220,8 +220,8 @@ class Interaction(msgspec.Struct, kw_only=True):
                     cls.InteractionUrls.CREATE_FOLLOWUP_MESSAGE : {
                         HttpMethods.POST : {
                             "url_params" :  ("application", "interaction"),
-                            "query_params": CreateFollowupMessageQueryStringParams,
-                            "payload" : CreateFollowupMessageJSONParams,
+                            "query_params": cls.CreateFollowupMessageQueryStringParams,
+                            "payload" : cls.CreateFollowupMessageJSONParams,
                             "additional_properties": {},
                             "statuscode_returntype_map" : {
                                     200 : Message,
@@ -231,29 +231,27 @@ class Interaction(msgspec.Struct, kw_only=True):
                     },
                     #SAME AS GET_WEBHOOK_MESSAGE
                     cls.InteractionUrls.GET_FOLLOWUP_MESSAGE : {
+                        #GET_FOLLOWUP_MESSAGE
                         HttpMethods.GET : {
                             "url_params" :  ("application", "interaction", "message"),
-                            "query_params": GetFollowupMessageQueryStringParams,
+                            "query_params": cls.GetFollowupMessageQueryStringParams,
                             "payload" : None,
                             "additional_properties": {},
                             "statuscode_returntype_map" : {
                                     200 : Message,
                                 }
-                            }
-                    },
-                    #SAME AS EDIT_WEBHOOK_MESSAGE
-                    cls.InteractionUrls.EDIT_FOLLOWUP_MESSAGE : {
+                            },
+                        #EDIT_FOLLOWUP_MESSAGE, SAME AS EDIT_WEBHOOK_MESSAGE
                         HttpMethods.PATCH : {
                             "url_params" :  ("application", "interaction", "message"),
-                            "query_params": EditFollowupMessageQueryStringParams,
-                            "payload" : EditFollowupMessageJSONParams,
+                            "query_params": cls.EditFollowupMessageQueryStringParams,
+                            "payload" : cls.EditFollowupMessageJSONParams,
                             "additional_properties": {},
                             "statuscode_returntype_map" : {
                                     200 : Message,
                                 }
-                            }
-                    },
-                    cls.InteractionUrls.DELETE_FOLLOWUP_MESSAGE : {
+                            },
+                        #DELETE_FOLLOWUP_MESSAGE
                         HttpMethods.DELETE : {
                             "url_params" :  ("application", "interaction", "message"),
                             "query_params": None,
@@ -279,22 +277,22 @@ class Interaction(msgspec.Struct, kw_only=True):
     id: str
     application_id: str
     type: 'InteractionTypes'
-    data: 'InteractionData' | None = None 
-    guild: 'Guild' | None = None
+    data: 'InteractionData | None' = None 
+    guild: 'InteractionGuild | None' = None
     guild_id: str | None = None
-    channel: 'Channel' | None = None
+    channel: 'Channel | None' = None
     channel_id: str | None = None
-    member: 'GuildMember' | None = None 
-    user: 'User' | None = None 
+    member: 'GuildMember | None' = None 
+    user: 'User | None' = None 
     token: str
     version: int
-    message: 'Message' | None = None
+    message: 'Message | None' = None
     app_permissions: str
-    locale: 'Locales' | None = None  #client's discord language
+    locale: 'Locales | None' = None  #client's discord language
     guild_locale: str | None = None  #default language for guild server
     entitlements: list['Entitlement'] = msgspec.field(default_factory=list)
-    authorizing_integration_owners: dict['ApplicationIntegrationTypes', int]
-    context: 'InteractionContextTypes' | None = None 
+    authorizing_integration_owners: dict['ApplicationIntegrationTypes', str]
+    context: 'InteractionContextTypes | None' = None 
     attachment_size_limit: int
 
 class InteractionData(msgspec.Struct, kw_only=True):
@@ -305,18 +303,26 @@ class InteractionData(msgspec.Struct, kw_only=True):
     # Application Command Interaction fields
     id : str | None = None
     name : str | None = None
-    type : 'CommandTypes' | None = None
-    resolved : 'Resolved' | None = None
+    type : 'ApplicationCommandTypes | None' = None
+    resolved : 'Resolved | None' = None
     options : list['AppCommandIntOption'] = msgspec.field(default_factory=list)
     guild_id : str | None = None
     target_id : str | None = None
     # Message Component fields
     custom_id: str | None = None             # custom_id of component or modal
-    component_type: 'ComponentTypes' | None = None        # Type of the component (e.g., button, select)
+    component_type: 'ComponentTypes | None' = None        # Type of the component (e.g., button, select)
     values: list[str] = msgspec.field(default_factory=list)          # Values selected (select menus only)
     # Modal Submit fields
     components: list['InteractionData'] = msgspec.field(default_factory=list)     # Submitted components in modal (input values)
 
+class InteractionGuild(msgspec.Struct, kw_only=True):
+    """
+    Interaction Guild is the partial guild sent with interactions invoked from a guild.
+    """
+    id : str
+    locale : 'Locales | None' = None
+    features : list[str] = msgspec.field(default_factory=list)
+
 class Resolved(msgspec.Struct, kw_only=True):
     """
     Resolved objects are included in fields when user, member, role, channel or messages are selected in either application commands or component interactions.
@@ -338,7 +344,7 @@ class AppCommandIntOption(msgspec.Struct, kw_only=True):
     name : str
     type : 'AppCommandOptionTypes'
     value : str | int | float | bool | None = None
-    options : list['AppCommandOption'] = msgspec.field(default_factory=list)
+    options : list['AppCommandIntOption'] = msgspec.field(default_factory=list)
     focused : bool | None = None
 
 class MessageInteraction(msgspec.Struct, kw_only=True):
@@ -349,11 +355,11 @@ class MessageInteraction(msgspec.Struct, kw_only=True):
     type : 'InteractionTypes'
     name : str
     user : 'User'
-    member : 'GuildMember' | None = None
+    member : 'GuildMember | None' = None
 
 class InteractionResponse(msgspec.Struct, kw_only=True):
     type: 'InteractionCallbackTypes'
-    data: 'InteractionCallbackData' | None = None
+    data: 'InteractionCallbackData | None' = None
 
 class InteractionCallbackData(msgspec.Struct, kw_only=True, omit_defaults=True):
     """Unified structure for message, autocomplete, and modal interaction callbacks"""
@@ -362,11 +368,11 @@ class InteractionCallbackData(msgspec.Struct, kw_only=True, omit_defaults=True):
     tts: bool | None = None
     content: str | None = None
     embeds: list['Embed'] = msgspec.field(default_factory=list)
-    allowed_mentions: 'AllowedMentions' | None = None
+    allowed_mentions: 'AllowedMentions | None' = None
     flags: int | None = None
     components: list['Component'] = msgspec.field(default_factory=list)
     attachments: list['Attachment'] = msgspec.field(default_factory=list)
-    poll: 'PollCreateRequest' | None = None
+    poll: 'PollCreateRequest | None' = None
 
     # Autocomplete fields
     choices: list['ApplicationCommandOptionChoice'] = msgspec.field(default_factory=list)  # max 25
@@ -380,12 +386,12 @@ class InteractionCallbackResponse(msgspec.Struct, kw_only=True, omit_defaults=Tr
     Discord will bundle the original interaction object plus the resource that was created.
     """
     interaction: 'InteractionCallback'
-    resource: 'InteractionResource' | None = None
+    resource: 'InteractionCallbackResource | None' = None
 
 class InteractionCallbackResource(msgspec.Struct, kw_only=True, omit_defaults=True):
     type: 'InteractionCallbackTypes'
-    activity_instance: 'InteractionActivityInstanceResource' | None = None
-    message: 'Message' | None = None
+    activity_instance: 'InteractionActivityInstanceResource | None' = None
+    message: 'Message | None' = None
 
 class InteractionCallback(msgspec.Struct, kw_only=True, omit_defaults=True):
     id: str  # snowflake as string
@@ -445,7 +451,7 @@ class ApplicationCommandPermissionTypes(enum.IntEnum):
 class ApplicationCommand(msgspec.Struct, kw_only=True, omit_defaults=True):
 
     id: str | None = None  # snowflake
-    type: 'ApplicationCommandTypes' | None = None  # one of command types, defaults to 1 CHAT_INPUT
+    type: 'ApplicationCommandTypes | None' = None  # one of command types, defaults to 1 CHAT_INPUT
     application_id: str | None = None  # snowflake
     guild_id: str | None = None
     name: str | None = None
@@ -460,7 +466,7 @@ class ApplicationCommand(msgspec.Struct, kw_only=True, omit_defaults=True):
     integration_types: list['ApplicationIntegrationTypes'] = msgspec.field(default_factory=list)  # list of integration types
     contexts: list['InteractionContextTypes'] = msgspec.field(default_factory=list)  # list of interaction context types
     version: str | None = None  # snowflake
-    handler: 'EntryPointCommandHandlerType' | None = None  # one of command handler types
+    handler: 'EntryPointCommandHandlerType | None' = None  # one of command handler types
 
     # Fields which depend on with_localizations query string param for Get GLobal Application Commands endpoint
     name_localized : str | None = None
@@ -482,12 +488,12 @@ class ApplicationCommandOption(msgspec.Struct, kw_only=True):
     max_length: int | None = None
     autocomplete: bool | None = None
 
-class ApplicationCommandOptionChoice(msgspec.Struct, kw_only=True, kw_only=True):
+class ApplicationCommandOptionChoice(msgspec.Struct, kw_only=True):
     name: str
     name_localizations: dict['Locales', str] = msgspec.field(default_factory=dict)
     value: str | int | float
 
-class GuildApplicationCommandPermissions(msgspec.Struct, kw_only=True, kw_only=True):
+class GuildApplicationCommandPermissions(msgspec.Struct, kw_only=True):
     """
     Returned when fetching the permissions for an app's command(s) in a guild
     """
@@ -496,7 +502,7 @@ class GuildApplicationCommandPermissions(msgspec.Struct, kw_only=True, kw_only=T
     guild_id: str  # snowflake
     permissions: list["ApplicationCommandPermissions"]
 
-class ApplicationCommandPermissions(msgspec.Struct, kw_only=True, kw_only=True):
+class ApplicationCommandPermissions(msgspec.Struct, kw_only=True):
     """
     Application command permissions allow you to enable or disable commands for specific users, roles, or channels within a guild.
     """
@@ -547,10 +553,10 @@ class Component(msgspec.Struct, kw_only=True):
     #Some components share these fields.
     custom_id : str | None = None
     components : list['Component'] = msgspec.field(default_factory=list)
-    style : 'ButtonStyles' | 'TextInputStyles' | None = None
+    style : int | None = None  # ButtonStyles for buttons, TextInputStyles for text inputs
     label : str | None = None
     content : str | None = None
-    emoji : 'Emoji' | None = None
+    emoji : 'Emoji | None' = None
     sku_id : str | None = None
     url : str | None = None
     disabled : bool | None = None
@@ -565,12 +571,12 @@ class Component(msgspec.Struct, kw_only=True):
     placeholder : str | None = None
     default_values : list['SelectDefaultValue'] = msgspec.field(default_factory=list)
     channel_types : list['ChannelTypes'] = msgspec.field(default_factory=list)
-    accessory : 'Component' | None = None
-    media : 'UnfurledMediaItem' | None = None
+    accessory : 'Component | None' = None
+    media : 'UnfurledMediaItem | None' = None
     description : str | None = None
     spoiler : bool | None = None
     items : list['MediaGalleryItem'] = msgspec.field(default_factory=list)
-    file : 'UnfurledMediaItem' | None = None
+    file : 'UnfurledMediaItem | None' = None
     name : str | None = None
     size : int | None = None
     divider : bool | None = None
@@ -584,7 +590,7 @@ class SelectOption(msgspec.Struct, kw_only=True):
     label : str 
     value : str
     description : str | None = None
-    emoji : 'Emoji' | None = None
+    emoji : 'Emoji | None' = None
     default : bool | None = None
 
 class SelectDefaultValue(msgspec.Struct, kw_only=True):
@@ -657,9 +663,9 @@ class ApplicationEventWebhookStatus(enum.IntEnum):
     ENABLED = 2
     DISABLED_BY_DISCORD = 3
 
-class ApplicationIntegrationTypes(enum.StrEnum):
-    GUILD_INSTALL = "guild_install"
-    USER_INSTALL = "user_install"
+class ApplicationIntegrationTypes(enum.IntEnum):
+    GUILD_INSTALL = 0
+    USER_INSTALL = 1
 
 class Application(msgspec.Struct, kw_only=True):
     """
@@ -698,17 +704,17 @@ class Application(msgspec.Struct, kw_only=True):
             cls.__RELATED_ROUTES = (
                 {
                     cls.ApplicationCommandUrls.GET_GLOBAL_APPLICATION_COMMANDS : {
+                        #GET_GLOBAL_APPLICATION_COMMANDS
                         HttpMethods.GET : {
                             "url_params" :  ("application"),
-                            "query_params": GetGlobalApplicationCommandsQueryStringParams,
+                            "query_params": cls.GetGlobalApplicationCommandsQueryStringParams,
                             "payload" : None,
                             "additional_properties": {},
                             "statuscode_returntype_map" : {
                                     200 : list[ApplicationCommand],
                                 }
-                            }
-                    },
-                    cls.ApplicationCommandUrls.CREATE_GLOBAL_APPLICATION_COMMAND : {
+                            },
+                        #CREATE_GLOBAL_APPLICATION_COMMAND
                         HttpMethods.POST : {
                             "url_params" :  ("application"),
                             "query_params": None,
@@ -718,9 +724,20 @@ class Application(msgspec.Struct, kw_only=True):
                                     200 : ApplicationCommand,
                                     201 : ApplicationCommand
                                 }
+                            },
+                        #BULK_OVERWRITE_GLOBAL_APPLICATION_COMMANDS
+                        HttpMethods.PUT : {
+                            "url_params" :  ("application"),
+                            "query_params": None,
+                            "payload" : list[ApplicationCommand],
+                            "additional_properties": {},
+                            "statuscode_returntype_map" : {
+                                    200 : list[ApplicationCommand],
+                                }
                             }
                     },
                     cls.ApplicationCommandUrls.GET_GLOBAL_APPLICATION_COMMAND : {
+                        #GET_GLOBAL_APPLICATION_COMMAND
                         HttpMethods.GET : {
                             "url_params" :  ("application", "command"),
                             "query_params": None,
@@ -729,9 +746,8 @@ class Application(msgspec.Struct, kw_only=True):
                             "statuscode_returntype_map" : {
                                     200 : ApplicationCommand,
                                 }
-                            }
-                    },
-                    cls.ApplicationCommandUrls.EDIT_GLOBAL_APPLICATION_COMMAND : {
+                            },
+                        #EDIT_GLOBAL_APPLICATION_COMMAND
                         HttpMethods.PATCH : {
                             "url_params" :  ("application", "command"),
                             "query_params": None,
@@ -740,9 +756,8 @@ class Application(msgspec.Struct, kw_only=True):
                             "statuscode_returntype_map" : {
                                     200 : ApplicationCommand,
                                 }
-                            }
-                    },
-                    cls.ApplicationCommandUrls.DELETE_GLOBAL_APPLICATION_COMMAND : {
+                            },
+                        #DELETE_GLOBAL_APPLICATION_COMMAND
                         HttpMethods.DELETE : {
                             "url_params" :  ("application", "command"),
                             "query_params": None,
@@ -753,18 +768,8 @@ class Application(msgspec.Struct, kw_only=True):
                                 }
                             }
                     },
-                    cls.ApplicationCommandUrls.BULK_OVERWRITE_GLOBAL_APPLICATION_COMMANDS : {
-                        HttpMethods.PUT : {
-                            "url_params" :  ("application"),
-                            "query_params": None,
-                            "payload" : list[ApplicationCommand],
-                            "additional_properties": {},
-                            "statuscode_returntype_map" : {
-                                    200 : list[ApplicationCommand],
-                                }
-                            }
-                    },
                     cls.ApplicationRoleConnectionMetadataUrls.GET_APPLICATION_ROLE_CONNECTION_METADATA_RECORDS : {
+                        #GET_APPLICATION_ROLE_CONNECTION_METADATA_RECORDS
                         HttpMethods.GET : {
                             "url_params" : ("application",),
                             "query_params": None,
@@ -773,9 +778,8 @@ class Application(msgspec.Struct, kw_only=True):
                             "statuscode_returntype_map" : {
                                     200 : list[ApplicationRoleConnectionMetadata],
                                 }
-                            }   
-                    },
-                    cls.ApplicationRoleConnectionMetadataUrls.UPDATE_APPLICATION_ROLE_CONNECTION_METADATA_RECORDS : {
+                            },
+                        #UPDATE_APPLICATION_ROLE_CONNECTION_METADATA_RECORDS
                         HttpMethods.PUT : {
                             "url_params" : ("application",),
                             "query_params": None,
@@ -787,6 +791,7 @@ class Application(msgspec.Struct, kw_only=True):
                             }
                     },
                     cls.ApplicationUrls.GET_CURRENT_APPLICATION : {
+                        #GET_CURRENT_APPLICATION
                         HttpMethods.GET : {
                             "url_params" : None,
                             "query_params": None,
@@ -795,9 +800,8 @@ class Application(msgspec.Struct, kw_only=True):
                             "statuscode_returntype_map" : {
                                     200 : Application,
                                 }
-                            }
-                    },
-                    cls.ApplicationUrls.EDIT_CURRENT_APPLICATION : {
+                            },
+                        #EDIT_CURRENT_APPLICATION
                         HttpMethods.PATCH : {
                             "url_params" : None,
                             "query_params": None,
@@ -839,18 +843,18 @@ class Application(msgspec.Struct, kw_only=True):
     rpc_origins : list[str] = msgspec.field(default_factory=list)
     bot_public : bool | None = None
     bot_require_code_grant : bool | None = None
-    bot : 'User' | None = None
+    bot : 'User | None' = None
     terms_of_service_url : str | None = None
     privacy_policy_url : str | None = None
-    owner : 'User' | None = None
+    owner : 'User | None' = None
     verify_key : str | None = None
-    team : 'Team' | None = None
+    team : 'Team | None' = None
     guild_id : str | None = None
-    guild : 'Guild' | None = None
+    guild : 'Guild | None' = None
     primary_sku_id : str | None = None
     slug : str | None = None
     cover_image : str | None = None
-    flags : 'ApplicationFlags' | None = None
+    flags : 'ApplicationFlags | None' = None
     approximate_guild_count : int | None = None
     approximate_user_install_count : int | None = None
     approximate_user_authorization_count : int | None = None
@@ -858,10 +862,10 @@ class Application(msgspec.Struct, kw_only=True):
     interactions_endpoint_url : str | None = None
     role_connections_verification_url : str | None = None
     event_webhooks_url : str | None = None
-    event_webhooks_status : 'ApplicationEventWebhookStatus' | None = None
+    event_webhooks_status : 'ApplicationEventWebhookStatus | None' = None
     event_webhooks_types : list['WebhookEventTypes'] = msgspec.field(default_factory=list)
     tags : list[str] = msgspec.field(default_factory=list)
-    install_params : 'InstallParams' | None = None
+    install_params : 'InstallParams | None' = None
     integration_types_config : dict['ApplicationIntegrationTypes', 'ApplicationIntegrationTypeConfiguration'] = msgspec.field(default_factory=dict)
     custom_install_url : str | None = None
 
@@ -869,7 +873,7 @@ class ApplicationIntegrationTypeConfiguration(msgspec.Struct, kw_only=True):
     """
     ApplicationIntegrationTypeConfiguration object defines how an application is configured.
     """
-    oauth2_install_params : 'InstallParams' | None = None
+    oauth2_install_params : 'InstallParams | None' = None
 
 class InstallParams(msgspec.Struct, kw_only=True):
     """
@@ -1024,7 +1028,7 @@ class AuditLogEntry(msgspec.Struct, kw_only=True):
     user_id: str | None = None
     id: str
     action_type: "AuditLogEvents"
-    options: "OptionalAuditEntryInfo" | None = None
+    options: "OptionalAuditEntryInfo | None" = None
     reason: str | None = None
 
 class AuditLogChange(msgspec.Struct, kw_only=True):
@@ -1077,9 +1081,9 @@ class AutoModerationRule(msgspec.Struct, kw_only=True):
     guild_id: str | None = None
     name: str | None = None
     creator_id: str | None = None
-    event_type: 'EventTypes' | None = None
-    trigger_type: 'TriggerTypes' | None = None
-    trigger_metadata: 'TriggerMetadata' | None = None
+    event_type: 'EventTypes | None' = None
+    trigger_type: 'TriggerTypes | None' = None
+    trigger_metadata: 'TriggerMetadata | None' = None
     actions: list['AutoModerationAction'] | None = None
     enabled: bool | None = None
     exempt_roles: list[str] | None = None
@@ -1095,7 +1099,7 @@ class TriggerMetadata(msgspec.Struct, kw_only=True):
 
 class AutoModerationAction(msgspec.Struct, kw_only=True):
     type: 'ActionTypes'                 # The type of action
-    metadata: 'ActionMetadata' | None = None  # Additional metadata needed during execution (optional)
+    metadata: 'ActionMetadata | None' = None  # Additional metadata needed during execution (optional)
 
 class ActionMetadata(msgspec.Struct, kw_only=True):
     channel_id: str | None = None         # For SEND_ALERT_MESSAGE
@@ -1153,7 +1157,7 @@ class Channel(msgspec.Struct, kw_only=True):
         DELETE_WEBHOOK_WITH_TOKEN = GET_WEBHOOK_WITH_TOKEN
         EXECUTE_WEBHOOK = GET_WEBHOOK_WITH_TOKEN #returns Message
 
-        #These URL's do not have routes, they are generated using the APX Discord Support
+        #Compatible webhooks, the url to configure on GitHub or Slack is resolved with DiscordSupport.resolve_url
         EXECUTE_SLACK_COMPATIBLE_WEBHOOK = "/webhooks/{webhook.id}/{webhook.token}/slack"
         EXECUTE_GITHUB_COMPATIBLE_WEBHOOK = "/webhooks/{webhook.id}/{webhook.token}/github"
 
@@ -1170,6 +1174,13 @@ class Channel(msgspec.Struct, kw_only=True):
         thread_id: str | None = None           # snowflake: target thread ID
         with_components: bool | None = None    # whether to respect components in the request
 
+    class ExecuteCompatibleWebhookQueryStringParams(msgspec.Struct, kw_only=True, omit_defaults=True):
+        """
+        Query string parameters for the Execute Slack-Compatible and Execute GitHub-Compatible Webhook endpoints.
+        """
+        thread_id: str | None = None           # snowflake: target thread ID
+        wait: bool | None = None               # waits for server confirmation of message send
+
     class GetWebhookMessageQueryStringParams(msgspec.Struct, kw_only=True, omit_defaults=True):
         """
         Query string parameters for GET /webhooks/{webhook.id}/{token}/messages/{message.id}
@@ -1219,7 +1230,7 @@ class Channel(msgspec.Struct, kw_only=True):
         avatar_url: str | None = None
         tts: bool | None = None
         embeds: list["Embed"] | None = None
-        allowed_mentions: "AllowedMentions" | None = None
+        allowed_mentions: "AllowedMentions | None" = None
         components: list["Component"] | None = None
         file_locations: list[str] | None = None
         attachments: list["Attachment"] | None = None
@@ -1228,17 +1239,17 @@ class Channel(msgspec.Struct, kw_only=True):
         thread_name: str | None = None
         applied_tags: list[str] | None = None # list of snowflakes
         # Special cases
-        poll: "Poll" | None = None
+        poll: "Poll | None" = None
 
     class EditWebhookMessageJSONParams(msgspec.Struct, kw_only=True, omit_defaults=True):
         content: str | None = None
         embeds: list["Embed"] | None = None
         flags: int | None = None  # class MessageFlags
-        allowed_mentions: "AllowedMentions" | None = None
+        allowed_mentions: "AllowedMentions | None" = None
         components: list["Component"] | None = None
         file_locations: list[str] | None = None
         attachments: list["Attachment"] | None = None
-        poll: "Poll" | None = None
+        poll: "Poll | None" = None
 
     __RELATED_ROUTES : ClassVar[tuple] = ()
     
@@ -1248,6 +1259,7 @@ class Channel(msgspec.Struct, kw_only=True):
             cls.__RELATED_ROUTES = (
                 {
                     cls.WebhookUrls.CREATE_WEBHOOK : {
+                        #CREATE_WEBHOOK
                         HttpMethods.POST : {
                             "url_params" : ("channel"),
                             "query_params": None,
@@ -1258,9 +1270,8 @@ class Channel(msgspec.Struct, kw_only=True):
                             "statuscode_returntype_map" : {
                                     200 : Webhook,
                                 }
-                            }
-                    },
-                    cls.WebhookUrls.GET_CHANNEL_WEBHOOKS : {
+                            },
+                        #GET_CHANNEL_WEBHOOKS
                         HttpMethods.GET : {
                             "url_params" : ("channel"),
                             "query_params": None,
@@ -1272,6 +1283,7 @@ class Channel(msgspec.Struct, kw_only=True):
                             }
                     },
                     cls.WebhookUrls.GET_WEBHOOK : {
+                        #GET_WEBHOOK
                         HttpMethods.GET : {
                             "url_params": ("webhook"),
                             "query_params": None,
@@ -1280,33 +1292,44 @@ class Channel(msgspec.Struct, kw_only=True):
                             "statuscode_returntype_map" : {
                                     200 : Webhook,
                                 }
-                            }
-                    },
-                    cls.WebhookUrls.GET_WEBHOOK_WITH_TOKEN : {
-                        HttpMethods.GET : {
+                            },
+                        #MODIFY_WEBHOOK
+                        HttpMethods.PATCH : {
                             "url_params": ("webhook"),
                             "query_params": None,
-                            "payload" : None,
-                            "additional_properties": {},
+                            "payload" : cls.ModifyWebhookJSONParams,
+                            "additional_properties": {
+                                    "X-Audit-Log-Reason": (False, str),
+                                },
                             "statuscode_returntype_map" : {
                                     200 : Webhook,
                                 }
-                            }
-                    },
-                    cls.WebhookUrls.MODIFY_WEBHOOK : {
-                        HttpMethods.PATCH : {
+                            },
+                        #DELETE_WEBHOOK
+                        HttpMethods.DELETE : {
                             "url_params": ("webhook"),
                             "query_params": None,
-                            "payload" : cls.ModifyWebhookJSONParams,
+                            "payload" : None,
                             "additional_properties": {
                                     "X-Audit-Log-Reason": (False, str),
                                 },
                             "statuscode_returntype_map" : {
-                                    200 : Webhook,
+                                    204 : None,
                                 }
                             }
                     },
-                    cls.WebhookUrls.MODIFY_WEBHOOK_WITH_TOKEN : {
+                    cls.WebhookUrls.GET_WEBHOOK_WITH_TOKEN : {
+                        #GET_WEBHOOK_WITH_TOKEN
+                        HttpMethods.GET : {
+                            "url_params": ("webhook"),
+                            "query_params": None,
+                            "payload" : None,
+                            "additional_properties": {},
+                            "statuscode_returntype_map" : {
+                                    200 : Webhook,
+                                }
+                            },
+                        #MODIFY_WEBHOOK_WITH_TOKEN
                         HttpMethods.PATCH : {
                             "url_params": ("webhook"),
                             "query_params": None,
@@ -1317,40 +1340,52 @@ class Channel(msgspec.Struct, kw_only=True):
                             "statuscode_returntype_map" : {
                                     200 : Webhook,
                                 }
-                            }
-                    },
-                    cls.WebhookUrls.DELETE_WEBHOOK : {
-                        HttpMethods.DELETE : {
+                            },
+                        #DELETE_WEBHOOK_WITH_TOKEN
+                        HttpMethods.DELETE: {
                             "url_params": ("webhook"),
                             "query_params": None,
-                            "payload" : None,
+                            "payload": None,
                             "additional_properties": {
                                     "X-Audit-Log-Reason": (False, str),
                                 },
                             "statuscode_returntype_map" : {
                                     204 : None,
                                 }
+                            },
+                        #EXECUTE_WEBHOOK
+                        HttpMethods.POST: {
+                            "url_params": ("webhook"),
+                            "query_params": cls.ExecuteWebhookQueryStringParams,
+                            "payload": cls.ExecuteWebhookJSONParams,
+                            "additional_properties": {},
+                            "statuscode_returntype_map" : {
+                                    200 : Message,
+                                    204 : None,
+                                }
                             }
                     },
-                    cls.WebhookUrls.DELETE_WEBHOOK_WITH_TOKEN: {
-                        HttpMethods.DELETE: {
+                    #The payload of the compatible webhooks is the Slack or GitHub event body, forwarded as is.
+                    cls.WebhookUrls.EXECUTE_SLACK_COMPATIBLE_WEBHOOK: {
+                        HttpMethods.POST: {
                             "url_params": ("webhook"),
-                            "query_params": None,
+                            "query_params": cls.ExecuteCompatibleWebhookQueryStringParams,
                             "payload": None,
-                            "additional_properties": {
-                                    "X-Audit-Log-Reason": (False, str),
-                                },
+                            "additional_properties": {},
                             "statuscode_returntype_map" : {
+                                    200 : Message,
                                     204 : None,
                                 }
                             }
                     },
-                    cls.WebhookUrls.EXECUTE_WEBHOOK: {
+                    cls.WebhookUrls.EXECUTE_GITHUB_COMPATIBLE_WEBHOOK: {
                         HttpMethods.POST: {
                             "url_params": ("webhook"),
-                            "query_params": ExecuteWebhookQueryStringParams,
-                            "payload": ExecuteWebhookJSONParams,
-                            "additional_properties": {},
+                            "query_params": cls.ExecuteCompatibleWebhookQueryStringParams,
+                            "payload": None,
+                            "additional_properties": {
+                                    "X-GitHub-Event": (True, str),
+                                },
                             "statuscode_returntype_map" : {
                                     200 : Message,
                                     204 : None,
@@ -1358,31 +1393,30 @@ class Channel(msgspec.Struct, kw_only=True):
                             }
                     },
                     cls.WebhookUrls.GET_WEBHOOK_MESSAGE: {
+                        #GET_WEBHOOK_MESSAGE
                         HttpMethods.GET: {
                             "url_params": ("webhook", "message"),
-                            "query_params": GetWebhookMessageQueryStringParams,
+                            "query_params": cls.GetWebhookMessageQueryStringParams,
                             "payload": None,
                             "additional_properties": {},
                             "statuscode_returntype_map" : {
                                     200 : Webhook,
                                 }
-                            }
-                    },
-                    cls.WebhookUrls.EDIT_WEBHOOK_MESSAGE: {
+                            },
+                        #EDIT_WEBHOOK_MESSAGE
                         HttpMethods.PATCH: {
                             "url_params": ("webhook", "message"),
-                            "query_params": EditWebhookMessageQueryStringParams,
-                            "payload": EditWebhookMessageJSONParams,
+                            "query_params": cls.EditWebhookMessageQueryStringParams,
+                            "payload": cls.EditWebhookMessageJSONParams,
                             "additional_properties": {},
                             "statuscode_returntype_map" : {
                                     200 : Webhook,
                                 }
-                            }
-                    },
-                    cls.WebhookUrls.DELETE_WEBHOOK_MESSAGE: {
+                            },
+                        #DELETE_WEBHOOK_MESSAGE
                         HttpMethods.DELETE: {
                             "url_params": ("webhook", "message"),
-                            "query_params": DeleteWebhookMessageQueryStringParams,
+                            "query_params": cls.DeleteWebhookMessageQueryStringParams,
                             "payload": None,
                             "additional_properties": {},
                             "statuscode_returntype_map" : {
@@ -1422,21 +1456,21 @@ class Channel(msgspec.Struct, kw_only=True):
     parent_id: str | None = None  # snowflake
     last_pin_timestamp: datetime | None = None
     rtc_region: str | None = None
-    video_quality_mode: int | 'VideoQualityModes' = 1
+    video_quality_mode: 'VideoQualityModes' = VideoQualityModes.AUTO
     message_count: int | None = None
     member_count: int | None = None
-    thread_metadata: 'ThreadMetadata' | None = None
-    member: 'ThreadMember' | None = None
+    thread_metadata: 'ThreadMetadata | None' = None
+    member: 'ThreadMember | None' = None
     default_auto_archive_duration: int | None = None
     permissions: str | None = None
     flags: int | None = None
     total_message_sent: int | None = None
     available_tags: list['ForumTag'] = msgspec.field(default_factory=list)
     applied_tags: list[str] = msgspec.field(default_factory=list)  # snowflake array
-    default_reaction_emoji: 'DefaultReaction' | None = None
+    default_reaction_emoji: 'DefaultReaction | None' = None
     default_thread_rate_limit_per_user: int | None = None
-    default_sort_order: 'SortOrderTypes' | None = None
-    default_forum_layout: 'ForumLayoutTypes' | None = None
+    default_sort_order: 'SortOrderTypes | None' = None
+    default_forum_layout: 'ForumLayoutTypes | None' = None
 
 class FollowedChannel(msgspec.Struct, kw_only=True):
     """
@@ -1473,7 +1507,7 @@ class ThreadMember(msgspec.Struct, kw_only=True):
     user_id : str | None = None
     join_timestamp : datetime
     flags : int
-    member : 'GuildMember' | None = None
+    member : 'GuildMember | None' = None
 
 class DefaultReaction(msgspec.Struct, kw_only=True):
     """
@@ -1501,7 +1535,7 @@ class Emoji(msgspec.Struct, kw_only=True):
     id : str | None = None
     name : str | None = None
     roles : list[str] = msgspec.field(default_factory=list)
-    user : 'User' | None = None
+    user : 'User | None' = None
     require_colons : bool | None = None
     managed : bool | None = None
     animated : bool | None = None
@@ -1590,11 +1624,11 @@ class GuildScheduledEvent(msgspec.Struct, kw_only=True):
     status: 'GuildScheduledEventStatus'                        # event status enum/int
     entity_type: 'GuildScheduledEventEntityTypes'                 # scheduled entity type enum/int
     entity_id: str | None = None       # snowflake, optional
-    entity_metadata: 'GuildScheduledEventEntityMetadata' | None = None  # optional metadata object
-    creator: 'User' | None = None         # optional user object
+    entity_metadata: 'GuildScheduledEventEntityMetadata | None' = None  # optional metadata object
+    creator: 'User | None' = None         # optional user object
     user_count: int | None = None       # optional number of subscribed users
     image: str | None = None            # optional cover image hash
-    recurrence_rule: 'GuildScheduledEventRecurrenceRule' | None = None  # optional recurrence rule
+    recurrence_rule: 'GuildScheduledEventRecurrenceRule | None' = None  # optional recurrence rule
 
 class GuildScheduledEventEntityMetadata(msgspec.Struct, kw_only=True):
     location: str | None = None  # For EXTERNAL events, 1–100 chars
@@ -1618,7 +1652,7 @@ class GuildScheduledEventRecurrenceNWeekday(msgspec.Struct, kw_only=True):
 class GuildScheduledEventUser(msgspec.Struct, kw_only=True):
     guild_scheduled_event_id: str  # snowflake
     user: 'User'
-    member: 'GuildMember' | None = None
+    member: 'GuildMember | None' = None
 
 #Guild template-
 class GuildTemplate(msgspec.Struct, kw_only=True):
@@ -1781,7 +1815,7 @@ class Guild(msgspec.Struct, kw_only=True):
 
     #JSON Params
     class EditApplicationCommandPermissionsJSONParams(msgspec.Struct, omit_defaults=True):
-        permissions: list[ApplicationCommandPermission]
+        permissions: list[ApplicationCommandPermissions]
 
     __RELATED_ROUTES : ClassVar[tuple] = ()
 
@@ -1802,17 +1836,17 @@ class Guild(msgspec.Struct, kw_only=True):
                             }
                     },
                     cls.ApplicationCommandUrls.GET_GUILD_APPLICATION_COMMANDS : {
+                        #GET_GUILD_APPLICATION_COMMANDS
                         HttpMethods.GET : {
                             "url_params" : ("application", "guild"),
-                            "query_params": GetGuildApplicationCommandsQueryStringParams,
+                            "query_params": cls.GetGuildApplicationCommandsQueryStringParams,
                             "payload" : None,
                             "additional_properties": {},
                             "statuscode_returntype_map" : {
                                     200 : list[ApplicationCommand],
                                 }
-                            }
-                    },
-                    cls.ApplicationCommandUrls.CREATE_GUILD_APPLICATION_COMMAND : {
+                            },
+                        #CREATE_GUILD_APPLICATION_COMMAND
                         HttpMethods.POST : {
                             "url_params" : ("application", "guild"),
                             "query_params": None,
@@ -1822,9 +1856,20 @@ class Guild(msgspec.Struct, kw_only=True):
                                     200 : ApplicationCommand,
                                     201 : ApplicationCommand
                                 }
+                            },
+                        #BULK_OVERWRITE_GUILD_APPLICATION_COMMANDS
+                        HttpMethods.PUT : {
+                            "url_params" : ("application", "guild"),
+                            "query_params": None,
+                            "payload" : list[ApplicationCommand],
+                            "additional_properties": {},
+                            "statuscode_returntype_map" : {
+                                    200 : list[ApplicationCommand],
+                                }
                             }
                     },
                     cls.ApplicationCommandUrls.GET_GUILD_APPLICATION_COMMAND : {
+                        #GET_GUILD_APPLICATION_COMMAND
                         HttpMethods.GET : {
                             "url_params" : ("application", "guild", "command"),
                             "query_params": None,
@@ -1833,9 +1878,8 @@ class Guild(msgspec.Struct, kw_only=True):
                             "statuscode_returntype_map" : {
                                     200 : ApplicationCommand,
                                 }
-                            }
-                    },
-                    cls.ApplicationCommandUrls.EDIT_GUILD_APPLICATION_COMMAND : {
+                            },
+                        #EDIT_GUILD_APPLICATION_COMMAND
                         HttpMethods.PATCH : {
                             "url_params" : ("application", "guild", "command"),
                             "query_params": None,
@@ -1844,9 +1888,8 @@ class Guild(msgspec.Struct, kw_only=True):
                             "statuscode_returntype_map" : {
                                     200 : ApplicationCommand,
                                 }
-                            }
-                    },
-                    cls.ApplicationCommandUrls.DELETE_GUILD_APPLICATION_COMMAND : {
+                            },
+                        #DELETE_GUILD_APPLICATION_COMMAND
                         HttpMethods.DELETE : {
                             "url_params" : ("application", "guild", "command"),
                             "query_params": None,
@@ -1857,17 +1900,6 @@ class Guild(msgspec.Struct, kw_only=True):
                                 }
                             }
                     },
-                    cls.ApplicationCommandUrls.BULK_OVERWRITE_GUILD_APPLICATION_COMMANDS : {
-                        HttpMethods.PUT : {
-                            "url_params" : ("application", "guild"),
-                            "query_params": None,
-                            "payload" : list[ApplicationCommand],
-                            "additional_properties": {},
-                            "statuscode_returntype_map" : {
-                                    200 : list[ApplicationCommand],
-                                }
-                            }
-                    },
                     cls.ApplicationCommandUrls.GET_GUILD_APPLICATION_COMMAND_PERMISSIONS : {
                         HttpMethods.GET : {
                             "url_params" : ("application", "guild"),
@@ -1880,6 +1912,7 @@ class Guild(msgspec.Struct, kw_only=True):
                             }
                     },
                     cls.ApplicationCommandUrls.GET_APPLICATION_COMMAND_PERMISSIONS : {
+                        #GET_APPLICATION_COMMAND_PERMISSIONS
                         HttpMethods.GET : {
                             "url_params" : ("application", "guild", "command"),
                             "query_params": None,
@@ -1888,13 +1921,12 @@ class Guild(msgspec.Struct, kw_only=True):
                             "statuscode_returntype_map" : {
                                     200 : GuildApplicationCommandPermissions,
                                 }
-                            }
-                    },
-                    cls.ApplicationCommandUrls.EDIT_APPLICATION_COMMAND_PERMISSIONS : {
+                            },
+                        #EDIT_APPLICATION_COMMAND_PERMISSIONS
                         HttpMethods.PUT : {
                             "url_params" : ("application", "guild", "command"),
                             "query_params": None,
-                            "payload" : EditApplicationCommandPermissionsJSONParams,
+                            "payload" : cls.EditApplicationCommandPermissionsJSONParams,
                             "additional_properties": {
                                     "Bearer": (True, str),
                                 },
@@ -1906,7 +1938,7 @@ class Guild(msgspec.Struct, kw_only=True):
                     cls.AuditLogUrls.GET_GUILD_AUDIT_LOG : {
                         HttpMethods.GET : {
                             "url_params" : {},
-                            "query_params": GetGuildAuditLogQueryParams,
+                            "query_params": cls.GetGuildAuditLogQueryParams,
                             "payload" : None,
                             "additional_properties": {},
                             "statuscode_returntype_map" : {
@@ -1915,6 +1947,7 @@ class Guild(msgspec.Struct, kw_only=True):
                             }
                     },
                     cls.AutoModerationUrls.LIST_AUTO_MODERATION_RULES_FOR_GUILD : {
+                        #LIST_AUTO_MODERATION_RULES_FOR_GUILD
                         HttpMethods.GET : {
                             "url_params" : {
                                     "guild_id": str
@@ -1925,23 +1958,8 @@ class Guild(msgspec.Struct, kw_only=True):
                             "statuscode_returntype_map" : {
                                     200 : list[AutoModerationRule],
                                 }
-                            }
-                    },
-                    cls.AutoModerationUrls.GET_AUTO_MODERATION_RULE : {
-                        HttpMethods.GET : {
-                            "url_params" : {
-                                "guild_id" : str, 
-                                "auto_moderation_rule_id": str
-                                },
-                            "query_params": None,
-                            "payload" : None,
-                            "additional_properties": {},
-                            "statuscode_returntype_map" : {
-                                200 : AutoModerationRule,
-                            }
-                        }
-                    },
-                    cls.AutoModerationUrls.CREATE_AUTO_MODERATION_RULE: {
+                            },
+                        #CREATE_AUTO_MODERATION_RULE
                         HttpMethods.POST: {
                             "url_params": {
                                 "guild_id": str,
@@ -1957,7 +1975,21 @@ class Guild(msgspec.Struct, kw_only=True):
                             },
                         }
                     },
-                    cls.AutoModerationUrls.MODIFY_AUTO_MODERATION_RULE : {
+                    cls.AutoModerationUrls.GET_AUTO_MODERATION_RULE : {
+                        #GET_AUTO_MODERATION_RULE
+                        HttpMethods.GET : {
+                            "url_params" : {
+                                "guild_id" : str, 
+                                "auto_moderation_rule_id": str
+                                },
+                            "query_params": None,
+                            "payload" : None,
+                            "additional_properties": {},
+                            "statuscode_returntype_map" : {
+                                200 : AutoModerationRule,
+                            }
+                        },
+                        #MODIFY_AUTO_MODERATION_RULE
                         HttpMethods.PATCH : {
                             "url_params" : ("guild", "auto_moderation_rule"),
                             "query_params": None,
@@ -1969,9 +2001,8 @@ class Guild(msgspec.Struct, kw_only=True):
                             "statuscode_returntype_map" : {
                                 200 : AutoModerationRule,
                             }
-                        }
-                    },
-                    cls.AutoModerationUrls.DELETE_AUTO_MODERATION_RULE : {
+                        },
+                        #DELETE_AUTO_MODERATION_RULE
                         HttpMethods.DELETE : {
                             "url_params" : ("guild", "auto_moderation_rule"),
                             "query_params": None,
@@ -2012,7 +2043,7 @@ class Guild(msgspec.Struct, kw_only=True):
     afk_channel_id : str | None = None
     afk_timeout : int
     widget_enabled : bool | None = None
-    widget_channel_id : int | None = None
+    widget_channel_id : str | None = None
     verification_level : 'VerificationLevels'
     default_message_notifications : 'DefaultMessageNotificationLevels'
     explicit_content_filter	: 'ExplicitContentFilterLevels'
@@ -2037,12 +2068,12 @@ class Guild(msgspec.Struct, kw_only=True):
     max_stage_video_channel_users : int | None = None
     approximate_member_count : int | None = None
     approximate_presence_count : int | None = None
-    welcome_screen : 'WelcomeScreen' | None = None
+    welcome_screen : 'WelcomeScreen | None' = None
     nsfw_level : 'GuildNSFWLevels'
     stickers : list['Sticker'] = msgspec.field(default_factory=list)
     premium_progress_bar_enabled : bool
     safety_alerts_channel_id : str | None = None
-    incidents_data : 'Incidents' | None = None
+    incidents_data : 'Incidents | None' = None
 
 class Incidents(msgspec.Struct, kw_only=True):
     """
@@ -2091,20 +2122,21 @@ class GuildMember(msgspec.Struct, kw_only=True):
     """
     GuildMember is a User which is a member of a Guild.
     """
-    user : 'User' | None = None
+    user : 'User | None' = None
     nick : str | None = None
     avatar : str | None = None
     banner : str | None = None
-    roles : list[int]
+    roles : list[str]
     joined_at : datetime | None = None
     premium_since : datetime | None = None
-    deaf : bool
-    mute : bool
+    #deaf and mute are missing from the partial members of Resolved.
+    deaf : bool = False
+    mute : bool = False
     flags : int = 0
     pending : bool | None = None
     permissions : str | None = None
     communication_disabled_until : datetime | None = None
-    avatar_decoration_data : 'AvatarDecoration' | None = None
+    avatar_decoration_data : 'AvatarDecoration | None' = None
 
 class Integration(msgspec.Struct, kw_only=True):
     """
@@ -2125,14 +2157,14 @@ class Integration(msgspec.Struct, kw_only=True):
     syncing: bool | None = None
     role_id: str | None = None
     enable_emoticons: bool | None = None
-    expire_behavior: 'IntegrationExpireBehaviors' | None = None
+    expire_behavior: 'IntegrationExpireBehaviors | None' = None
     expire_grace_period: int | None = None
-    user: "User" | None = None
+    user: "User | None" = None
     account: "IntegrationAccount"
     synced_at: datetime | None = None
     subscriber_count: int | None = None
     revoked: bool | None = None
-    application: "IntegrationApplication" | None = None 
+    application: "IntegrationApplication | None" = None 
     scopes: list['OAuth2Scopes'] = msgspec.field(default_factory=list)
 
 class IntegrationAccount(msgspec.Struct, kw_only=True):
@@ -2144,7 +2176,7 @@ class IntegrationApplication(msgspec.Struct, kw_only=True):
     name: str
     icon: str | None = None
     description: str
-    bot: "User" | None = None
+    bot: "User | None" = None
 
 class Ban(msgspec.Struct, kw_only=True):
     reason: str | None = None
@@ -2187,7 +2219,7 @@ class PromptOption(msgspec.Struct, kw_only=True):
     id: str
     channel_ids: list[str]
     role_ids: list[str]
-    emoji: "Emoji" | None = None
+    emoji: "Emoji | None" = None
     emoji_id: str | None = None
     emoji_name: str | None = None
     emoji_animated: bool | None = None
@@ -2213,18 +2245,18 @@ class Invite(msgspec.Struct, kw_only=True):
     """
     type: 'InviteTypes'
     code: str
-    guild: "Guild" | None = None
-    channel: "Channel" | None = None
-    inviter: "User" | None = None
+    guild: "Guild | None" = None
+    channel: "Channel | None" = None
+    inviter: "User | None" = None
     target_type: int | None = None
-    target_user: "User" | None = None
-    target_application: "Application" | None = None
+    target_user: "User | None" = None
+    target_application: "Application | None" = None
     approximate_presence_count: int | None = None
     approximate_member_count: int | None = None
     expires_at: datetime | None = None
-    stage_instance: "InviteStageInstance" | None = None  # deprecated
-    guild_scheduled_event: "GuildScheduledEvent" | None = None
-    flags: 'GuildInviteFlags' | None = None
+    stage_instance: "InviteStageInstance | None" = None  # deprecated
+    guild_scheduled_event: "GuildScheduledEvent | None" = None
+    flags: 'GuildInviteFlags | None' = None
 
 class InviteMetadata(msgspec.Struct, kw_only=True):
     """
@@ -2254,7 +2286,7 @@ class Lobby(msgspec.Struct, kw_only=True):
     application_id: str  # snowflake
     metadata: dict[str, str] = msgspec.field(default_factory=dict)
     members: list['LobbyMember']
-    linked_channel: 'Channel' | None = None
+    linked_channel: 'Channel | None' = None
 
 class LobbyMember(msgspec.Struct, kw_only=True):
     """
@@ -2265,7 +2297,7 @@ class LobbyMember(msgspec.Struct, kw_only=True):
     flags: int | None = None
 
 #Message-
-class MessageTypes(msgspec.Struct, kw_only=True):
+class MessageTypes(enum.IntEnum):
     DEFAULT = 0
     RECIPIENT_ADD = 1
     RECIPIENT_REMOVE = 2
@@ -2359,33 +2391,33 @@ class Message(msgspec.Struct, kw_only=True):
     tts : bool
     mention_everyone : bool
     mentions : list['User']
-    mention_roles : list['Role']
-    mention_channels : 'ChannelMention' | None = None
-    attachments : 'Attachment'
+    mention_roles : list[str]
+    mention_channels : list['ChannelMention'] = msgspec.field(default_factory=list)
+    attachments : list['Attachment']
     embeds : list['Embed']
     reactions : list['Reaction'] = msgspec.field(default_factory=list)
     nonce : int | str | None = None
     pinned : bool
     webhook_id : str | None = None
     type : 'MessageTypes'
-    activity : 'MessageActivity' | None = None
-    application : 'Application' | None = None
+    activity : 'MessageActivity | None' = None
+    application : 'Application | None' = None
     application_id : str | None = None
     flags : int | None = None
-    message_reference : 'MessageReference' | None = None
+    message_reference : 'MessageReference | None' = None
     message_snapshots : list['MessageSnapshot'] = msgspec.field(default_factory=list)
-    referenced_message : 'Message' | None = None
-    interaction_metadata : 'MessageInteractionMetadata' | None = None
-    interaction : 'MessageInteraction' | None = None
-    thread : 'Channel' | None = None
+    referenced_message : 'Message | None' = None
+    interaction_metadata : 'MessageInteractionMetadata | None' = None
+    interaction : 'MessageInteraction | None' = None
+    thread : 'Channel | None' = None
     components : list['Component'] = msgspec.field(default_factory=list)
     sticker_items : list['StickerItem'] = msgspec.field(default_factory=list)
     stickers : list['Sticker'] = msgspec.field(default_factory=list)
     position : int | None = None
-    role_subscription_data : 'RoleSubscriptionData' | None = None
-    resolved : 'Resolved' | None = None
-    poll : 'Poll' | None = None
-    call : 'MessageCall' | None = None
+    role_subscription_data : 'RoleSubscriptionData | None' = None
+    resolved : 'Resolved | None' = None
+    poll : 'Poll | None' = None
+    call : 'MessageCall | None' = None
 
 class MessageActivity(msgspec.Struct, kw_only=True):
     """
@@ -2402,12 +2434,12 @@ class MessageInteractionMetadata(msgspec.Struct, kw_only=True):
     id : str
     type : 'InteractionTypes'
     user : 'User'
-    authorizing_integration_owners : dict['ApplicationIntegrationTypes', int]
+    authorizing_integration_owners : dict['ApplicationIntegrationTypes', str]
     original_response_message_id : str | None = None
-    target_user : 'User' | None = None
+    target_user : 'User | None' = None
     target_message_id : str | None = None
     interacted_message_id : str | None = None
-    triggering_interaction_metadata	 : 'MessageInteractionMetadata' | None = None
+    triggering_interaction_metadata	 : 'MessageInteractionMetadata | None' = None
 
 class MessageCall(msgspec.Struct, kw_only=True):
     """
@@ -2420,7 +2452,7 @@ class MessageReference(msgspec.Struct, kw_only=True):
     """
     Message Reference is part of the message structure that indicates a message is a reply to another message
     """
-    type : 'MessageReferenceTypes' | None = None
+    type : 'MessageReferenceTypes | None' = None
     message_id : str | None = None
     channel_id : str | None = None
     guild_id : str | None = None
@@ -2430,7 +2462,7 @@ class MessageSnapshot(msgspec.Struct, kw_only=True):
     """
     Message Snapshot Object represents a lightweight, static copy of a message captured when a message is referenced or replied to.
     """
-    message : 'Message' | None = None
+    message : 'Message | None' = None
 
 class Reaction(msgspec.Struct, kw_only=True):
     """
@@ -2455,17 +2487,17 @@ class Embed(msgspec.Struct, kw_only=True):
     Embed is a rich structured content message format in discord.
     """
     title : str | None = None
-    type : 'EmbedTypes' | None = None
+    type : 'EmbedTypes | None' = None
     description : str | None = None
     url : str | None = None
     timestamp : datetime | None = None
     color : int | None = None
-    footer : 'EmbedFooter' | None = None
-    image : 'EmbedImage' | None = None
-    thumbnail : 'EmbedThumbnail' | None = None
-    video : 'EmbedVideo' | None = None
-    provider : 'EmbedProvider' | None = None
-    author : 'EmbedAuthor' | None = None
+    footer : 'EmbedFooter | None' = None
+    image : 'EmbedImage | None' = None
+    thumbnail : 'EmbedThumbnail | None' = None
+    video : 'EmbedVideo | None' = None
+    provider : 'EmbedProvider | None' = None
+    author : 'EmbedAuthor | None' = None
     fields : list['EmbedField'] = msgspec.field(default_factory=list)
 
 class EmbedThumbnail(msgspec.Struct, kw_only=True):
@@ -2592,7 +2624,7 @@ class Poll(msgspec.Struct, kw_only=True):
     expiry : datetime | None = None
     allow_multiselect : bool
     layout_type : 'PollLayoutTypes'
-    results : 'PollResults' | None = None
+    results : 'PollResults | None' = None
 
 class PollCreateRequest(msgspec.Struct, kw_only=True):
     """
@@ -2603,7 +2635,7 @@ class PollCreateRequest(msgspec.Struct, kw_only=True):
     answers: list['PollAnswer']                  # Available answers (up to 10)
     duration: int | None = None                   # Duration in hours (max 32 days, default 24)
     allow_multiselect: bool | None = None         # Whether multiple answers can be selected
-    layout_type: 'PollLayoutTypes' | None = None                # Layout type of the poll (default is DEFAULT)
+    layout_type: 'PollLayoutTypes | None' = None                # Layout type of the poll (default is DEFAULT)
 
 class PollMedia(msgspec.Struct, kw_only=True):
     """
@@ -2611,7 +2643,7 @@ class PollMedia(msgspec.Struct, kw_only=True):
     The intention is that it allows discord to extensibly add new ways to display things in the future. For now, question only supports text, while answers can have an optional emoji.
     """
     text : str | None = None
-    emoji : 'Emoji' | None = None
+    emoji : 'Emoji | None' = None
 
 class PollAnswer(msgspec.Struct, kw_only=True):
     """
@@ -2668,7 +2700,7 @@ class SoundboardSound(msgspec.Struct, kw_only=True):
     emoji_name: str | None = None               # The unicode character of this sound's standard emoji
     guild_id: str | None = None                 # The id of the guild this sound is in (snowflake)
     available: bool                             # Whether this sound can be used
-    user: "User" | None = None                  # The user who created this sound
+    user: "User | None" = None                  # The user who created this sound
 
 #StageInstance-
 class PrivacyLevels(enum.IntEnum):
@@ -2696,7 +2728,7 @@ class StickerFormats(enum.IntEnum):
     LOTTIE = 3
     GIF = 4
 
-class Sticker(msgspec.Struct, kw_only=True, kw_only=True):
+class Sticker(msgspec.Struct, kw_only=True):
     """
     Sticker objects represents an animated or custom emoji in discord.
     """
@@ -2709,7 +2741,7 @@ class Sticker(msgspec.Struct, kw_only=True, kw_only=True):
     format_type: 'StickerFormats'  # type of sticker format
     available: bool | None = None  # whether this guild sticker can be used
     guild_id: str | None = None  # snowflake - id of the guild that owns the sticker
-    user: "User" | None = None  # user object - the user who uploaded the sticker
+    user: "User | None" = None  # user object - the user who uploaded the sticker
     sort_value: int | None = None  # standard sticker's sort order within its pack
 
 class StickerItem(msgspec.Struct, kw_only=True):
@@ -2823,15 +2855,15 @@ class User(msgspec.Struct, kw_only=True):
     mfa_enabled : bool | None = None 
     banner : str | None = None 
     accent_color : int | None = None 
-    locale : 'Locales' | None = None 
+    locale : 'Locales | None' = None 
     verified : bool | None = None 
     email : str | None = None 
-    flags : 'UserFlags' | None = None 
-    premium_type : 'PremiumTypes' | None = None 
-    public_flags : 'UserFlags' | None = None 
-    avatar_decoration_data : 'AvatarDecoration' | None = None 
-    collectibles : 'Collectible' | None = None 
-    primary_guild : 'UserPrimaryGuild' | None = None 
+    flags : 'UserFlags | None' = None 
+    premium_type : 'PremiumTypes | None' = None 
+    public_flags : 'UserFlags | None' = None 
+    avatar_decoration_data : 'AvatarDecoration | None' = None 
+    collectibles : 'Collectible | None' = None 
+    primary_guild : 'UserPrimaryGuild | None' = None 
 
 class AvatarDecoration(msgspec.Struct, kw_only=True):
     """
@@ -2844,7 +2876,7 @@ class Collectible(msgspec.Struct, kw_only=True):
     """
     The collectibles the user has, excluding Avatar Decorations and Profile Effects.
     """
-    nameplate : 'Nameplate' | None = None
+    nameplate : 'Nameplate | None' = None
 
 class Nameplate(msgspec.Struct, kw_only=True):
     """
@@ -2896,7 +2928,7 @@ class VoiceState(msgspec.Struct, kw_only=True):
     guild_id: str | None = None
     channel_id: str | None = None
     user_id: str
-    member: "GuildMember" | None = None
+    member: "GuildMember | None" = None
     session_id: str
     deaf: bool
     mute: bool
@@ -2935,13 +2967,13 @@ class Webhook(msgspec.Struct, kw_only=True):
     type: 'WebhookTypes'
     guild_id: str | None = None  # snowflake
     channel_id: str | None = None  # snowflake
-    user: 'User' | None = None
+    user: 'User | None' = None
     name: str | None = None
     avatar: str | None = None
     token: str | None = None
     application_id: str | None = None  # snowflake
-    source_guild: 'Guild' | None = None
-    source_channel: 'Channel' | None = None
+    source_guild: 'Guild | None' = None
+    source_channel: 'Channel | None' = None
     url: str | None = None
 
 ############### End of Discord Resources data models
@@ -3107,6 +3139,7 @@ class HTTPResponseCodes(enum.IntEnum):
     METHOD_NOT_ALLOWED = 405# The HTTP method used is not valid for the location specified.
     TOO_MANY_REQUESTS = 429 # You are being rate limited, see Rate Limits.
     GATEWAY_UNAVAILABLE = 502 # There was not a gateway available to process your request. Wait a bit and retry.
+    SERVICE_UNAVAILABLE = 503 # Discord or its edge could not take the request, it was not processed. Wait a bit and retry.
     SERVER_ERROR = 500      # The server had an error processing your request (these are rare).
 
 class JSONErrorCodes(enum.IntEnum):
@@ -3430,7 +3463,7 @@ class Role(msgspec.Struct, kw_only=True):
     permissions : str
     managed : bool
     mentionable : bool
-    tags : 'RoleTags' | None = None
+    tags : 'RoleTags | None' = None
     flags : int
 
 class RoleColor(msgspec.Struct, kw_only=True):
@@ -3453,8 +3486,8 @@ class RoleTags(msgspec.Struct, kw_only=True):
 class RateLimitResponse(msgspec.Struct, kw_only=True):
     message: str           # A message saying you are being rate limited.
     retry_after: float     # Number of seconds to wait before retrying.
-    global_limit: bool     # Indicates if rate limit is global.
-    code: 'JSONErrorCodes' | None = None  # Optional error code.
+    global_limit: bool = msgspec.field(name="global")  # Indicates if rate limit is global, "global" in the JSON body.
+    code: 'JSONErrorCodes | None' = None  # Optional error code.
 
 #RPC-
 class RPCCommands(enum.StrEnum):
@@ -3509,7 +3542,7 @@ class KeyTypes(enum.IntEnum):
 class Payload(msgspec.Struct, kw_only=True):
     cmd: 'RPCCommands'                 # Always present - payload command
     nonce: str | None = None               # Unique string for replies from server
-    evt: 'RPCEvents' | None = None        # Subscription event name
+    evt: 'RPCEvents | None' = None        # Subscription event name
     data: dict | None = None               # Event data from server
     args: dict | None = None               # Command arguments sent to server
 
@@ -3574,7 +3607,7 @@ class GetChannelsResponse(msgspec.Struct, kw_only=True):
 
 class SetUserVoiceSettings(msgspec.Struct, kw_only=True):
     user_id: str  # user id
-    pan: 'Pan' | None = None  # set the pan of the user
+    pan: 'Pan | None' = None  # set the pan of the user
     volume: int | None = None  # set the volume of user (defaults to 100, min 0, max 200)
     mute: bool | None = None  # set the mute state of the user
 
@@ -3758,13 +3791,4 @@ class TeamMember(msgspec.Struct, kw_only=True):
     membership_state : 'MembershipStates'
     team_id : str
     user : 'User'
-    role : 'TeamMemberRoleTypes' | str = ""
-
-try:
-    rcd = msgspec.json.decode(
-    b'{"burst": 8, "normal": 88, "test": {"name": "Michael", "age": null, "nested_object": {"nested": true}}}',
-    type=ReactionCountDetails
-    )
-    print(rcd)
-except Exception as e:
-    print(e)
\ No newline at end of file
+    role : str = ""  # TeamMemberRoleTypes, empty for the team owner
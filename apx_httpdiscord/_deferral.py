@@ -0,0 +1,142 @@
+import asyncio
+import logging
+
+from ._datamodels import (
+    HttpMethods, Interaction, InteractionTypes, InteractionResponse, InteractionCallbackTypes, InteractionCallbackData,
+)
+
+logger = logging.getLogger(__name__)
+
+#Discord drops interactions which are not answered within 3 seconds of creation.
+INTERACTION_RESPONSE_DEADLINE = 3.0
+
+#Interaction types which can be answered with a deferred response, autocomplete and ping cannot.
+_DEFERRED_TYPES = {
+    InteractionTypes.APPLICATION_COMMAND: InteractionCallbackTypes.DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE,
+    InteractionTypes.MODAL_SUBMIT: InteractionCallbackTypes.DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE,
+    InteractionTypes.MESSAGE_COMPONENT: InteractionCallbackTypes.DEFERRED_UPDATE_MESSAGE,
+}
+
+#Callback types whose data can be delivered later by editing the original response.
+_MESSAGE_CALLBACK_TYPES = {
+    InteractionCallbackTypes.CHANNEL_MESSAGE_WITH_SOURCE,
+    InteractionCallbackTypes.UPDATE_MESSAGE,
+    InteractionCallbackTypes.DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE,
+    InteractionCallbackTypes.DEFERRED_UPDATE_MESSAGE,
+}
+
+#Callback types creating a new message, the original response of a DEFERRED_UPDATE_MESSAGE is the message of the component
+#so they are sent as a follow-up message instead of overwriting it.
+_NEW_MESSAGE_CALLBACK_TYPES = {
+    InteractionCallbackTypes.CHANNEL_MESSAGE_WITH_SOURCE,
+    InteractionCallbackTypes.DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE,
+}
+
+class ResponseScheduler():
+    """
+    Starts a deadline timer for every interaction handed to respond().
+    If the handler has not produced an InteractionResponse within budget seconds of the interaction being received,
+    a DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE(DEFERRED_UPDATE_MESSAGE for message components) response is returned instead,
+    and the eventual result of the handler is sent through EDIT_ORIGINAL_INTERACTION_RESPONSE, or CREATE_FOLLOWUP_MESSAGE
+    when a deferred message component handler returns a new message(CHANNEL_MESSAGE_WITH_SOURCE).
+    deferred_flags(e.g MessageFlags.EPHEMERAL) are set on deferred channel message responses.
+    When a started FollowupQueue is given the edits are queued on it, ordered by the expiry of the interaction tokens.
+    """
+
+    def __init__(self, support, budget=2.5, deferred_flags=None, followups=None):
+        if(budget >= INTERACTION_RESPONSE_DEADLINE):
+            raise ValueError(f"budget must leave time to answer before the {INTERACTION_RESPONSE_DEADLINE}s deadline")
+        self.support = support
+        self.budget = budget
+        self.deferred_flags = deferred_flags
+        self.followups = followups
+        self.deferred_count = 0
+        self._pending = set()
+
+    def deferred_response(self, interaction):
+        callback_type = _DEFERRED_TYPES[interaction.type]
+        data = None
+        if(callback_type == InteractionCallbackTypes.DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE and self.deferred_flags is not None):
+            data = InteractionCallbackData(flags=int(self.deferred_flags))
+        return InteractionResponse(type=callback_type, data=data)
+
+    async def respond(self, interaction, handler, received_at=None):
+        """
+        Runs handler(interaction) and returns the response to send to discord within the budget.
+        received_at is the event loop time(loop.time()) the interaction was received at, defaults to now.
+        """
+        loop = asyncio.get_running_loop()
+        if(interaction.type not in _DEFERRED_TYPES):
+            return await handler(interaction)
+
+        task = asyncio.ensure_future(handler(interaction))
+        remaining = self.budget - (loop.time() - (received_at if received_at is not None else loop.time()))
+        done, _ = await asyncio.wait((task,), timeout=max(remaining, 0))
+        if(done):
+            return task.result()
+
+        self.deferred_count += 1
+        follow_up = asyncio.ensure_future(self._deliver(interaction, task))
+        self._pending.add(follow_up)
+        follow_up.add_done_callback(self._pending.discard)
+        return self.deferred_response(interaction)
+
+    async def _deliver(self, interaction, task):
+        try:
+            response = await task
+        except Exception:
+            logger.exception("handler of deferred interaction %s failed", interaction.id)
+            return
+        if(response is None or response.type not in _MESSAGE_CALLBACK_TYPES or response.data is None):
+            logger.warning("handler of deferred interaction %s returned no message to edit the original response with", interaction.id)
+            return
+
+        data = response.data
+        if(_DEFERRED_TYPES[interaction.type] == InteractionCallbackTypes.DEFERRED_UPDATE_MESSAGE and response.type in _NEW_MESSAGE_CALLBACK_TYPES):
+            return await self._create_followup(interaction, data)
+        payload = Interaction.EditOriginalInteractionResponseJSONParams(
+            content=data.content,
+            embeds=data.embeds or None,
+            flags=data.flags,
+            allowed_mentions=data.allowed_mentions,
+            components=data.components or None,
+            attachments=data.attachments or None,
+        )
+        try:
+            if(self.followups is not None):
+                return await self.followups.edit_original(interaction, payload)
+            await self.support.send(
+                Interaction.InteractionUrls.EDIT_ORIGINAL_INTERACTION_RESPONSE, HttpMethods.PATCH,
+                {"application.id": interaction.application_id, "interaction": interaction},
+                payload=payload,
+            )
+        except Exception:
+            logger.exception("editing the original response of deferred interaction %s failed", interaction.id)
+
+    async def _create_followup(self, interaction, data):
+        payload = Interaction.CreateFollowupMessageJSONParams(
+            content=data.content,
+            embeds=data.embeds or None,
+            allowed_mentions=data.allowed_mentions,
+            components=data.components or None,
+            attachments=data.attachments or None,
+            flags=data.flags,
+            tts=data.tts,
+        )
+        try:
+            if(self.followups is not None):
+                return await self.followups.create_followup(interaction, payload)
+            await self.support.send(
+                Interaction.InteractionUrls.CREATE_FOLLOWUP_MESSAGE, HttpMethods.POST,
+                {"application.id": interaction.application_id, "interaction": interaction},
+                payload=payload,
+            )
+        except Exception:
+            logger.exception("sending the follow-up message of deferred interaction %s failed", interaction.id)
+
+    async def drain(self):
+        """
+        Waits for the pending original response edits, e.g before shutting down.
+        """
+        if(self._pending):
+            await asyncio.gather(*self._pending, return_exceptions=True)
@@ -0,0 +1,45 @@
+class ApxHttpDiscordError(Exception):
+    """
+    Base class for the errors raised by the APX Discord Support.
+    """
+
+class HTTPException(ApxHttpDiscordError):
+    """
+    Raised when discord answers a request with a non successful status code.
+    The decoded JSON error body(if any) is kept on the exception for inspection.
+    """
+
+    def __init__(self, status, body=None, headers=None, route=None):
+        self.status = status
+        self.body = body
+        self.headers = headers if headers is not None else {}
+        self.route = route
+        self.code = body.get("code") if isinstance(body, dict) else None
+        message = body.get("message") if isinstance(body, dict) else None
+        super().__init__(f"{status} {message or ''}".strip() + (f" (route: {route})" if route else ""))
+
+class AttachmentSizeError(ApxHttpDiscordError):
+    """
+    Raised before any transfer when the attachments of a message exceed the attachment count or size limit.
+    """
+
+class EmbedLimitError(ApxHttpDiscordError):
+    """
+    Raised when embed content cannot fit the discord embed limits, even after splitting it across embeds.
+    """
+
+class InteractionTokenExpiredError(ApxHttpDiscordError):
+    """
+    Raised for a follow-up that was dropped because its interaction token expires before it could be sent.
+    """
+
+class CircuitOpenError(ApxHttpDiscordError):
+    """
+    Raised without sending the request while the circuit breaker of its rate limit bucket is open.
+    retry_after is the number of seconds before the circuit lets a probe request through.
+    """
+
+    def __init__(self, key, retry_after):
+        self.key = key
+        self.retry_after = retry_after
+        super().__init__(f"circuit open for bucket {key}, retry in {retry_after:.1f}s")
@@ -0,0 +1,150 @@
+"""
+Interaction token lifetimes and a deadline ordered queue for the requests made with them(follow-ups, original response edits).
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+
+from ._datamodels import HttpMethods, Interaction
+from ._errors import InteractionTokenExpiredError
+from ._snowflake import snowflake_time
+
+#Seconds an interaction token stays valid after the interaction was created.
+INTERACTION_TOKEN_LIFETIME = 15 * 60
+
+class TokenTracker():
+    """
+    Records the expiry of interaction tokens, computed from the creation time encoded in the interaction id.
+    Tokens are kept in tracking order, expired tokens are purged from the front on every track().
+    """
+
+    def __init__(self, lifetime=INTERACTION_TOKEN_LIFETIME):
+        self.lifetime = lifetime
+        self._expiry = {}  # token -> unix time of expiry
+
+    def __len__(self):
+        return len(self._expiry)
+
+    def track(self, interaction):
+        expires_at = snowflake_time(interaction.id) + self.lifetime
+        self._purge(time.time())
+        self._expiry[interaction.token] = expires_at
+        return expires_at
+
+    def _purge(self, now):
+        expiry = self._expiry
+        while(expiry):
+            token = next(iter(expiry))
+            if(expiry[token] > now):
+                break
+            del expiry[token]
+
+    def expires_at(self, interaction):
+        """
+        Expiry of the token of interaction, tracking it when it was not tracked yet.
+        """
+        expires_at = self._expiry.get(interaction.token)
+        return self.track(interaction) if expires_at is None else expires_at
+
+    def remaining(self, interaction, now=None):
+        return self.expires_at(interaction) - (time.time() if now is None else now)
+
+class FollowupQueue():
+    """
+    Sends requests authenticated by interaction tokens on concurrency workers, earliest token expiry first,
+    so follow-ups of interactions close to their deadline overtake the ones which still have time.
+    A request is dropped(its future fails with InteractionTokenExpiredError) without being sent when the time left on
+    its token is below the running average latency of the sent requests plus margin seconds.
+    """
+
+    def __init__(self, support, tracker=None, concurrency=4, margin=1.0):
+        self.support = support
+        self.tracker = TokenTracker() if tracker is None else tracker
+        self.concurrency = concurrency
+        self.margin = margin
+        self.latency = 0.0
+        self.sent = 0
+        self.dropped = 0
+        self._queue = []  # (expires_at, sequence, interaction, request, future)
+        self._sequence = itertools.count()
+        self._ready = asyncio.Event()
+        self._workers = []
+
+    def __len__(self):
+        return len(self._queue)
+
+    def start(self):
+        if(not self._workers):
+            self._workers = [asyncio.ensure_future(self._work()) for _ in range(self.concurrency)]
+        return self
+
+    async def close(self):
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        while(self._queue):
+            future = heapq.heappop(self._queue)[-1]
+            if(not future.done()):
+                future.cancel()
+
+    async def __aenter__(self):
+        return self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def submit(self, interaction, url, url_method=HttpMethods.POST, url_params=None, query_params=None, payload=None):
+        """
+        Queues a request made with the token of interaction, returns a future of its decoded response.
+        url_params default to the application id and token of the interaction.
+        """
+        if(url_params is None):
+            url_params = {"application.id": interaction.application_id, "interaction": interaction}
+        future = asyncio.get_running_loop().create_future()
+        request = (url, url_method, url_params, query_params, payload)
+        heapq.heappush(self._queue, (self.tracker.expires_at(interaction), next(self._sequence), interaction, request, future))
+        self._ready.set()
+        return future
+
+    def create_followup(self, interaction, payload, query_params=None):
+        return self.submit(interaction, Interaction.InteractionUrls.CREATE_FOLLOWUP_MESSAGE, HttpMethods.POST, query_params=query_params, payload=payload)
+
+    def edit_followup(self, interaction, message_id, payload, query_params=None):
+        url_params = {"application.id": interaction.application_id, "interaction": interaction, "message.id": message_id}
+        return self.submit(interaction, Interaction.InteractionUrls.EDIT_FOLLOWUP_MESSAGE, HttpMethods.PATCH, url_params, query_params, payload)
+
+    def edit_original(self, interaction, payload, query_params=None):
+        return self.submit(interaction, Interaction.InteractionUrls.EDIT_ORIGINAL_INTERACTION_RESPONSE, HttpMethods.PATCH, query_params=query_params, payload=payload)
+
+    async def _work(self):
+        while(True):
+            while(not self._queue):
+                self._ready.clear()
+                await self._ready.wait()
+            expires_at, _, interaction, request, future = heapq.heappop(self._queue)
+            if(future.done()):
+                continue
+            if(expires_at - time.time() < self.latency + self.margin):
+                self.dropped += 1
+                future.set_exception(InteractionTokenExpiredError(f"token of interaction {interaction.id} expires before the request can complete"))
+                continue
+
+            url, url_method, url_params, query_params, payload = request
+            started = time.monotonic()
+            try:
+                result = await self.support.send(url, url_method, url_params, query_params, payload)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as error:
+                if(not future.done()):
+                    future.set_exception(error)
+            else:
+                if(not future.done()):
+                    future.set_result(result)
+            elapsed = time.monotonic() - started
+            self.sent += 1
+            self.latency = elapsed if self.sent == 1 else self.latency * 0.9 + elapsed * 0.1
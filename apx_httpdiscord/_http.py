@@ -0,0 +1,180 @@
+"""
+Minimal asyncio HTTP/1.1 client used by the APX Discord Support.
+Connections are kept alive and pooled per origin, request bodies are either bytes or objects exposing
+an async write(writer) method(e.g MultipartEncoder) so large bodies are streamed rather than buffered.
+"""
+
+import asyncio
+import collections
+import ssl
+import time
+import urllib.parse
+
+from ._tracing import CONNECTION_ACQUIRE, ROUND_TRIP
+
+class HttpResponse():
+
+    def __init__(self, status, reason, headers, body):
+        self.status = status
+        self.reason = reason
+        self.headers = headers  # header names are lower cased
+        self.body = body
+
+    def __repr__(self):
+        return f"<HttpResponse {self.status} {self.reason} ({len(self.body)} bytes)>"
+
+class HttpConnection():
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.reusable = True
+
+    def close(self):
+        self.reusable = False
+        self.writer.close()
+
+class HttpConnectionPool():
+    """
+    Keep-alive connection pool for a single origin(scheme, host and port).
+    At most max_connections connections are open at the same time, callers wait on acquire() beyond that.
+    """
+
+    def __init__(self, origin, max_connections=100, connect_timeout=10.0, read_timeout=30.0, ssl_context=None):
+        parsed = urllib.parse.urlsplit(origin)
+        self.scheme = parsed.scheme
+        self.host = parsed.hostname
+        self.port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        self.host_header = parsed.netloc
+        self.ssl_context = (ssl_context or ssl.create_default_context()) if parsed.scheme == "https" else None
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_connections = max_connections
+        self._slots = asyncio.Semaphore(max_connections)
+        self._idle = collections.deque()
+
+    async def acquire(self):
+        await self._slots.acquire()
+        try:
+            while(self._idle):
+                connection = self._idle.pop()
+                if(not connection.writer.is_closing() and not connection.reader.at_eof()):
+                    return connection, True
+                connection.close()
+            async with asyncio.timeout(self.connect_timeout):
+                reader, writer = await asyncio.open_connection(
+                    self.host, self.port, ssl=self.ssl_context,
+                    server_hostname=self.host if self.ssl_context else None,
+                )
+            return HttpConnection(reader, writer), False
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, connection):
+        if(connection.reusable and not connection.writer.is_closing()):
+            self._idle.append(connection)
+        else:
+            connection.close()
+        self._slots.release()
+
+    async def close(self):
+        while(self._idle):
+            connection = self._idle.pop()
+            connection.close()
+            try:
+                await connection.writer.wait_closed()
+            except (ConnectionError, ssl.SSLError):
+                pass
+
+    async def request(self, method, target, headers=None, body=None, trace=None):
+        """
+        Sends a request on a pooled connection and returns the HttpResponse.
+        A request failing on a reused keep-alive connection before any response byte is read
+        is retried once on a fresh connection, since the server may have closed it while idle.
+        trace is an optional RequestTrace receiving the connection acquire and round trip phases.
+        """
+        for attempt in range(2):
+            if(trace is not None):
+                started = time.time_ns()
+            connection, reused = await self.acquire()
+            if(trace is not None):
+                acquired = time.time_ns()
+                trace.phase(CONNECTION_ACQUIRE, started, acquired)
+            try:
+                response = await self._exchange(connection, method, target, headers, body)
+                if(trace is not None):
+                    trace.phase(ROUND_TRIP, acquired, time.time_ns())
+                return response
+            except ConnectionError:
+                connection.close()
+                if(not reused or attempt):
+                    raise
+            except BaseException:
+                connection.close()
+                raise
+            finally:
+                self.release(connection)
+
+    async def _exchange(self, connection, method, target, headers, body):
+        writer = connection.writer
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {self.host_header}"]
+        headers = dict(headers or {})
+        if(body is None):
+            if(method in ("POST", "PUT", "PATCH")):
+                headers.setdefault("Content-Length", "0")
+        elif(isinstance(body, (bytes, bytearray, memoryview))):
+            headers["Content-Length"] = str(len(body))
+        else:
+            headers["Content-Length"] = str(body.content_length)
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        if(isinstance(body, (bytes, bytearray, memoryview))):
+            writer.write(body)
+            await writer.drain()
+        elif(body is not None):
+            await body.write(writer)
+        else:
+            await writer.drain()
+
+        async with asyncio.timeout(self.read_timeout):
+            return await self._read_response(connection, method)
+
+    async def _read_response(self, connection, method):
+        reader = connection.reader
+        status_line = await reader.readline()
+        if(not status_line):
+            raise ConnectionResetError("connection closed before the response status line")
+        version, status, reason = (status_line.decode("latin-1").rstrip("\r\n").split(" ", 2) + [""])[:3]
+        status = int(status)
+
+        response_headers = {}
+        while(True):
+            line = await reader.readline()
+            if(line in (b"\r\n", b"\n", b"")):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        if(method == "HEAD" or status in (204, 304) or 100 <= status < 200):
+            body = b""
+        elif(response_headers.get("transfer-encoding", "").lower() == "chunked"):
+            chunks = []
+            while(True):
+                size = int((await reader.readline()).split(b";", 1)[0].strip(), 16)
+                if(size == 0):
+                    while((await reader.readline()) not in (b"\r\n", b"\n", b"")):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            body = b"".join(chunks)
+        elif("content-length" in response_headers):
+            body = await reader.readexactly(int(response_headers["content-length"]))
+        else:
+            body = await reader.read()
+            connection.reusable = False
+
+        if(response_headers.get("connection", "").lower() == "close" or version == "HTTP/1.0"):
+            connection.reusable = False
+        return HttpResponse(status, reason, response_headers, body)
@@ -0,0 +1,141 @@
+"""
+ASGI application serving the discord HTTP interactions endpoint(Application.interactions_endpoint_url).
+Run it with any ASGI server, e.g: uvicorn module:app
+"""
+
+import asyncio
+
+import msgspec
+
+from ._datamodels import Interaction, InteractionTypes, InteractionCallbackTypes
+from ._signature import SignatureVerifier
+
+INTERACTION_DECODER = msgspec.json.Decoder(Interaction)
+RESPONSE_ENCODER = msgspec.json.Encoder()
+
+#InteractionResponse without the null data field, the exact body discord expects for a PONG.
+PONG_RESPONSE = RESPONSE_ENCODER.encode({"type": InteractionCallbackTypes.PONG})
+
+_JSON_HEADERS = [(b"content-type", b"application/json")]
+
+#Returned by _read_body when the client disconnected before sending the whole body.
+_DISCONNECTED = object()
+
+class InteractionsApp():
+    """
+    Verifies the signature of every request, decodes its body once, answers PING interactions with a pre-encoded PONG
+    and dispatches the other interaction types to the registered handlers.
+    A handler is an async callable taking the decoded Interaction and returning an InteractionResponse.
+    verifier is a configured SignatureVerifier, a default SignatureVerifier is created when omitted.
+    scheduler is an optional ResponseScheduler, handlers are then deferred automatically when they exceed its budget
+    counted from the arrival of the request.
+    recorder is an optional InteractionRecorder receiving the body and response of every verified request answered with 200.
+    decode_profiler is an optional DecodeProfiler decoding the interactions.
+    """
+
+    def __init__(self, public_key, handlers=None, max_body_size=1 << 20, verifier=None, scheduler=None, recorder=None, decode_profiler=None):
+        self.verifier = verifier or SignatureVerifier(public_key)
+        self.handlers = dict(handlers or {})
+        self.max_body_size = max_body_size
+        self.scheduler = scheduler
+        self.recorder = recorder
+        self.decode_profiler = decode_profiler
+
+    def handler(self, interaction_type):
+        """
+        Decorator registering the handler of an InteractionTypes value.
+        """
+        def register(function):
+            self.handlers[InteractionTypes(interaction_type)] = function
+            return function
+        return register
+
+    async def dispatch(self, interaction, received_at=None):
+        handler = self.handlers.get(interaction.type)
+        if(handler is None):
+            return None
+        if(self.scheduler is not None):
+            return await self.scheduler.respond(interaction, handler, received_at)
+        return await handler(interaction)
+
+    async def __call__(self, scope, receive, send):
+        if(scope["type"] == "lifespan"):
+            return await self._lifespan(receive, send)
+        if(scope["type"] != "http"):
+            return
+        if(scope["method"] != "POST"):
+            return await self._respond(send, 405)
+        received_at = asyncio.get_running_loop().time()
+
+        signature = timestamp = None
+        for name, value in scope["headers"]:
+            if(name == b"x-signature-ed25519"):
+                signature = value
+            elif(name == b"x-signature-timestamp"):
+                timestamp = value
+
+        body = await self._read_body(receive)
+        if(body is _DISCONNECTED):
+            return
+        if(body is None):
+            return await self._respond(send, 413)
+        if(signature is None or timestamp is None or not await self.verifier.verify(timestamp, body, signature)):
+            return await self._respond(send, 401, b"invalid request signature")
+
+        try:
+            if(self.decode_profiler is None):
+                interaction = INTERACTION_DECODER.decode(body)
+            else:
+                interaction = self.decode_profiler.decode(body, type=Interaction)
+        except msgspec.DecodeError as error:
+            return await self._respond(send, 400, str(error).encode())
+        if(interaction.type == InteractionTypes.PING):
+            if(self.recorder is not None):
+                self.recorder.record(body, PONG_RESPONSE)
+            return await self._respond(send, 200, PONG_RESPONSE, _JSON_HEADERS)
+
+        response = await self.dispatch(interaction, received_at)
+        if(response is None):
+            return await self._respond(send, 404, b"no handler for the interaction type")
+        encoded = RESPONSE_ENCODER.encode(response)
+        if(self.recorder is not None):
+            self.recorder.record(body, encoded)
+        return await self._respond(send, 200, encoded, _JSON_HEADERS)
+
+    async def _read_body(self, receive):
+        """
+        Returns the request body, None when it exceeds max_body_size or _DISCONNECTED when the client went away.
+        """
+        chunks = []
+        size = 0
+        while(True):
+            message = await receive()
+            if(message["type"] == "http.disconnect"):
+                return _DISCONNECTED
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if(size > self.max_body_size):
+                return None
+            chunks.append(chunk)
+            if(not message.get("more_body", False)):
+                return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+    @staticmethod
+    async def _respond(send, status, body=b"", headers=()):
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [*headers, (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def _lifespan(self, receive, send):
+        while(True):
+            message = await receive()
+            if(message["type"] == "lifespan.startup"):
+                await send({"type": "lifespan.startup.complete"})
+            elif(message["type"] == "lifespan.shutdown"):
+                if(self.scheduler is not None):
+                    await self.scheduler.drain()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
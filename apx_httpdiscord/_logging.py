@@ -0,0 +1,125 @@
+"""
+logging.Handler shipping records to a discord webhook without blocking the logging threads.
+"""
+
+import asyncio
+import collections
+import logging
+import threading
+import time
+import types
+import urllib.parse
+
+from ._support import DiscordSupport, DISCORD_API_URL
+from ._webhook_sink import WebhookSink
+
+DROP_NEWEST = "drop_newest"
+DROP_OLDEST = "drop_oldest"
+FALLBACK = "fallback"
+
+def parse_webhook_url(url):
+    """
+    Returns an object with the id and token of a webhook url, e.g https://discord.com/api/webhooks/{id}/{token}.
+    """
+    parts = urllib.parse.urlsplit(url).path.strip("/").split("/")
+    try:
+        index = parts.index("webhooks")
+        return types.SimpleNamespace(id=parts[index + 1], token=parts[index + 2])
+    except (ValueError, IndexError):
+        raise ValueError(f"{url} is not a webhook url") from None
+
+class DiscordWebhookHandler(logging.Handler):
+    """
+    Handler appending formatted records to a bounded deque(appends and pops are atomic, emit only takes a lock to count
+    dropped records) which a worker thread drains every poll_interval seconds into a WebhookSink executing the webhook
+    in batches on its own event loop.
+    Records are formatted by emit on the logging thread, like QueueHandler.prepare, so the worker never reads a record
+    whose arguments the caller may still mutate.
+    When capacity records are waiting, overflow decides what happens to a new record: DROP_NEWEST discards it,
+    DROP_OLDEST discards the oldest waiting record, FALLBACK passes it to fallback_handler(e.g a StreamHandler).
+    webhook is a Webhook(or any object with id and token) or a webhook url.
+    """
+
+    def __init__(
+        self, webhook, level=logging.NOTSET, capacity=10_000, overflow=DROP_NEWEST, fallback_handler=None,
+        interval=2.0, poll_interval=0.1, embeds=True, username=None, base_url=DISCORD_API_URL,
+    ):
+        super().__init__(level)
+        if(overflow not in (DROP_NEWEST, DROP_OLDEST, FALLBACK)):
+            raise ValueError(f"unknown overflow policy {overflow!r}")
+        if(overflow == FALLBACK and fallback_handler is None):
+            raise ValueError("the fallback overflow policy requires a fallback_handler")
+        self.webhook = parse_webhook_url(webhook) if isinstance(webhook, str) else webhook
+        self.capacity = capacity
+        self.overflow = overflow
+        self.fallback_handler = fallback_handler
+        self.poll_interval = poll_interval
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._records = collections.deque(maxlen=capacity if overflow == DROP_OLDEST else None)
+        self._sink_options = {"interval": interval, "embeds": embeds, "username": username}
+        self._base_url = base_url
+        self._stopping = threading.Event()
+        self._worker = threading.Thread(target=self._run, name="discord-webhook-handler", daemon=True)
+        self._worker.start()
+
+    def handle(self, record):
+        #Handler.handle serializes emit with the handler lock, emit only needs the atomic deque operations.
+        filtered = self.filter(record)
+        if(filtered):
+            self.emit(filtered if isinstance(filtered, logging.LogRecord) else record)
+        return filtered
+
+    def _count_dropped(self):
+        with self._dropped_lock:
+            self.dropped += 1
+
+    def emit(self, record):
+        records = self._records
+        if(self.overflow != DROP_OLDEST and len(records) >= self.capacity):
+            self._count_dropped()
+            if(self.overflow == FALLBACK):
+                self.fallback_handler.handle(record)
+            return
+        try:
+            line = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+        if(self.overflow == DROP_OLDEST and len(records) == self.capacity):
+            self._count_dropped()
+        records.append(line)
+
+    def _run(self):
+        asyncio.run(self._ship())
+
+    async def _ship(self):
+        async with DiscordSupport(base_url=self._base_url) as support:
+            sink = WebhookSink(support, **self._sink_options)
+            try:
+                while(not self._stopping.is_set()):
+                    self._drain(sink)
+                    await asyncio.sleep(self.poll_interval)
+                self._drain(sink)
+            finally:
+                await sink.close()
+
+    def _drain(self, sink):
+        records = self._records
+        while(records):
+            sink.emit(self.webhook, records.popleft())
+
+    def flush(self):
+        """
+        Waits until the waiting records were handed to the sink, the sink itself flushes on its interval.
+        """
+        while(self._records and self._worker.is_alive()):
+            time.sleep(self.poll_interval)
+
+    def close(self, timeout=10.0):
+        """
+        Ships the remaining records and stops the worker, waiting at most timeout seconds.
+        """
+        self._stopping.set()
+        self._worker.join(timeout)
+        super().close()
@@ -0,0 +1,178 @@
+"""
+Fixed memory latency histograms of the requests sent to discord, keyed by route template, http method and status code.
+"""
+
+#Upper bounds in seconds of the buckets exported to prometheus.
+DEFAULT_EXPORT_BOUNDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class LatencyHistogram():
+    """
+    HDR style log-linear histogram of durations recorded with microsecond resolution up to highest seconds.
+    Values are counted in 2**sub_bucket_bits linear sub-buckets per power of two, so every recorded value is
+    kept within a relative error of 2**(1 - sub_bucket_bits)(1.6% by default) using a fixed array of counts.
+    """
+
+    __slots__ = ("sub_bucket_bits", "highest", "counts", "count", "total", "min", "max", "_half", "_full")
+
+    def __init__(self, highest=60.0, sub_bucket_bits=7):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.highest = int(highest * 1e6)
+        self._full = 1 << sub_bucket_bits
+        self._half = self._full >> 1
+        self.counts = [0] * (self._index(self.highest) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def _index(self, value):
+        if(value < self._full):
+            return value
+        exponent = value.bit_length() - self.sub_bucket_bits
+        return self._full + (exponent - 1) * self._half + (value >> exponent) - self._half
+
+    def _upper_value(self, index):
+        """
+        Highest value counted in the bucket at index.
+        """
+        if(index < self._full):
+            return index
+        exponent = (index - self._full) // self._half + 1
+        sub_bucket = (index - self._full) % self._half + self._half
+        return ((sub_bucket + 1) << exponent) - 1
+
+    def record(self, seconds):
+        value = min(max(int(seconds * 1e6), 0), self.highest)
+        self.counts[self._index(value)] += 1
+        self.count += 1
+        self.total += seconds
+        if(self.min is None or seconds < self.min):
+            self.min = seconds
+        if(self.max is None or seconds > self.max):
+            self.max = seconds
+
+    def percentile(self, percent):
+        """
+        Upper bound in seconds of the bucket holding the given percentile(0 - 100) of the recorded values.
+        """
+        if(not self.count):
+            return 0.0
+        rank = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if(seen >= rank):
+                return min(self._upper_value(index) / 1e6, self.max)
+        return self.max
+
+    def cumulative_counts(self, bounds=DEFAULT_EXPORT_BOUNDS):
+        """
+        Number of recorded values at or below each bound in seconds, as exported in prometheus buckets.
+        A bucket straddling a bound is counted with the next bound, within the precision of the histogram.
+        """
+        result = []
+        seen = 0
+        index = 0
+        for bound in bounds:
+            limit = min(int(bound * 1e6), self.highest)
+            while(index < len(self.counts) and self._upper_value(index) <= limit):
+                seen += self.counts[index]
+                index += 1
+            result.append(seen)
+        return result
+
+    def merge(self, other):
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        if(other.min is not None and (self.min is None or other.min < self.min)):
+            self.min = other.min
+        if(other.max is not None and (self.max is None or other.max > self.max)):
+            self.max = other.max
+
+    def reset(self):
+        self.counts = [0] * len(self.counts)
+        self.count = 0
+        self.total = 0.0
+        self.min = self.max = None
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+class RequestMetrics():
+    """
+    Latency histograms of the requests sent by DiscordSupport(pass it as metrics), one per
+    (http method, route template, status code). Requests which failed without a response are recorded with status 0.
+    """
+
+    def __init__(self, highest=60.0, sub_bucket_bits=7, export_bounds=DEFAULT_EXPORT_BOUNDS, namespace="apx_discord"):
+        self.highest = highest
+        self.sub_bucket_bits = sub_bucket_bits
+        self.export_bounds = export_bounds
+        self.namespace = namespace
+        self.histograms = {}
+
+    def record(self, method, route, status, seconds):
+        key = (method, route, status)
+        histogram = self.histograms.get(key)
+        if(histogram is None):
+            histogram = self.histograms[key] = LatencyHistogram(self.highest, self.sub_bucket_bits)
+        histogram.record(seconds)
+
+    def snapshot(self):
+        """
+        Pull API: one dict per (method, route, status) with the count, total and percentiles of its latency in seconds.
+        """
+        return [
+            {
+                "method": method, "route": route, "status": status,
+                "count": histogram.count, "sum": histogram.total,
+                "p50": histogram.percentile(50), "p90": histogram.percentile(90), "p99": histogram.percentile(99),
+                "max": histogram.max,
+            }
+            for (method, route, status), histogram in self.histograms.items()
+        ]
+
+    def top(self, limit=10, by="sum", status=None):
+        """
+        The limit entries of snapshot() with the highest value of by, e.g the routes spending the most time(by="sum"),
+        or the routes hitting the most rate limits(by="count", status=429).
+        """
+        entries = [entry for entry in self.snapshot() if status is None or entry["status"] == status]
+        return sorted(entries, key=lambda entry: entry[by], reverse=True)[:limit]
+
+    def reset(self):
+        self.histograms.clear()
+
+    def prometheus(self):
+        """
+        Prometheus text exposition of the histograms.
+        """
+        name = f"{self.namespace}_request_duration_seconds"
+        lines = [
+            f"# HELP {name} Latency of the requests sent to discord by route template, http method and status code.",
+            f"# TYPE {name} histogram",
+        ]
+        for (method, route, status), histogram in sorted(self.histograms.items(), key=lambda item: tuple(map(str, item[0]))):
+            labels = f'method="{_escape(method)}",route="{_escape(route)}",status="{status}"'
+            for bound, count in zip(self.export_bounds, histogram.cumulative_counts(self.export_bounds)):
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram.total}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    async def asgi(self, scope, receive, send):
+        """
+        ASGI application serving prometheus() to scrapers.
+        """
+        if(scope["type"] != "http"):
+            return
+        body = self.prometheus().encode()
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"text/plain; version=0.0.4"), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,440 @@
+"""
+Stand-in for the discord REST API serving every route of the related routes tables, to load test bots and
+DiscordSupport offline: python -m apx_httpdiscord._mock_server --port 8080
+then point DiscordSupport at base_url="http://127.0.0.1:8080/api/v10".
+"""
+
+import argparse
+import asyncio
+import hashlib
+import http
+import random
+import time
+import urllib.parse
+
+import msgspec
+
+from ._datamodels import JSONErrorCodes, RateLimitResponse
+from ._ratelimit import MAJOR_PARAMETERS, USER_SCOPE, GLOBAL_SCOPE, SHARED_SCOPE, GLOBAL_RATE_LIMIT
+from ._support import ROUTE_OWNERS, iter_routes
+from ._synthetic import SyntheticFactory
+
+_JSON_HEADERS = [(b"content-type", b"application/json")]
+
+def _error_body(status, code=0, message=None, errors=None):
+    body = {"message": message or f"{status}: {http.HTTPStatus(status).phrase}", "code": code}
+    if(errors is not None):
+        body["errors"] = errors
+    return msgspec.json.encode(body)
+
+def _multipart_payload(content_type, body):
+    """
+    Returns the payload_json part of a multipart/form-data body, None when there is none.
+    """
+    _, _, boundary = content_type.partition("boundary=")
+    delimiter = b"--" + boundary.strip('"').encode()
+    for part in body.split(delimiter):
+        head, _, content = part.partition(b"\r\n\r\n")
+        if(b'name="payload_json"' in head):
+            return content[:-2] if content.endswith(b"\r\n") else content
+    return None
+
+class _MockRoute():
+
+    __slots__ = ("url", "parts", "methods", "bucket_hash")
+
+    def __init__(self, url):
+        self.url = url
+        self.parts = [(part[1:-1] if part.startswith("{") else None, part) for part in str(url).split("/")]
+        self.methods = {}
+        self.bucket_hash = hashlib.sha1(str(url).encode()).hexdigest()[:16]
+
+    def match(self, segments):
+        values = {}
+        for (field, literal), segment in zip(self.parts, segments):
+            if(field is not None):
+                values[field] = segment
+            elif(literal != segment):
+                return None
+        return values
+
+class MockDiscordApp():
+    """
+    ASGI application registering every route of the related routes tables of owners. Requests are validated against
+    the declared payload, query parameters and required headers(400 with an Invalid Form Body error otherwise) and answered
+    with a synthetic instance of the declared return type, generated once per type from seed unless cache_responses is False.
+    Every bucket(route and major parameters) allows bucket_limit requests per bucket_window seconds(per route
+    overrides in rate_limits, a mapping of url templates to (limit, window)), every authorization global_limit requests
+    per second. Responses carry the X-RateLimit-* headers and exceeding a limit answers a 429 RateLimitResponse with its scope.
+    shared_429_probability is the chance a request is answered with a 429 of the shared scope, latency a delay added to every response.
+    """
+
+    def __init__(
+        self, owners=ROUTE_OWNERS, seed=0, base_path="/api/v10", bucket_limit=5, bucket_window=5.0, rate_limits=None,
+        global_limit=GLOBAL_RATE_LIMIT, shared_429_probability=0.0, shared_retry_after=1.0, latency=0.0, cache_responses=True,
+    ):
+        self.base_path = base_path.rstrip("/")
+        self.bucket_limit = bucket_limit
+        self.bucket_window = bucket_window
+        self.rate_limits = {str(url): limits for url, limits in (rate_limits or {}).items()}
+        self.global_limit = global_limit
+        self.shared_429_probability = shared_429_probability
+        self.shared_retry_after = shared_retry_after
+        self.latency = latency
+        self.cache_responses = cache_responses
+        self.factory = SyntheticFactory(seed)
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.invalid = 0
+        self.rate_limited = {USER_SCOPE: 0, GLOBAL_SCOPE: 0, SHARED_SCOPE: 0}
+        self._routes = {}  # number of path segments -> routes, the most literal first
+        self._buckets = {}  # (bucket hash, major values) -> [remaining, reset at]
+        self._global = {}  # authorization -> [remaining, reset at]
+        self._bodies = {}
+        self._decoders = {}
+
+        routes = {}
+        for url, method, route in iter_routes(owners):
+            mock_route = routes.get(str(url))
+            if(mock_route is None):
+                mock_route = routes[str(url)] = _MockRoute(url)
+            mock_route.methods[str(method)] = route
+        for mock_route in routes.values():
+            self._routes.setdefault(len(mock_route.parts), []).append(mock_route)
+        for candidates in self._routes.values():
+            candidates.sort(key=lambda mock_route: sum(field is not None for field, _ in mock_route.parts))
+
+    def find_route(self, path):
+        """
+        Returns the route matching path(relative to base_path) with the values of its placeholders, or (None, None).
+        """
+        segments = path.split("/")
+        for mock_route in self._routes.get(len(segments), ()):
+            values = mock_route.match(segments)
+            if(values is not None):
+                return mock_route, values
+        return None, None
+
+    async def __call__(self, scope, receive, send):
+        if(scope["type"] == "lifespan"):
+            return await self._lifespan(receive, send)
+        if(scope["type"] != "http"):
+            return
+        self.requests += 1
+        body = await self._read_body(receive)
+        status, headers, response = self.handle(scope, body)
+        if(self.latency):
+            await asyncio.sleep(self.latency)
+        headers.append((b"content-length", str(len(response)).encode()))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": response})
+
+    def handle(self, scope, body):
+        """
+        Returns the status, headers and body answering a request.
+        """
+        path = scope["path"]
+        if(not path.startswith(self.base_path)):
+            return 404, list(_JSON_HEADERS), _error_body(404)
+        mock_route, values = self.find_route(path[len(self.base_path):].rstrip("/") or "/")
+        if(mock_route is None):
+            return 404, list(_JSON_HEADERS), _error_body(404)
+        route = mock_route.methods.get(scope["method"])
+        if(route is None):
+            return 405, list(_JSON_HEADERS), _error_body(405)
+        headers = {name.decode("latin-1").lower(): value.decode("latin-1") for name, value in scope["headers"]}
+
+        limited = self._check_global(headers.get("authorization"))
+        if(limited is not None):
+            return limited
+        response_headers, limited = self._check_bucket(mock_route, values)
+        if(limited is not None):
+            return limited
+
+        errors = self._validate(route, scope, headers, body)
+        if(errors):
+            self.invalid += 1
+            return 400, _JSON_HEADERS + response_headers, _error_body(
+                400, JSONErrorCodes.INVALID_FORM_BODY_OR_CONTENT_TYPE, "Invalid Form Body", errors,
+            )
+
+        status, return_type = self._success(route, scope)
+        if(return_type is None):
+            return status, response_headers, b""
+        return status, _JSON_HEADERS + response_headers, self._response_body(return_type)
+
+    def _validate(self, route, scope, headers, body):
+        errors = {}
+        for name, (required, _) in route["additional_properties"].items():
+            if(required is not True):
+                continue
+            if(name == "Bearer"):
+                if(not headers.get("authorization", "").startswith("Bearer ")):
+                    errors["authorization"] = "a Bearer token is required"
+            elif(name.startswith("X-") and name.lower() not in headers):
+                errors[name] = "this header is required"
+
+        query_type = route["query_params"]
+        if(query_type is not None and scope.get("query_string")):
+            query = dict(urllib.parse.parse_qsl(scope["query_string"].decode("latin-1")))
+            try:
+                msgspec.convert(query, query_type, strict=False)
+            except msgspec.ValidationError as error:
+                errors["query"] = str(error)
+
+        payload_type = route["payload"]
+        if(payload_type is not None):
+            content_type = headers.get("content-type", "")
+            if(content_type.startswith("multipart/form-data")):
+                body = _multipart_payload(content_type, body)
+            if(not body):
+                errors["body"] = "a body is required"
+            else:
+                decoder = self._decoders.get(payload_type)
+                if(decoder is None):
+                    decoder = self._decoders[payload_type] = msgspec.json.Decoder(payload_type)
+                try:
+                    decoder.decode(body)
+                except msgspec.DecodeError as error:
+                    errors["body"] = str(error)
+        return errors
+
+    @staticmethod
+    def _success(route, scope):
+        """
+        The status and return type of a successful response, 204 for webhook executions without wait=true.
+        """
+        statuses = route["statuscode_returntype_map"]
+        if(204 in statuses and len(statuses) > 1):
+            query = urllib.parse.parse_qs(scope.get("query_string", b"").decode("latin-1"))
+            if(query.get("wait", ["false"])[-1].lower() != "true"):
+                return 204, None
+        for status, return_type in statuses.items():
+            if(return_type is not None):
+                return status, return_type
+        return next(iter(statuses)), None
+
+    def _response_body(self, return_type):
+        if(not self.cache_responses):
+            return self.factory.encode(return_type)
+        body = self._bodies.get(return_type)
+        if(body is None):
+            body = self._bodies[return_type] = self.factory.encode(return_type)
+        return body
+
+    def _rate_limited(self, scope, retry_after, headers):
+        self.rate_limited[scope] += 1
+        retry_after = round(retry_after, 3)
+        headers = _JSON_HEADERS + headers + [
+            (b"retry-after", str(max(1, int(-(-retry_after // 1)))).encode()),
+            (b"x-ratelimit-scope", scope.encode()),
+        ]
+        if(scope == GLOBAL_SCOPE):
+            headers.append((b"x-ratelimit-global", b"true"))
+        body = msgspec.json.encode(RateLimitResponse(
+            message="You are being rate limited.", retry_after=retry_after, global_limit=scope == GLOBAL_SCOPE,
+        ))
+        return 429, headers, body
+
+    def _check_global(self, authorization):
+        if(not self.global_limit):
+            return None
+        now = time.monotonic()
+        window = self._global.get(authorization)
+        if(window is None or window[1] <= now):
+            window = self._global[authorization] = [self.global_limit, now + 1.0]
+        if(window[0] == 0):
+            return self._rate_limited(GLOBAL_SCOPE, window[1] - now, [])
+        window[0] -= 1
+        return None
+
+    def _check_bucket(self, mock_route, values):
+        now = time.monotonic()
+        limit, period = self.rate_limits.get(str(mock_route.url), (self.bucket_limit, self.bucket_window))
+        major = tuple(value for field, value in values.items() if field.split(".", 1)[0] in MAJOR_PARAMETERS)
+        key = (mock_route.bucket_hash, major)
+        bucket = self._buckets.get(key)
+        if(bucket is None or bucket[1] <= now):
+            bucket = self._buckets[key] = [limit, now + period]
+        reset_after = bucket[1] - now
+        limited = bucket[0] == 0
+        if(not limited):
+            bucket[0] -= 1
+        headers = [
+            (b"x-ratelimit-limit", str(limit).encode()),
+            (b"x-ratelimit-remaining", str(bucket[0]).encode()),
+            (b"x-ratelimit-reset", f"{time.time() + reset_after:.3f}".encode()),
+            (b"x-ratelimit-reset-after", f"{reset_after:.3f}".encode()),
+            (b"x-ratelimit-bucket", mock_route.bucket_hash.encode()),
+        ]
+        if(limited):
+            return headers, self._rate_limited(USER_SCOPE, reset_after, headers)
+        if(self.shared_429_probability and self.random.random() < self.shared_429_probability):
+            return headers, self._rate_limited(SHARED_SCOPE, self.shared_retry_after, headers)
+        return headers, None
+
+    @staticmethod
+    async def _read_body(receive):
+        chunks = []
+        while(True):
+            message = await receive()
+            if(message["type"] == "http.disconnect"):
+                break
+            chunks.append(message.get("body", b""))
+            if(not message.get("more_body", False)):
+                break
+        return b"".join(chunks)
+
+    @staticmethod
+    async def _lifespan(receive, send):
+        while(True):
+            message = await receive()
+            if(message["type"] == "lifespan.startup"):
+                await send({"type": "lifespan.startup.complete"})
+            elif(message["type"] == "lifespan.shutdown"):
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+class MockDiscordServer():
+    """
+    Minimal HTTP/1.1 server(keep-alive, Content-Length and chunked request bodies) running an ASGI app on the
+    current event loop, so the mock needs no ASGI server. port 0 picks a free port, see url.
+    """
+
+    def __init__(self, app=None, host="127.0.0.1", port=0):
+        self.app = app if app is not None else MockDiscordApp()
+        self.host = host
+        self.port = port
+        self._server = None
+
+    @property
+    def url(self):
+        """
+        Base url to pass to DiscordSupport.
+        """
+        return f"http://{self.host}:{self.port}{getattr(self.app, 'base_path', '')}"
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._serve, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self):
+        if(self._server is not None):
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def serve_forever(self):
+        if(self._server is None):
+            await self.start()
+        await self._server.serve_forever()
+
+    async def _serve(self, reader, writer):
+        try:
+            while(True):
+                request_line = await reader.readline()
+                if(not request_line.strip()):
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = []
+                length = 0
+                chunked = False
+                keep_alive = True
+                while((line := await reader.readline()) not in (b"\r\n", b"\n", b"")):
+                    name, _, value = line.partition(b":")
+                    name = name.strip().lower()
+                    value = value.strip()
+                    headers.append((name, value))
+                    if(name == b"content-length"):
+                        length = int(value)
+                    elif(name == b"transfer-encoding"):
+                        chunked = b"chunked" in value.lower()
+                    elif(name == b"connection"):
+                        keep_alive = value.lower() != b"close"
+                body = await self._read_chunked(reader) if chunked else await reader.readexactly(length)
+                path, _, query = target.partition("?")
+                scope = {
+                    "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": method,
+                    "scheme": "http", "path": urllib.parse.unquote(path), "raw_path": path.encode(),
+                    "query_string": query.encode("latin-1"), "headers": headers,
+                    "server": (self.host, self.port), "client": writer.get_extra_info("peername"),
+                }
+                await self._dispatch(scope, body, writer)
+                if(not keep_alive):
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_chunked(reader):
+        chunks = []
+        while(True):
+            size = int((await reader.readline()).split(b";", 1)[0], 16)
+            if(size == 0):
+                while((await reader.readline()) not in (b"\r\n", b"\n", b"")):
+                    pass
+                return b"".join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+
+    async def _dispatch(self, scope, body, writer):
+        received = False
+        start = {}
+
+        async def receive():
+            nonlocal received
+            if(received):
+                return {"type": "http.disconnect"}
+            received = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send(message):
+            if(message["type"] == "http.response.start"):
+                start.update(message)
+                return
+            status = start["status"]
+            lines = [f"HTTP/1.1 {status} {http.HTTPStatus(status).phrase}".encode()]
+            lines.extend(name + b": " + value for name, value in start.get("headers", ()))
+            writer.write(b"\r\n".join(lines) + b"\r\n\r\n" + message.get("body", b""))
+            await writer.drain()
+
+        await self.app(scope, receive, send)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--bucket-limit", type=int, default=5)
+    parser.add_argument("--bucket-window", type=float, default=5.0)
+    parser.add_argument("--global-limit", type=int, default=GLOBAL_RATE_LIMIT, help="0 disables the global limit")
+    parser.add_argument("--shared-429-probability", type=float, default=0.0)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    args = parser.parse_args()
+
+    app = MockDiscordApp(
+        seed=args.seed, bucket_limit=args.bucket_limit, bucket_window=args.bucket_window, global_limit=args.global_limit,
+        shared_429_probability=args.shared_429_probability, latency=args.latency,
+    )
+    server = MockDiscordServer(app, args.host, args.port)
+
+    async def run():
+        await server.start()
+        print(f"mock discord api listening on {server.url}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
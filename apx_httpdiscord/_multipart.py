@@ -0,0 +1,145 @@
+"""
+Streaming multipart/form-data encoding for the JSON params classes carrying a file_locations field
+(e.g Channel.ExecuteWebhookJSONParams, Interaction.CreateFollowupMessageJSONParams).
+The file_locations field is local to this package and is never sent to discord, the files it points to are
+sent as files[n] parts and wired to the attachments field of the payload_json part.
+"""
+
+import asyncio
+import mimetypes
+import os
+import uuid
+
+import msgspec
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+def payload_to_builtins(payload):
+    """
+    Converts a JSON params msgspec class into builtin types, without the local only file_locations field.
+    """
+    if(payload is None):
+        return None
+    data = msgspec.to_builtins(payload)
+    if(isinstance(data, dict)):
+        data.pop("file_locations", None)
+    return data
+
+def link_attachments(data, file_locations):
+    """
+    Wires the attachments field of the payload to the files[n] parts.
+    An attachment whose filename matches the basename of a file location is given the id n of that file,
+    files without a matching attachment get a new attachment entry appended.
+    Returns the list of (n, filename) pairs in the order the files are sent.
+    """
+    attachments = data.get("attachments") or []
+    by_filename = {}
+    for attachment in attachments:
+        if(attachment.get("url") is None and "filename" in attachment):
+            by_filename.setdefault(attachment["filename"], attachment)
+
+    parts = []
+    for n, location in enumerate(file_locations):
+        filename = os.path.basename(location)
+        attachment = by_filename.pop(filename, None)
+        if(attachment is None):
+            attachment = {"filename": filename}
+            attachments.append(attachment)
+        attachment["id"] = n
+        parts.append((n, filename))
+    data["attachments"] = attachments
+    return parts
+
+class MultipartEncoder():
+    """
+    Streams a multipart/form-data body made of a payload_json part followed by one files[n] part per file location.
+    Files are read from disk in chunk_size blocks(or handed to os.sendfile by the event loop on plain TCP transports),
+    so the memory used is independent of the file sizes. The encoder is replayable, every iteration re-opens the files.
+    """
+
+    def __init__(self, payload, file_locations=None, boundary=None, chunk_size=DEFAULT_CHUNK_SIZE, sizes=None, on_progress=None):
+        if(file_locations is None):
+            file_locations = getattr(payload, "file_locations", None) or []
+        self.file_locations = list(file_locations)
+        self.boundary = boundary or uuid.uuid4().hex
+        self.chunk_size = chunk_size
+        self.on_progress = on_progress  # called as on_progress(n, file_location, bytes_sent, file_size)
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+
+        data = payload_to_builtins(payload) or {}
+        self.files = link_attachments(data, self.file_locations) if self.file_locations else []
+        self.payload_json = msgspec.json.encode(data)
+
+        self.sizes = list(sizes) if sizes is not None else [os.stat(location).st_size for location in self.file_locations]
+        self._heads = [self._file_head(n, filename) for n, filename in self.files]
+        self._payload_part = (
+            f"--{self.boundary}\r\n"
+            'Content-Disposition: form-data; name="payload_json"\r\n'
+            "Content-Type: application/json\r\n\r\n"
+        ).encode() + self.payload_json + b"\r\n"
+        self._tail = f"--{self.boundary}--\r\n".encode()
+        self.content_length = (
+            len(self._payload_part)
+            + sum(len(head) + size + 2 for head, size in zip(self._heads, self.sizes))
+            + len(self._tail)
+        )
+
+    def _file_head(self, n, filename):
+        content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        quoted = filename.replace("\\", "\\\\").replace('"', '\\"')
+        return (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="files[{n}]"; filename="{quoted}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode()
+
+    @property
+    def headers(self):
+        return {"Content-Type": self.content_type, "Content-Length": str(self.content_length)}
+
+    def __iter__(self):
+        """
+        Yields the body in chunks, for transports accepting an iterable body.
+        Raises ValueError when a file is shorter than its size announced in content_length.
+        """
+        yield self._payload_part
+        for head, location, size in zip(self._heads, self.file_locations, self.sizes):
+            yield head
+            with open(location, "rb") as file:
+                remaining = size
+                while(remaining):
+                    chunk = file.read(min(self.chunk_size, remaining))
+                    if(not chunk):
+                        raise ValueError(f"file truncated: {location}")
+                    remaining -= len(chunk)
+                    yield chunk
+            yield b"\r\n"
+        yield self._tail
+
+    async def write(self, writer):
+        """
+        Writes the body to an asyncio StreamWriter.
+        The file contents are sent with loop.sendfile, which uses os.sendfile where the transport allows
+        and falls back to chunked reads(e.g on TLS transports).
+        Raises ValueError when a file is shorter than its size announced in content_length.
+        """
+        loop = asyncio.get_running_loop()
+        writer.write(self._payload_part)
+        for n, (head, location, size) in enumerate(zip(self._heads, self.file_locations, self.sizes)):
+            writer.write(head)
+            await writer.drain()
+            with open(location, "rb") as file:
+                offset = 0
+                while(offset < size):
+                    count = min(self.chunk_size, size - offset)
+                    sent = await loop.sendfile(writer.transport, file, offset, count)
+                    if(not sent):
+                        #The file shrank since its size was read, sendfile returns 0 at its end.
+                        raise ValueError(f"file truncated: {location}")
+                    offset += sent
+                    if(self.on_progress is not None):
+                        self.on_progress(n, location, offset, size)
+            writer.write(b"\r\n")
+        writer.write(self._tail)
+        await writer.drain()
+
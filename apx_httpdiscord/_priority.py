@@ -0,0 +1,46 @@
+"""
+Priority classes of the requests sent by DiscordSupport, lower classes are sent first when requests wait
+for the same rate limit bucket or for the global limit.
+"""
+
+from ._datamodels import HttpMethods, Interaction, Application, Channel, Guild
+
+#Interaction callbacks and follow-ups, discord drops the interaction when the callback is late.
+INTERACTION_PRIORITY = 0
+#Messages users are waiting for, e.g webhook executions.
+MESSAGE_PRIORITY = 1
+DEFAULT_PRIORITY = 2
+#Bulk administration jobs such as audit log pulls and command syncs.
+BULK_PRIORITY = 3
+
+#Seconds of waiting worth one priority class: a request overtakes the requests of a higher class
+#which started waiting less than aging seconds per class after it, so lower classes are delayed but never starved.
+PRIORITY_AGING = 2.0
+
+_ROUTES = {
+    (HttpMethods.POST, Interaction.InteractionUrls.CREATE_INTERACTION_RESPONSE): INTERACTION_PRIORITY,
+    (HttpMethods.GET, Interaction.InteractionUrls.GET_ORIGINAL_INTERACTION_RESPONSE): INTERACTION_PRIORITY,
+    (HttpMethods.PATCH, Interaction.InteractionUrls.EDIT_ORIGINAL_INTERACTION_RESPONSE): INTERACTION_PRIORITY,
+    (HttpMethods.DELETE, Interaction.InteractionUrls.DELETE_ORIGINAL_INTERACTION_RESPONSE): INTERACTION_PRIORITY,
+    (HttpMethods.POST, Interaction.InteractionUrls.CREATE_FOLLOWUP_MESSAGE): INTERACTION_PRIORITY,
+    (HttpMethods.GET, Interaction.InteractionUrls.GET_FOLLOWUP_MESSAGE): INTERACTION_PRIORITY,
+    (HttpMethods.PATCH, Interaction.InteractionUrls.EDIT_FOLLOWUP_MESSAGE): INTERACTION_PRIORITY,
+    (HttpMethods.DELETE, Interaction.InteractionUrls.DELETE_FOLLOWUP_MESSAGE): INTERACTION_PRIORITY,
+
+    (HttpMethods.POST, Channel.WebhookUrls.EXECUTE_WEBHOOK): MESSAGE_PRIORITY,
+    (HttpMethods.POST, Channel.WebhookUrls.EXECUTE_SLACK_COMPATIBLE_WEBHOOK): MESSAGE_PRIORITY,
+    (HttpMethods.POST, Channel.WebhookUrls.EXECUTE_GITHUB_COMPATIBLE_WEBHOOK): MESSAGE_PRIORITY,
+    (HttpMethods.PATCH, Channel.WebhookUrls.EDIT_WEBHOOK_MESSAGE): MESSAGE_PRIORITY,
+
+    (HttpMethods.PUT, Application.ApplicationCommandUrls.BULK_OVERWRITE_GLOBAL_APPLICATION_COMMANDS): BULK_PRIORITY,
+    (HttpMethods.PUT, Guild.ApplicationCommandUrls.BULK_OVERWRITE_GUILD_APPLICATION_COMMANDS): BULK_PRIORITY,
+    (HttpMethods.GET, Guild.AuditLogUrls.GET_GUILD_AUDIT_LOG): BULK_PRIORITY,
+}
+#(http method, url template) -> priority class, other routes get DEFAULT_PRIORITY.
+ROUTE_PRIORITIES = {(str(method), str(url)): priority for (method, url), priority in _ROUTES.items()}
+
+def route_priority(url_method, url):
+    """
+    Priority class of a request to url with url_method.
+    """
+    return ROUTE_PRIORITIES.get((str(url_method), str(url)), DEFAULT_PRIORITY)
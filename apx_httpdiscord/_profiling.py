@@ -0,0 +1,128 @@
+"""
+Opt-in profiling of the cost of decoding discord JSON bodies, by decoded type.
+"""
+
+import enum
+import sys
+import time
+import types
+import typing
+
+import msgspec
+
+def type_name(type):
+    """
+    Short name of a decoded type, e.g "Message", "list[Message]" or "Message | None".
+    """
+    if(type is typing.Any):
+        return "Any"
+    origin = typing.get_origin(type)
+    if(origin in (typing.Union, types.UnionType)):
+        return " | ".join(type_name(arg) for arg in typing.get_args(type))
+    if(origin is not None):
+        return f"{type_name(origin)}[{', '.join(type_name(arg) for arg in typing.get_args(type))}]"
+    if(type is None or type is types.NoneType):
+        return "None"
+    return getattr(type, "__qualname__", None) or str(type)
+
+def deep_sizeof(obj):
+    """
+    Bytes held by obj and every object it references(struct fields, container items), each object counted once.
+    Enum members, None and booleans are shared and not counted.
+    """
+    size = 0
+    seen = set()
+    stack = [obj]
+    while(stack):
+        obj = stack.pop()
+        if(obj is None or obj is True or obj is False or isinstance(obj, enum.Enum) or id(obj) in seen):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if(isinstance(obj, msgspec.Struct)):
+            stack.extend(getattr(obj, field) for field in obj.__struct_fields__)
+        elif(isinstance(obj, dict)):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif(isinstance(obj, (list, tuple, set, frozenset))):
+            stack.extend(obj)
+    return size
+
+class DecodeStats():
+
+    __slots__ = ("count", "bytes", "time", "size", "peak_size", "peak_bytes")
+
+    def __init__(self):
+        self.count = 0
+        self.bytes = 0
+        self.time = 0.0
+        self.size = 0
+        self.peak_size = 0
+        self.peak_bytes = 0
+
+class DecodeProfiler():
+    """
+    Decodes JSON bodies like msgspec.json.decode while recording, per decoded type, the count of bodies, their total
+    bytes, the total decode time and the deep size of the decoded objects(the largest one as peak_size).
+    Pass it as the decode_profiler of DiscordSupport or InteractionsApp, then rank the types with report().
+    measure_size=False skips the deep size walk, which costs more than most decodes.
+    """
+
+    def __init__(self, measure_size=True):
+        self.measure_size = measure_size
+        self.stats = {}
+        self._decoders = {}
+
+    def decode(self, body, type=typing.Any):
+        decoder = self._decoders.get(type)
+        if(decoder is None):
+            decoder = self._decoders[type] = msgspec.json.Decoder(type)
+        started = time.perf_counter()
+        result = decoder.decode(body)
+        elapsed = time.perf_counter() - started
+        self.record(type, len(body), elapsed, result)
+        return result
+
+    def record(self, type, nbytes, seconds, result=None):
+        stats = self.stats.get(type)
+        if(stats is None):
+            stats = self.stats[type] = DecodeStats()
+        stats.count += 1
+        stats.bytes += nbytes
+        stats.time += seconds
+        stats.peak_bytes = max(stats.peak_bytes, nbytes)
+        if(self.measure_size and result is not None):
+            size = deep_sizeof(result)
+            stats.size += size
+            stats.peak_size = max(stats.peak_size, size)
+
+    def report(self, limit=None, by="time"):
+        """
+        One dict per decoded type ranked by the value of by(e.g "time", "count", "bytes" or "peak_size"),
+        with the mean decode time and the decode throughput in bytes per second.
+        """
+        entries = [
+            {
+                "type": type_name(type), "count": stats.count, "bytes": stats.bytes, "time": stats.time,
+                "mean_time": stats.time / stats.count, "throughput": stats.bytes / stats.time if stats.time else 0.0,
+                "mean_size": stats.size / stats.count, "peak_size": stats.peak_size, "peak_bytes": stats.peak_bytes,
+            }
+            for type, stats in self.stats.items()
+        ]
+        entries.sort(key=lambda entry: entry[by], reverse=True)
+        return entries[:limit] if limit is not None else entries
+
+    def format_report(self, limit=None, by="time"):
+        """
+        report() as a text table.
+        """
+        lines = [f"{'type':40} {'count':>8} {'bytes':>12} {'total ms':>10} {'mean us':>9} {'MB/s':>8} {'mean size':>10} {'peak size':>10}"]
+        for entry in self.report(limit, by):
+            lines.append(
+                f"{entry['type'][:40]:40} {entry['count']:>8} {entry['bytes']:>12} {entry['time'] * 1e3:>10.2f} "
+                f"{entry['mean_time'] * 1e6:>9.1f} {entry['throughput'] / 1e6:>8.1f} {entry['mean_size']:>10.0f} {entry['peak_size']:>10}"
+            )
+        return "\n".join(lines)
+
+    def reset(self):
+        self.stats.clear()
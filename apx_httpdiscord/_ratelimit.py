@@ -0,0 +1,348 @@
+"""
+Client side accounting of the discord rate limits, from the X-RateLimit-* response headers and 429 responses.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+
+import msgspec
+
+from ._datamodels import RateLimitResponse
+from ._priority import DEFAULT_PRIORITY, PRIORITY_AGING
+
+#Placeholder roots of the major parameters, requests to the same route with other major parameters are limited separately.
+MAJOR_PARAMETERS = frozenset(("channel", "guild", "webhook", "interaction"))
+
+#Requests per second allowed by the global rate limit of a bot.
+GLOBAL_RATE_LIMIT = 50
+
+#Scopes of a 429 response(X-RateLimit-Scope): the per route limit of the bot, the global limit of the bot,
+#or the limit shared by every user of a resource, which does not count against the bot.
+USER_SCOPE = "user"
+GLOBAL_SCOPE = "global"
+SHARED_SCOPE = "shared"
+
+_rate_limit_decoder = msgspec.json.Decoder(RateLimitResponse)
+
+#Tie breaker of the waiters with the same sort key, in arrival order.
+_sequence = itertools.count()
+
+class _PriorityWaiters():
+    """
+    Requests waiting for a limit, granted by the limit itself in priority order instead of racing for it.
+    A waiter of priority class p arriving at t is sorted by t + p * aging, so a lower class goes first but a request
+    waiting longer than aging seconds per class of difference is not overtaken anymore.
+    Subclasses implement _take(now), taking a request from the limit when it allows one, _give_back(), undoing _take
+    for a request cancelled right after it was granted, and _next_at(now), when the limit may allow a request again.
+    """
+
+    __slots__ = ("aging", "_waiters", "_timer", "_timer_at")
+
+    def __init__(self, aging):
+        self.aging = aging
+        self._waiters = []  # heap of (sort key, sequence, future)
+        self._timer = None
+        self._timer_at = None
+
+    async def _wait(self, priority):
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (time.monotonic() + priority * self.aging, next(_sequence), waiter))
+        self._dispatch()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if(waiter.done() and not waiter.cancelled()):
+                self._give_back()
+            self._dispatch()
+            raise
+
+    def _dispatch(self):
+        waiters = self._waiters
+        now = time.monotonic()
+        while(waiters):
+            waiter = waiters[0][2]
+            if(waiter.done()):
+                heapq.heappop(waiters)
+                continue
+            if(not self._take(now)):
+                break
+            heapq.heappop(waiters)
+            waiter.set_result(None)
+        if(not waiters):
+            return
+        #Without a time the limit is waiting for a release, which dispatches again.
+        at = self._next_at(now)
+        if(at is None or (self._timer_at is not None and self._timer_at <= at)):
+            return
+        if(self._timer is not None):
+            self._timer.cancel()
+        self._timer_at = at
+        self._timer = asyncio.get_running_loop().call_later(max(at - now, 0.0), self._expire)
+
+    def _expire(self):
+        self._timer = self._timer_at = None
+        self._dispatch()
+
+class Bucket(_PriorityWaiters):
+    """
+    Rate limit bucket of a route and its major parameters.
+    Until the first response tells the limit of the bucket, a single request is let through at a time.
+    Waiting requests are let through in priority order, see _PriorityWaiters.
+    route is the (http method, url template) the bucket was discovered by, queued the requests waiting in
+    RateLimiter.acquire, wait_time the seconds they waited in total and rate_limited the 429s by scope.
+    """
+
+    __slots__ = (
+        "key", "route", "limit", "remaining", "reset_at", "window", "inflight", "queued", "requests", "wait_time",
+        "rate_limited",
+    )
+
+    def __init__(self, key, route=None, aging=PRIORITY_AGING):
+        super().__init__(aging)
+        self.key = key
+        self.route = route
+        self.limit = None
+        self.remaining = None
+        self.reset_at = 0.0
+        self.window = 0.0
+        self.inflight = 0
+        self.queued = 0
+        self.requests = 0
+        self.wait_time = 0.0
+        self.rate_limited = {USER_SCOPE: 0, GLOBAL_SCOPE: 0, SHARED_SCOPE: 0}
+
+    @property
+    def idle(self):
+        return self.inflight == 0 and self.queued == 0 and self.reset_at <= time.monotonic()
+
+    async def acquire(self, priority=DEFAULT_PRIORITY):
+        if(self._waiters or not self._take(time.monotonic())):
+            await self._wait(priority)
+
+    def _take(self, now):
+        if(self.reset_at <= now and self.remaining is not None and self.remaining != self.limit):
+            #A new window starts with this request, it lasts until the responses tell its actual reset.
+            self.remaining = self.limit
+            if(self.limit is not None):
+                self.reset_at = now + self.window
+        if(self.remaining is None):
+            if(self.reset_at > now or self.inflight > 0):
+                return False
+        elif(self.remaining > 0):
+            self.remaining -= 1
+        else:
+            return False
+        self.inflight += 1
+        return True
+
+    def _give_back(self):
+        self.inflight -= 1
+        if(self.remaining is not None and (self.limit is None or self.remaining < self.limit)):
+            self.remaining += 1
+
+    def _next_at(self, now):
+        return self.reset_at if self.reset_at > now else None
+
+    def release(self):
+        self.inflight -= 1
+        self._dispatch()
+
+    def update(self, limit, remaining, reset_after):
+        now = time.monotonic()
+        self.limit = limit
+        #Requests still in flight were already counted by acquire but not by discord yet, also across a window reset.
+        self.remaining = remaining if self.remaining is None else min(self.remaining, remaining)
+        self.reset_at = now + reset_after
+        self.window = max(self.window, reset_after)
+
+    def block(self, retry_after):
+        self.remaining = 0
+        self.reset_at = max(self.reset_at, time.monotonic() + retry_after)
+        self._dispatch()
+
+    def snapshot(self, now=None):
+        if(now is None):
+            now = time.monotonic()
+        method, url = self.route or (None, None)
+        return {
+            "bucket": self.key[0], "major": self.key[1], "method": method, "route": url,
+            "limit": self.limit, "remaining": self.remaining, "reset_after": max(self.reset_at - now, 0.0),
+            "inflight": self.inflight, "queued": self.queued, "requests": self.requests, "wait_time": self.wait_time,
+            "rate_limited": dict(self.rate_limited),
+        }
+
+class GlobalLimiter(_PriorityWaiters):
+    """
+    Token bucket of rate requests per second, paused entirely when discord reports the global limit was hit.
+    Waiting requests get the tokens in priority order, see _PriorityWaiters.
+    """
+
+    def __init__(self, rate=GLOBAL_RATE_LIMIT, aging=PRIORITY_AGING):
+        super().__init__(aging)
+        self.rate = rate
+        self.wait_time = 0.0
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    async def acquire(self, priority=DEFAULT_PRIORITY):
+        started = time.monotonic()
+        if(not self._waiters and self._take(started)):
+            return
+        try:
+            await self._wait(priority)
+        finally:
+            self.wait_time += time.monotonic() - started
+
+    def _take(self, now):
+        if(self._paused_until > now):
+            return False
+        self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if(self._tokens < 1):
+            return False
+        self._tokens -= 1
+        return True
+
+    def _give_back(self):
+        self._tokens += 1
+
+    def _next_at(self, now):
+        if(self._paused_until > now):
+            return self._paused_until
+        return now + (1 - self._tokens) / self.rate
+
+    def pause(self, retry_after):
+        self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+
+    def snapshot(self, now=None):
+        if(now is None):
+            now = time.monotonic()
+        tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate)
+        return {"rate": self.rate, "tokens": tokens, "paused_for": max(self._paused_until - now, 0.0), "wait_time": self.wait_time}
+
+class RateLimiter():
+    """
+    Waits before a request until its bucket and the global limit allow it, and updates them from the response.
+    Buckets are found by (http method, url template) until discord names the bucket of a route(X-RateLimit-Bucket),
+    both keyed with the major parameters of the request. Idle buckets are dropped once there are more than max_buckets.
+    global_rate of None disables the global limit. Requests competing for a bucket or the global limit are let
+    through by priority class(see _priority), priority_aging seconds of waiting being worth one class.
+    Statistics of the buckets and of the 429s by scope are kept as plain counters, polled with snapshot().
+    """
+
+    def __init__(self, global_rate=GLOBAL_RATE_LIMIT, max_buckets=10_000, priority_aging=PRIORITY_AGING):
+        self.global_limiter = GlobalLimiter(global_rate, priority_aging) if global_rate else None
+        self.max_buckets = max_buckets
+        self.priority_aging = priority_aging
+        self.buckets = {}
+        self._bucket_hashes = {}  # (method, url template) -> X-RateLimit-Bucket
+        self.rate_limited = 0
+        self.rate_limited_scopes = {USER_SCOPE: 0, GLOBAL_SCOPE: 0, SHARED_SCOPE: 0}
+
+    def bucket_key(self, route_key, major):
+        """
+        Key of the bucket of a route and its major parameters, the X-RateLimit-Bucket of the route once discord named it.
+        """
+        return (self._bucket_hashes.get(route_key, route_key), major)
+
+    def get_bucket(self, route_key, major):
+        key = self.bucket_key(route_key, major)
+        bucket = self.buckets.get(key)
+        if(bucket is None):
+            if(len(self.buckets) >= self.max_buckets):
+                self._sweep()
+            bucket = self.buckets[key] = Bucket(key, route_key, self.priority_aging)
+        return bucket
+
+    def _sweep(self):
+        for key in [key for key, bucket in self.buckets.items() if bucket.idle]:
+            del self.buckets[key]
+
+    async def acquire(self, route_key, major, priority=DEFAULT_PRIORITY):
+        bucket = self.get_bucket(route_key, major)
+        bucket.queued += 1
+        started = time.monotonic()
+        try:
+            await bucket.acquire(priority)
+            if(self.global_limiter is not None):
+                try:
+                    await self.global_limiter.acquire(priority)
+                except BaseException:
+                    bucket.release()
+                    raise
+        finally:
+            bucket.queued -= 1
+            bucket.wait_time += time.monotonic() - started
+        bucket.requests += 1
+        return bucket
+
+    def release(self, bucket, route_key, response):
+        """
+        Releases bucket after the response(None when the request failed) of the request it was acquired for.
+        Returns the seconds to wait before retrying when the response is a 429.
+        """
+        acquired = bucket
+        try:
+            if(response is None):
+                return None
+            headers = response.headers
+            bucket_hash = headers.get("x-ratelimit-bucket")
+            if(bucket_hash is not None and self._bucket_hashes.get(route_key) != bucket_hash):
+                self._bucket_hashes[route_key] = bucket_hash
+                key = (bucket_hash, bucket.key[1])
+                bucket = self.buckets.setdefault(key, bucket)
+                bucket.key = key
+            if("x-ratelimit-remaining" in headers):
+                bucket.update(
+                    int(headers.get("x-ratelimit-limit", 1)),
+                    int(headers["x-ratelimit-remaining"]),
+                    float(headers.get("x-ratelimit-reset-after", 0)),
+                )
+            if(response.status != 429):
+                return None
+
+            retry_after = float(headers.get("retry-after", 1))
+            is_global = headers.get("x-ratelimit-global") == "true"
+            try:
+                body = _rate_limit_decoder.decode(response.body)
+                retry_after = body.retry_after
+                is_global = is_global or body.global_limit
+            except msgspec.DecodeError:
+                pass
+            scope = headers.get("x-ratelimit-scope") or (GLOBAL_SCOPE if is_global else USER_SCOPE)
+            self.rate_limited += 1
+            self.rate_limited_scopes[scope] = self.rate_limited_scopes.get(scope, 0) + 1
+            bucket.rate_limited[scope] = bucket.rate_limited.get(scope, 0) + 1
+            if(is_global):
+                if(self.global_limiter is not None):
+                    self.global_limiter.pause(retry_after)
+            else:
+                bucket.block(retry_after)
+            return retry_after
+        finally:
+            acquired.release()
+
+    def snapshot(self):
+        """
+        Pull API: the totals of the limiter and one dict per bucket with its limit, remaining requests,
+        seconds until reset, requests in flight and queued, cumulative wait time and 429s by scope.
+        Only counters are read, so it is cheap enough to poll, buckets swept as idle take their statistics with them.
+        """
+        now = time.monotonic()
+        return {
+            "rate_limited": self.rate_limited,
+            "rate_limited_scopes": dict(self.rate_limited_scopes),
+            "global": self.global_limiter.snapshot(now) if self.global_limiter is not None else None,
+            #A bucket stays registered by its route until it is swept, besides its X-RateLimit-Bucket.
+            "buckets": [bucket.snapshot(now) for bucket in {id(bucket): bucket for bucket in self.buckets.values()}.values()],
+        }
+
+    def top(self, limit=10, by="wait_time"):
+        """
+        The limit buckets of snapshot() with the highest value of by, e.g the buckets where requests waited the longest
+        (by="wait_time") or the most crowded ones(by="queued").
+        """
+        return sorted(self.snapshot()["buckets"], key=lambda entry: entry[by], reverse=True)[:limit]
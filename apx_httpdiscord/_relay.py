@@ -0,0 +1,317 @@
+"""
+Relay of GitHub and Slack event bodies to the compatible webhook endpoints of discord webhooks.
+"""
+
+import asyncio
+import collections
+import hashlib
+import hmac
+import logging
+import urllib.parse
+
+import msgspec
+
+from ._datamodels import HttpMethods, Channel, JSONErrorCodes
+from ._errors import ApxHttpDiscordError, HTTPException
+from ._retry import RETRYABLE_ERRORS
+
+logger = logging.getLogger(__name__)
+
+GITHUB = "github"
+SLACK = "slack"
+
+_COMPATIBLE_URLS = {
+    GITHUB: Channel.WebhookUrls.EXECUTE_GITHUB_COMPATIBLE_WEBHOOK,
+    SLACK: Channel.WebhookUrls.EXECUTE_SLACK_COMPATIBLE_WEBHOOK,
+}
+
+#Attachments discord renders from one Slack message, one embed each.
+SLACK_ATTACHMENTS_LIMIT = 10
+
+#Returned by RelayApp._read_body when the client disconnected before sending the whole body.
+_DISCONNECTED = object()
+
+class _RelayEvent():
+
+    __slots__ = ("kind", "event", "body", "data")
+
+    def __init__(self, kind, event, body, data=None):
+        self.kind = kind
+        self.event = event
+        self.body = body
+        self.data = data
+
+def _push_key(event):
+    data = event.data
+    return (data.get("repository", {}).get("full_name"), data.get("ref"))
+
+def merge_pushes(events):
+    """
+    Merges GitHub push events of the same repository and ref into one push holding all their commits.
+    """
+    merged = dict(events[0].data)
+    merged["commits"] = [commit for event in events for commit in event.data.get("commits", [])]
+    last = events[-1].data
+    for field in ("after", "head_commit", "compare", "forced"):
+        if(field in last):
+            merged[field] = last[field]
+    return msgspec.json.encode(merged)
+
+def merge_slack(events):
+    """
+    Merges Slack messages into one message, texts are joined by lines and attachments concatenated.
+    """
+    merged = dict(events[0].data)
+    texts = [event.data["text"] for event in events if event.data.get("text")]
+    if(texts):
+        merged["text"] = "\n".join(texts)
+    attachments = [attachment for event in events for attachment in event.data.get("attachments", [])]
+    if(attachments):
+        merged["attachments"] = attachments
+    return msgspec.json.encode(merged)
+
+class _WebhookQueue():
+
+    __slots__ = ("webhook_id", "events", "ready", "task")
+
+    def __init__(self, webhook_id):
+        self.webhook_id = webhook_id
+        self.events = collections.deque()
+        self.ready = asyncio.Event()
+        self.task = None
+
+class WebhookRelay():
+    """
+    Forwards GitHub and Slack event bodies to the compatible endpoints of discord webhooks over the connection pool of support.
+    Submitting never waits: every webhook has a queue of at most max_queued events(the oldest events are dropped beyond that)
+    drained by its own worker, so a rate limited webhook does not hold back the others.
+    While a webhook is rate limited its events pile up and are sent in batches: consecutive Slack messages
+    are merged into one message(up to SLACK_ATTACHMENTS_LIMIT attachments), consecutive push events of the same repository
+    and ref into one push. Other GitHub events are forwarded one by one in order.
+    Only events for the configured webhooks are accepted. With fetch_unknown, any other webhook id is fetched once with
+    the bot token of support and cached, at most max_webhooks webhooks are relayed to and events for others are dropped.
+    A worker which stops(the webhook could not be fetched or was deleted) drops its queued events and unregisters
+    its queue, the next event for the webhook starts a new worker.
+    """
+
+    def __init__(self, support, webhooks=(), max_queued=1000, max_batch=20, fetch_unknown=False, max_webhooks=100):
+        self.support = support
+        self.webhooks = {webhook.id: webhook for webhook in webhooks}
+        self.max_queued = max_queued
+        self.max_batch = max_batch
+        self.fetch_unknown = fetch_unknown
+        self.max_webhooks = max_webhooks
+        self.forwarded = 0
+        self.requests = 0
+        self.dropped = 0
+        self._queues = {}
+        self._closed = False
+
+    def endpoint_url(self, webhook_id, kind):
+        """
+        Absolute compatible endpoint url of a cached webhook, see DiscordSupport.resolve_url.
+        """
+        return self.support.resolve_url(_COMPATIBLE_URLS[kind], self.webhooks[webhook_id])
+
+    def accepts(self, webhook_id):
+        """
+        Whether events for webhook_id are queued: the webhook is configured, or unknown webhooks are fetched.
+        """
+        return webhook_id in self.webhooks or self.fetch_unknown
+
+    async def get_webhook(self, webhook_id):
+        webhook = self.webhooks.get(webhook_id)
+        if(webhook is None):
+            webhook = await self.support.send(Channel.WebhookUrls.GET_WEBHOOK, HttpMethods.GET, {"webhook.id": webhook_id})
+            if(webhook.token is None):
+                raise ValueError(f"webhook {webhook_id} has no token")
+            self.webhooks[webhook_id] = webhook
+        return webhook
+
+    def submit_github(self, webhook_id, event, body):
+        """
+        Queues a GitHub event(X-GitHub-Event header value) with its raw JSON body, returns False when it was dropped.
+        """
+        return self._submit(webhook_id, _RelayEvent(GITHUB, event, body))
+
+    def submit_slack(self, webhook_id, body):
+        return self._submit(webhook_id, _RelayEvent(SLACK, None, body))
+
+    def _submit(self, webhook_id, event):
+        if(self._closed):
+            raise RuntimeError("the relay is closed")
+        queue = self._queues.get(webhook_id)
+        if(queue is None):
+            if(not self.accepts(webhook_id) or len(self._queues) >= self.max_webhooks):
+                self.dropped += 1
+                return False
+            queue = self._queues[webhook_id] = _WebhookQueue(webhook_id)
+            queue.task = asyncio.ensure_future(self._forward_loop(queue))
+        if(queue.task.done()):
+            self.dropped += 1
+            return False
+        queue.events.append(event)
+        if(len(queue.events) > self.max_queued):
+            queue.events.popleft()
+            self.dropped += 1
+        queue.ready.set()
+        return True
+
+    def _next_batch(self, events):
+        first = events.popleft()
+        batch = [first]
+        mergeable = first.kind == SLACK or first.event == "push"
+        if(mergeable):
+            try:
+                first.data = msgspec.json.decode(first.body)
+            except msgspec.DecodeError:
+                return batch, first.body
+            attachments = len(first.data.get("attachments", []))
+            while(events and len(batch) < self.max_batch and events[0].kind == first.kind and events[0].event == first.event):
+                try:
+                    data = events[0].data = msgspec.json.decode(events[0].body)
+                except msgspec.DecodeError:
+                    break
+                if(first.kind == SLACK):
+                    attachments += len(data.get("attachments", []))
+                    if(attachments > SLACK_ATTACHMENTS_LIMIT or data.get("username") != first.data.get("username")):
+                        break
+                elif(_push_key(events[0]) != _push_key(first)):
+                    break
+                batch.append(events.popleft())
+        if(len(batch) == 1):
+            return batch, first.body
+        return batch, merge_slack(batch) if first.kind == SLACK else merge_pushes(batch)
+
+    async def _forward_loop(self, queue):
+        try:
+            await self._forward(queue)
+        finally:
+            if(self._queues.get(queue.webhook_id) is queue):
+                del self._queues[queue.webhook_id]
+
+    async def _forward(self, queue):
+        try:
+            webhook = await self.get_webhook(queue.webhook_id)
+        except Exception as error:
+            logger.warning("relay to webhook %s stopped: %s", queue.webhook_id, error)
+            self.dropped += len(queue.events)
+            queue.events.clear()
+            return
+
+        while(True):
+            if(not queue.events):
+                if(self._closed):
+                    return
+                queue.ready.clear()
+                await queue.ready.wait()
+                continue
+            try:
+                batch, body = self._next_batch(queue.events)
+            except Exception:
+                self.dropped += 1
+                logger.exception("batching events for webhook %s failed", webhook.id)
+                continue
+            first = batch[0]
+            headers = {"X-GitHub-Event": first.event} if first.kind == GITHUB else None
+            try:
+                await self.support.send(_COMPATIBLE_URLS[first.kind], HttpMethods.POST, {"webhook": webhook}, payload=body, headers=headers)
+                self.forwarded += len(batch)
+                self.requests += 1
+            except HTTPException as error:
+                self.dropped += len(batch)
+                logger.warning("relaying %d %s events to webhook %s failed: %s", len(batch), first.kind, webhook.id, error)
+                if(error.code == JSONErrorCodes.UNKNOWN_WEBHOOK):
+                    self.webhooks.pop(webhook.id, None)
+                    self.dropped += len(queue.events)
+                    queue.events.clear()
+                    return
+            except (ApxHttpDiscordError, *RETRYABLE_ERRORS) as error:
+                self.dropped += len(batch)
+                logger.warning("relaying %d %s events to webhook %s failed: %s", len(batch), first.kind, webhook.id, error)
+            except Exception:
+                self.dropped += len(batch)
+                logger.exception("relaying %d %s events to webhook %s failed", len(batch), first.kind, webhook.id)
+
+    async def close(self):
+        """
+        Forwards the queued events and stops the workers.
+        """
+        self._closed = True
+        for queue in self._queues.values():
+            queue.ready.set()
+        await asyncio.gather(*[queue.task for queue in self._queues.values()], return_exceptions=True)
+
+class RelayApp():
+    """
+    ASGI application receiving events on /github/{webhook id} and /slack/{webhook id} and queuing them on relay.
+    Requests are answered with 202 as soon as they are queued, 404 for webhooks the relay does not accept,
+    or 503 when the queue of the webhook is closed or full.
+    github_secret enables the verification of the X-Hub-Signature-256 header of GitHub deliveries, slack_token
+    requires Slack requests to carry it in the token query parameter(e.g /slack/{webhook id}?token=...).
+    Both are required when the relay fetches unknown webhooks, anyone could make it use the bot token otherwise.
+    """
+
+    def __init__(self, relay, github_secret=None, slack_token=None, max_body_size=1 << 20):
+        if(relay.fetch_unknown and (github_secret is None or slack_token is None)):
+            raise ValueError("github_secret and slack_token are required when the relay fetches unknown webhooks")
+        self.relay = relay
+        self.github_secret = github_secret.encode() if isinstance(github_secret, str) else github_secret
+        self.slack_token = slack_token.encode() if isinstance(slack_token, str) else slack_token
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope, receive, send):
+        if(scope["type"] != "http"):
+            return
+        if(scope["method"] != "POST"):
+            return await self._respond(send, 405)
+        kind, _, webhook_id = scope["path"].strip("/").partition("/")
+        if(kind not in _COMPATIBLE_URLS or not webhook_id.isdigit() or not self.relay.accepts(webhook_id)):
+            return await self._respond(send, 404)
+
+        headers = dict(scope["headers"])
+        body = await self._read_body(receive)
+        if(body is _DISCONNECTED):
+            return
+        if(body is None):
+            return await self._respond(send, 413)
+
+        if(kind == GITHUB):
+            if(self.github_secret is not None):
+                expected = b"sha256=" + hmac.new(self.github_secret, body, hashlib.sha256).hexdigest().encode()
+                if(not hmac.compare_digest(expected, headers.get(b"x-hub-signature-256", b""))):
+                    return await self._respond(send, 401)
+            event = headers.get(b"x-github-event", b"").decode()
+            if(not event):
+                return await self._respond(send, 400)
+            accepted = self.relay.submit_github(webhook_id, event, body)
+        else:
+            if(self.slack_token is not None):
+                query = urllib.parse.parse_qs(scope.get("query_string", b""))
+                if(not hmac.compare_digest(self.slack_token, query.get(b"token", [b""])[0])):
+                    return await self._respond(send, 401)
+            accepted = self.relay.submit_slack(webhook_id, body)
+        return await self._respond(send, 202 if accepted else 503)
+
+    async def _read_body(self, receive):
+        """
+        Returns the request body, None when it exceeds max_body_size or _DISCONNECTED when the client went away.
+        """
+        chunks = []
+        size = 0
+        while(True):
+            message = await receive()
+            if(message["type"] == "http.disconnect"):
+                return _DISCONNECTED
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if(size > self.max_body_size):
+                return None
+            chunks.append(chunk)
+            if(not message.get("more_body", False)):
+                return b"".join(chunks)
+
+    @staticmethod
+    async def _respond(send, status):
+        await send({"type": "http.response.start", "status": status, "headers": [(b"content-length", b"0")]})
+        await send({"type": "http.response.body", "body": b""})
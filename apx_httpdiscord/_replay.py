@@ -0,0 +1,66 @@
+"""
+Compact recording of interaction request bodies and the response bodies sent for them, replayed offline by
+benchmarks/interaction_replay.py. A recording is a header followed by records of
+(request length, response length) as little endian uint32, the raw request body and the raw response body,
+gzip compressed when the path ends with .gz.
+"""
+
+import gzip
+import struct
+
+RECORDING_MAGIC = b"APXREPLAY1\n"
+_RECORD_HEADER = struct.Struct("<II")
+
+def _open(path, mode):
+    return gzip.open(path, mode) if str(path).endswith(".gz") else open(path, mode)
+
+class InteractionRecorder():
+    """
+    Appends (request body, response body) records to a recording, pass it as the recorder of InteractionsApp.
+    Recording stops once max_records were written.
+    """
+
+    def __init__(self, path, max_records=None):
+        self.path = path
+        self.max_records = max_records
+        self.records = 0
+        self._file = _open(path, "wb")
+        self._file.write(RECORDING_MAGIC)
+
+    def record(self, body, response):
+        if(self._file is None or (self.max_records is not None and self.records >= self.max_records)):
+            return
+        self._file.write(_RECORD_HEADER.pack(len(body), len(response)))
+        self._file.write(body)
+        self._file.write(response)
+        self.records += 1
+
+    def close(self):
+        if(self._file is not None):
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def read_recording(path):
+    """
+    Returns the list of (request body, response body) of a recording.
+    """
+    with _open(path, "rb") as file:
+        data = file.read()
+    if(not data.startswith(RECORDING_MAGIC)):
+        raise ValueError(f"{path} is not an interaction recording")
+    records = []
+    offset = len(RECORDING_MAGIC)
+    while(offset < len(data)):
+        body_length, response_length = _RECORD_HEADER.unpack_from(data, offset)
+        offset += _RECORD_HEADER.size
+        body = data[offset:offset + body_length]
+        offset += body_length
+        records.append((body, data[offset:offset + response_length]))
+        offset += response_length
+    return records
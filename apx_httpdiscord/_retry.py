@@ -0,0 +1,149 @@
+"""
+Classification of failed requests from HTTPResponseCodes and JSONErrorCodes, and the retry policy of DiscordSupport.
+"""
+
+import random
+import time
+
+from ._datamodels import HTTPResponseCodes, JSONErrorCodes
+
+#The request was not processed by discord and can be sent again.
+RETRYABLE = "retryable"
+#The request may have been processed, only idempotent requests are sent again.
+RETRYABLE_IDEMPOTENT = "retryable_idempotent"
+#The request was rate limited and can be sent again once the retry_after of the response elapsed.
+RETRY_AFTER = "retry_after"
+#Sending the same request again fails the same way.
+PERMANENT = "permanent"
+
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+
+#Errors raised by the connection pool when no complete response was read, timeouts included.
+RETRYABLE_ERRORS = (OSError, EOFError)
+
+def _status_class(status):
+    if(status == HTTPResponseCodes.TOO_MANY_REQUESTS):
+        return RETRY_AFTER
+    if(status in (HTTPResponseCodes.GATEWAY_UNAVAILABLE, HTTPResponseCodes.SERVICE_UNAVAILABLE)):
+        return RETRYABLE
+    if(status >= 500):
+        return RETRYABLE_IDEMPOTENT
+    return PERMANENT
+
+#Failure class of every error status of HTTPResponseCodes, other statuses are classified by their range.
+STATUS_CLASSES = {status.value: _status_class(status) for status in HTTPResponseCodes if status >= 400}
+
+_CODE_OVERRIDES = {
+    JSONErrorCodes.SLOWMODE_RATE_LIMIT: RETRY_AFTER,
+    JSONErrorCodes.ANNOUNCEMENT_RATE_LIMIT_EDIT: RETRY_AFTER,
+    JSONErrorCodes.CHANNEL_WRITE_RATE_LIMIT_HIT: RETRY_AFTER,
+    JSONErrorCodes.SERVER_WRITE_RATE_LIMIT_HIT: RETRY_AFTER,
+    JSONErrorCodes.SERVICE_RESOURCE_RATE_LIMITED: RETRY_AFTER,
+    JSONErrorCodes.API_RESOURCE_OVERLOADED: RETRYABLE,
+}
+
+#Failure class of every JSONErrorCodes code, GENERAL_ERROR defers to the status code.
+CODE_CLASSES = {
+    code.value: _CODE_OVERRIDES.get(code, PERMANENT) for code in JSONErrorCodes if code != JSONErrorCodes.GENERAL_ERROR
+}
+
+def classify(status, code=None):
+    """
+    Failure class of a response, from the JSON error code of its body when discord sent one, else from its status code.
+    """
+    if(code):
+        classification = CODE_CLASSES.get(code)
+        if(classification is not None):
+            return classification
+    classification = STATUS_CLASSES.get(status)
+    return classification if classification is not None else _status_class(status)
+
+class RetryState():
+    """
+    Retries spent by one request.
+    """
+
+    __slots__ = ("retries", "ratelimit_retries", "deadline")
+
+    def __init__(self, deadline=None):
+        self.retries = 0
+        self.ratelimit_retries = 0
+        self.deadline = deadline
+
+class RetryPolicy():
+    """
+    Decides whether a failed request attempt is sent again and after how long.
+    Rate limited attempts are retried after their retry_after, up to max_ratelimit_retries times per request.
+    Other retryable failures are retried after a full jitter exponential backoff(a random delay up to
+    base_delay * 2**retries, at most max_delay), up to max_retries times per request. Failures which may have been
+    processed by discord(5xx other than 502 and 503, connection errors) are only retried for idempotent methods,
+    unless retry_unsafe is set, so a message is not posted twice.
+    A request does not retry past timeout seconds after it started. Every request adds retry_ratio to a budget of at most
+    retry_burst retries shared by all requests, so during an outage retries are at most retry_ratio of the traffic
+    instead of multiplying it.
+    """
+
+    def __init__(
+        self, max_retries=3, max_ratelimit_retries=3, base_delay=0.5, max_delay=30.0, timeout=None,
+        retry_ratio=0.2, retry_burst=10.0, retry_unsafe=False, seed=None,
+    ):
+        self.max_retries = max_retries
+        self.max_ratelimit_retries = max_ratelimit_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self.retry_ratio = retry_ratio
+        self.retry_burst = retry_burst
+        self.retry_unsafe = retry_unsafe
+        self.random = random.Random(seed)
+        self.retried = 0
+        self.ratelimit_retried = 0
+        self.exhausted = 0
+        self._tokens = retry_burst
+
+    def start(self):
+        """
+        Returns the RetryState of a new request.
+        """
+        self._tokens = min(self.retry_burst, self._tokens + self.retry_ratio)
+        return RetryState(time.monotonic() + self.timeout if self.timeout is not None else None)
+
+    def backoff(self, retries):
+        return self.random.uniform(0, min(self.max_delay, self.base_delay * (1 << retries)))
+
+    def next_delay(self, state, method, status=None, code=None, retry_after=None, error=None):
+        """
+        Seconds to wait before sending a failed attempt again, None when it is not retried.
+        error is the exception raised instead of a response.
+        """
+        if(error is not None):
+            classification = RETRYABLE_IDEMPOTENT if isinstance(error, RETRYABLE_ERRORS) else PERMANENT
+        else:
+            classification = classify(status, code)
+        if(classification == PERMANENT):
+            return None
+        if(classification == RETRYABLE_IDEMPOTENT and not self.retry_unsafe and method not in IDEMPOTENT_METHODS):
+            return None
+
+        if(classification == RETRY_AFTER):
+            if(state.ratelimit_retries >= self.max_ratelimit_retries):
+                return None
+            delay = retry_after if retry_after is not None else self.backoff(state.ratelimit_retries)
+        else:
+            if(state.retries >= self.max_retries):
+                return None
+            if(self._tokens < 1):
+                self.exhausted += 1
+                return None
+            delay = self.backoff(state.retries)
+        if(state.deadline is not None and time.monotonic() + delay > state.deadline):
+            return None
+
+        if(classification == RETRY_AFTER):
+            state.ratelimit_retries += 1
+            self.ratelimit_retried += 1
+        else:
+            state.retries += 1
+            self.retried += 1
+            self._tokens -= 1
+        return delay
@@ -0,0 +1,113 @@
+"""
+Dispatch tree routing interactions to handlers in O(depth):
+application commands are routed by InteractionData.name -> subcommand group -> subcommand,
+message components and modal submits by the longest registered prefix of their custom_id.
+"""
+
+from ._datamodels import InteractionTypes, AppCommandOptionTypes
+
+_SUBCOMMAND_TYPES = (AppCommandOptionTypes.SUB_COMMAND, AppCommandOptionTypes.SUB_COMMAND_GROUP)
+
+_COMMAND_TYPES = (InteractionTypes.APPLICATION_COMMAND, InteractionTypes.APPLICATION_COMMAND_AUTOCOMPLETE)
+_CUSTOM_ID_TYPES = (InteractionTypes.MESSAGE_COMPONENT, InteractionTypes.MODAL_SUBMIT)
+
+class _Node():
+    __slots__ = ("handler", "children")
+
+    def __init__(self):
+        self.handler = None
+        self.children = {}
+
+class InteractionRouter():
+    """
+    Registers handlers for commands(space separated path, e.g "admin user ban"), component and modal custom_id prefixes,
+    and compiles them into a dispatch tree on first use after a registration.
+    A handler is an async callable taking the Interaction and the routed remainder:
+    the options of the invoked(sub)command for commands, the rest of the custom_id after the prefix for components and modals.
+    The router itself is an async callable taking an Interaction, so it can be registered as a handler of InteractionsApp.
+    """
+
+    def __init__(self):
+        self._routes = []  # (interaction type, key, handler)
+        self._trees = None
+
+    def _register(self, interaction_type, key, handler):
+        if(any(route[0] == interaction_type and route[1] == key for route in self._routes)):
+            raise ValueError(f"a handler is already registered for {interaction_type.name} {key!r}")
+        self._routes.append((interaction_type, key, handler))
+        self._trees = None
+
+    def _decorator(self, interaction_type, key, handler):
+        if(handler is not None):
+            self._register(interaction_type, key, handler)
+            return handler
+        def register(function):
+            self._register(interaction_type, key, function)
+            return function
+        return register
+
+    def command(self, path, handler=None):
+        return self._decorator(InteractionTypes.APPLICATION_COMMAND, tuple(path.split()), handler)
+
+    def autocomplete(self, path, handler=None):
+        return self._decorator(InteractionTypes.APPLICATION_COMMAND_AUTOCOMPLETE, tuple(path.split()), handler)
+
+    def component(self, prefix, handler=None):
+        return self._decorator(InteractionTypes.MESSAGE_COMPONENT, prefix, handler)
+
+    def modal(self, prefix, handler=None):
+        return self._decorator(InteractionTypes.MODAL_SUBMIT, prefix, handler)
+
+    def compile(self):
+        """
+        Builds one tree per interaction type, command trees have a level per path segment,
+        custom_id trees are character tries.
+        """
+        trees = {interaction_type: _Node() for interaction_type in (*_COMMAND_TYPES, *_CUSTOM_ID_TYPES)}
+        for interaction_type, key, handler in self._routes:
+            node = trees[interaction_type]
+            for segment in key:
+                node = node.children.setdefault(segment, _Node())
+            node.handler = handler
+        self._trees = trees
+        return trees
+
+    def route(self, interaction):
+        """
+        Returns (handler, remainder) for the interaction, or (None, None) when no handler matches.
+        """
+        trees = self._trees or self.compile()
+        node = trees.get(interaction.type)
+        data = interaction.data
+        if(node is None or data is None):
+            return None, None
+
+        if(interaction.type in _CUSTOM_ID_TYPES):
+            custom_id = data.custom_id or ""
+            match = None
+            end = 0
+            if(node.handler is not None):
+                match = node.handler
+            for index, character in enumerate(custom_id):
+                node = node.children.get(character)
+                if(node is None):
+                    break
+                if(node.handler is not None):
+                    match = node.handler
+                    end = index + 1
+            return (match, custom_id[end:]) if match is not None else (None, None)
+
+        node = node.children.get(data.name)
+        options = data.options
+        while(node is not None and options and options[0].type in _SUBCOMMAND_TYPES):
+            node = node.children.get(options[0].name)
+            options = options[0].options
+        if(node is None or node.handler is None):
+            return None, None
+        return node.handler, options
+
+    async def __call__(self, interaction):
+        handler, remainder = self.route(interaction)
+        if(handler is None):
+            return None
+        return await handler(interaction, remainder)
@@ -0,0 +1,197 @@
+"""
+Ed25519 verification of the X-Signature-Ed25519 and X-Signature-Timestamp headers discord sends with every
+request to an interactions endpoint, with replay protection. Either PyNaCl or cryptography must be installed.
+"""
+
+import asyncio
+import concurrent.futures
+import os
+import threading
+import time
+
+try:
+    from nacl.signing import VerifyKey
+    from nacl.exceptions import BadSignatureError
+except ImportError:
+    VerifyKey = None
+
+try:
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+    from cryptography.exceptions import InvalidSignature
+except ImportError:
+    Ed25519PublicKey = None
+
+class Ed25519Verifier():
+    """
+    Verifies interaction request signatures against the public key of the application(Application.verify_key).
+    """
+
+    def __init__(self, public_key):
+        key = bytes.fromhex(public_key) if isinstance(public_key, str) else bytes(public_key)
+        if(VerifyKey is not None):
+            self._key = VerifyKey(key)
+            self._verify = self._verify_nacl
+        elif(Ed25519PublicKey is not None):
+            self._key = Ed25519PublicKey.from_public_bytes(key)
+            self._verify = self._verify_cryptography
+        else:
+            raise ImportError("verifying interaction signatures requires PyNaCl or cryptography to be installed")
+
+    def _verify_nacl(self, message, signature):
+        try:
+            self._key.verify(message, signature)
+        except BadSignatureError:
+            return False
+        return True
+
+    def _verify_cryptography(self, message, signature):
+        try:
+            self._key.verify(signature, message)
+        except InvalidSignature:
+            return False
+        return True
+
+    def verify(self, timestamp, body, signature):
+        """
+        Returns whether signature(hex) signs timestamp followed by the raw request body.
+        """
+        if(isinstance(timestamp, str)):
+            timestamp = timestamp.encode()
+        try:
+            signature = bytes.fromhex(signature.decode() if isinstance(signature, bytes) else signature)
+        except ValueError:
+            return False
+        if(len(signature) != 64):
+            return False
+        return self._verify(timestamp + body, signature)
+
+class ReplayCache():
+    """
+    Bounded set of the (timestamp, signature) pairs accepted within the last window seconds.
+    Entries are kept in arrival order, so expiring the oldest entries is O(1) per entry. Entries are only dropped once
+    they leave the window, new pairs are refused while max_entries pairs are inside it.
+    """
+
+    def __init__(self, window=300.0, max_entries=100_000):
+        self.window = window
+        self.max_entries = max_entries
+        self._seen = {}  # (timestamp, signature) -> arrival time
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._seen)
+
+    def _expire(self, now):
+        seen = self._seen
+        while(seen):
+            key = next(iter(seen))
+            if(seen[key] > now - self.window):
+                break
+            del seen[key]
+
+    def contains(self, timestamp, signature, now=None):
+        """
+        Whether the pair was recorded within the window.
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._expire(now)
+            return (timestamp, signature) in self._seen
+
+    def add(self, timestamp, signature, now=None):
+        """
+        Records a pair, returns False if it was already recorded within the window or the cache is full.
+        """
+        now = time.monotonic() if now is None else now
+        key = (timestamp, signature)
+        with self._lock:
+            self._expire(now)
+            if(key in self._seen or len(self._seen) >= self.max_entries):
+                return False
+            self._seen[key] = now
+        return True
+
+class SignatureVerifier():
+    """
+    Verification stage for interaction requests.
+    Requests with a timestamp outside the window or a (timestamp, signature) pair already accepted within the window
+    are rejected in O(1) without verifying the signature. The Ed25519 verification itself runs on a thread pool
+    of max_workers threads(PyNaCl releases the GIL while verifying), or inline when max_workers is 0,
+    by default one thread per core is used on multi-core machines.
+    A replay_cache_size of 0 disables the replay cache, only the timestamp window is then enforced. Only verified pairs
+    are recorded, and authentic requests are rejected while the cache holds replay_cache_size pairs of the window.
+    """
+
+    def __init__(self, public_key, max_workers=None, window=300.0, replay_cache_size=100_000, executor=None):
+        self.verifier = Ed25519Verifier(public_key)
+        self.window = window
+        self.replays = ReplayCache(window, replay_cache_size) if replay_cache_size else None
+        if(max_workers is None):
+            #A pool only adds hand-off overhead on a single core.
+            max_workers = os.cpu_count() if (os.cpu_count() or 1) > 1 else 0
+        if(executor is None and max_workers):
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers, thread_name_prefix="signature")
+        self.executor = executor
+        self.replays_rejected = 0
+        self.stale_rejected = 0
+        self.overflow_rejected = 0
+
+    @staticmethod
+    def _normalize(timestamp, signature):
+        if(isinstance(timestamp, str)):
+            timestamp = timestamp.encode()
+        if(isinstance(signature, str)):
+            signature = signature.encode()
+        #Hex is case insensitive, a replay must not pass the cache by changing the case of the signature.
+        return bytes(timestamp), bytes(signature).lower()
+
+    def _admit(self, timestamp, signature):
+        try:
+            sent_at = int(timestamp)
+        except ValueError:
+            return False
+        if(abs(time.time() - sent_at) > self.window):
+            self.stale_rejected += 1
+            return False
+        if(self.replays is not None and self.replays.contains(timestamp, signature)):
+            self.replays_rejected += 1
+            return False
+        return True
+
+    def _record(self, timestamp, signature):
+        """
+        Records a verified pair, returns False when a concurrent copy of the request was recorded first
+        or the replay cache is full.
+        """
+        if(self.replays is None or self.replays.add(timestamp, signature)):
+            return True
+        if(self.replays.contains(timestamp, signature)):
+            self.replays_rejected += 1
+        else:
+            self.overflow_rejected += 1
+        return False
+
+    def verify_sync(self, timestamp, body, signature):
+        timestamp, signature = self._normalize(timestamp, signature)
+        if(not self._admit(timestamp, signature)):
+            return False
+        return self.verifier.verify(timestamp, body, signature) and self._record(timestamp, signature)
+
+    async def verify(self, timestamp, body, signature):
+        """
+        Returns whether the request is authentic and not a replay.
+        The pair is recorded once the signature is verified, recording is atomic so concurrent copies of a request
+        cannot both be accepted, and unsigned requests never take room in the replay cache.
+        """
+        timestamp, signature = self._normalize(timestamp, signature)
+        if(not self._admit(timestamp, signature)):
+            return False
+        if(self.executor is None):
+            valid = self.verifier.verify(timestamp, body, signature)
+        else:
+            valid = await asyncio.get_running_loop().run_in_executor(self.executor, self.verifier.verify, timestamp, body, signature)
+        return valid and self._record(timestamp, signature)
+
+    def close(self):
+        if(self.executor is not None):
+            self.executor.shutdown(wait=False)
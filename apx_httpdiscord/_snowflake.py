@@ -0,0 +1,18 @@
+"""
+Discord snowflakes: 64 bit ids whose upper 42 bits are the milliseconds elapsed since DISCORD_EPOCH.
+"""
+
+#Milliseconds since the unix epoch at which discord snowflakes start counting(2015-01-01).
+DISCORD_EPOCH = 1420070400000
+
+def snowflake_time(snowflake):
+    """
+    Unix time in seconds at which the snowflake was created.
+    """
+    return ((int(snowflake) >> 22) + DISCORD_EPOCH) / 1000
+
+def time_snowflake(unix_ms, increment=0):
+    """
+    Snowflake created at unix_ms milliseconds since the unix epoch, increment fills the lower 22 bits.
+    """
+    return ((unix_ms - DISCORD_EPOCH) << 22) | increment
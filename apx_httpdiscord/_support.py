@@ -1,14 +1,304 @@
+import asyncio
+import string
+import time
+import urllib.parse
+
+import msgspec
+
+from ._circuit import CircuitBreaker
+from ._datamodels import HttpMethods, Interaction, Application, Channel, Guild
+from ._errors import HTTPException
+from ._http import HttpConnectionPool
+from ._multipart import MultipartEncoder, payload_to_builtins
+from ._priority import route_priority
+from ._ratelimit import RateLimiter, MAJOR_PARAMETERS
+from ._retry import RetryPolicy, RETRYABLE_ERRORS
+from ._tracing import ENCODE_PAYLOAD, ENCODE_QUERY, RATELIMIT_WAIT, DECODE_RESPONSE
+
+DISCORD_API_URL = "https://discord.com/api/v10"
+USER_AGENT = "DiscordBot (https://github.com/ApxMK/ApxHttpDiscord, 0.1.0)"
+
+#Classes holding the related routes tables used to resolve the route of a url.
+ROUTE_OWNERS = (Interaction, Application, Channel, Guild)
+
+def iter_routes(owners=ROUTE_OWNERS):
+    """
+    Yields (url, http method, route specification) for every route of the related routes tables of owners.
+    The tables of an owner are either a dict of urls or a tuple of such dicts.
+    """
+    for owner in owners:
+        tables = owner.get_related_routes()
+        for table in ((tables,) if isinstance(tables, dict) else tables):
+            for url, methods in table.items():
+                for method, route in methods.items():
+                    yield url, method, route
+
 class DiscordSupport():
+    """
+    Sends requests to the discord REST API over a keep-alive connection pool.
+    Requests wait for their rate limit bucket and the global limit of ratelimiter(a default RateLimiter when omitted),
+    Failed attempts are sent again as decided by retry_policy, a RetryPolicy retrying 429 responses up to
+    max_ratelimit_retries times once the limit resets when omitted.
+    circuit_breaker(a default CircuitBreaker when omitted) fails the requests of a rate limit bucket fast
+    with CircuitOpenError while its endpoints keep failing.
+    metrics is an optional RequestMetrics recording the round trip of every request attempt.
+    tracer is an optional tracer(e.g OpenTelemetryTracer) receiving the phases of every request, see _tracing.
+    decode_profiler is an optional DecodeProfiler decoding the response bodies.
+    """
+
+    def __init__(
+        self, token=None, base_url=DISCORD_API_URL, token_type="Bot", max_connections=100, ratelimiter=None,
+        max_ratelimit_retries=3, metrics=None, tracer=None, decode_profiler=None, retry_policy=None,
+        circuit_breaker=None,
+    ):
+        parsed = urllib.parse.urlsplit(base_url)
+        self.base_url = base_url.rstrip("/")
+        self.base_path = parsed.path.rstrip("/")
+        self.pool = HttpConnectionPool(f"{parsed.scheme}://{parsed.netloc}", max_connections=max_connections)
+        self.authorization = f"{token_type} {token}" if token else None
+        self.ratelimiter = ratelimiter or RateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy(max_ratelimit_retries=max_ratelimit_retries)
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.metrics = metrics
+        self.tracer = tracer
+        self.decode_profiler = decode_profiler
+        self._decode = decode_profiler.decode if decode_profiler is not None else msgspec.json.decode
+        self._routes = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        await self.pool.close()
+
+    @property
+    def routes(self):
+        """
+        Maps (url, http method) pairs to the route specification of the related routes tables.
+        """
+        if(self._routes is None):
+            self._routes = {(str(url), str(method)): route for url, method, route in iter_routes()}
+        return self._routes
+
+    def get_route(self, url, url_method):
+        return self.routes.get((str(url), str(url_method)))
+
+    @staticmethod
+    def format_url(url, url_params=()):
+        """
+        Fills the placeholders of a url template, e.g "/webhooks/{webhook.id}/{webhook.token}".
+        url_params is either a mapping from placeholder roots("webhook") or full placeholders("webhook.id")
+        to values, or a sequence of values in the order the placeholder roots appear in the url.
+        A value is an object(msgspec class, dict) holding the placeholder attribute, or the final value itself.
+        """
+        return DiscordSupport._fill(url, DiscordSupport.placeholder_values(url, url_params))
+
+    @staticmethod
+    def redacted_url(url, url_params=()):
+        """
+        format_url leaving the token placeholders(e.g "{webhook.token}", "{interaction.token}") unfilled,
+        for urls reported outside of the request such as traces.
+        """
+        values = DiscordSupport.placeholder_values(url, url_params)
+        for field in values:
+            if(field.rpartition(".")[2] == "token"):
+                values[field] = "{" + field + "}"
+        return DiscordSupport._fill(url, values)
+
+    @staticmethod
+    def _fill(url, values):
+        url = str(url)
+        if(not values):
+            return url
+        return "".join(
+            literal + (values[field] if field else "")
+            for literal, field, _, _ in string.Formatter().parse(url)
+        )
+
+    @staticmethod
+    def placeholder_values(url, url_params=()):
+        """
+        Maps the placeholders of a url template to their url quoted values, see format_url.
+        """
+        fields = [field for _, field, _, _ in string.Formatter().parse(str(url)) if field]
+        if(not fields):
+            return {}
+        if(not isinstance(url_params, dict)):
+            roots = list(dict.fromkeys(field.split(".", 1)[0] for field in fields))
+            url_params = dict(zip(roots, url_params))
+
+        values = {}
+        for field in fields:
+            if(field in url_params):
+                value = url_params[field]
+            else:
+                root, _, attribute = field.partition(".")
+                value = url_params[root]
+                if(attribute and not isinstance(value, (str, int))):
+                    value = value[attribute] if isinstance(value, dict) else getattr(value, attribute)
+            values[field] = urllib.parse.quote(str(value), safe="@")
+        return values
+
+    @staticmethod
+    def encode_query(query_params):
+        if(query_params is None):
+            return ""
+        data = msgspec.to_builtins(query_params)
+        if(not data):
+            return ""
+        return "?" + urllib.parse.urlencode(
+            {name: str(value).lower() if isinstance(value, bool) else value for name, value in data.items()}
+        )
+
+    @staticmethod
+    def encode_payload(payload):
+        """
+        Returns the request body and its headers. Payloads with file_locations are streamed as multipart/form-data,
+        a MultipartEncoder payload is sent as is and bytes are sent as already encoded JSON.
+        """
+        if(payload is None):
+            return None, {}
+        if(isinstance(payload, (bytes, bytearray, memoryview))):
+            return payload, {"Content-Type": "application/json"}
+        if(isinstance(payload, MultipartEncoder)):
+            return payload, {"Content-Type": payload.content_type}
+        file_locations = getattr(payload, "file_locations", None)
+        if(file_locations):
+            body = MultipartEncoder(payload, file_locations)
+            return body, {"Content-Type": body.content_type}
+        if(file_locations is not None):
+            payload = payload_to_builtins(payload)
+        return msgspec.json.encode(payload), {"Content-Type": "application/json"}
+
+    @staticmethod
+    def decode_response(route, response, decode=msgspec.json.decode):
+        """
+        decode is called like msgspec.json.decode, e.g DecodeProfiler.decode.
+        """
+        if(not response.body):
+            return None
+        if(route is None):
+            return decode(response.body)
+        return_type = route["statuscode_returntype_map"].get(response.status)
+        if(return_type is None):
+            return None
+        return decode(response.body, type=return_type)
+
+    async def send(
+        self, url=None, url_method=HttpMethods.GET, url_params=(), query_params=None, payload=None, headers=None,
+        priority=None,
+    ):
+        """
+        Sends a request to a discord endpoint and returns the response body decoded into the type
+        mapped to the response status code by the statuscode_returntype_map of the route.
+        headers holds the additional properties of the route, e.g {"X-Audit-Log-Reason": "..."}.
+        priority is the priority class of the request while it waits for the rate limits(see _priority), by default
+        the class of the route: interaction callbacks and follow-ups first, webhook messages next, bulk jobs last.
+        """
+        if(priority is None):
+            priority = route_priority(url_method, url)
+        if(self.tracer is None):
+            return await self._send(url, url_method, url_params, query_params, payload, headers, priority, None)
+        trace = self.tracer.start(str(url_method), str(url), self.redacted_url(url, url_params))
+        if(trace is None):
+            return await self._send(url, url_method, url_params, query_params, payload, headers, priority, None)
+        try:
+            result = await self._send(url, url_method, url_params, query_params, payload, headers, priority, trace)
+        except BaseException as error:
+            trace.end(error)
+            raise
+        trace.end()
+        return result
+
+    async def _send(self, url, url_method, url_params, query_params, payload, headers, priority, trace):
+        clock = time.time_ns
+        route = self.get_route(url, url_method)
+        if(trace is not None):
+            started = clock()
+        body, request_headers = self.encode_payload(payload)
+        if(trace is not None):
+            encoded = clock()
+            trace.phase(ENCODE_PAYLOAD, started, encoded)
+        query = self.encode_query(query_params)
+        if(trace is not None):
+            trace.phase(ENCODE_QUERY, encoded, clock())
+        values = self.placeholder_values(url, url_params)
+        target = self.base_path + self._fill(url, values) + query
+        route_key = (str(url_method), str(url))
+        major = tuple(value for field, value in values.items() if field.split(".", 1)[0] in MAJOR_PARAMETERS)
+
+        request_headers["User-Agent"] = USER_AGENT
+        if(self.authorization is not None):
+            request_headers["Authorization"] = self.authorization
+        if(headers):
+            request_headers.update(headers)
 
-    def __init__(self):
-        pass
+        retry_state = self.retry_policy.start()
+        while(True):
+            circuit_key = self.ratelimiter.bucket_key(route_key, major)
+            probe = self.circuit_breaker.before(circuit_key)
+            response = error = None
+            try:
+                if(trace is not None):
+                    waiting = clock()
+                bucket = await self.ratelimiter.acquire(route_key, major, priority)
+                if(trace is not None):
+                    trace.phase(RATELIMIT_WAIT, waiting, clock())
+                started = time.perf_counter()
+                try:
+                    response = await self.pool.request(str(url_method), target, request_headers, body, trace)
+                except RETRYABLE_ERRORS as exception:
+                    error = exception
+                finally:
+                    if(self.metrics is not None):
+                        self.metrics.record(*route_key, response.status if response is not None else 0, time.perf_counter() - started)
+                    retry_after = self.ratelimiter.release(bucket, route_key, response)
+            finally:
+                if(error is not None):
+                    self.circuit_breaker.after(circuit_key, probe, True)
+                else:
+                    self.circuit_breaker.after(circuit_key, probe, response.status >= 500 if response is not None else None)
+            if(error is None and response.status < 400):
+                break
+            error_body = None
+            if(response is not None and response.body):
+                try:
+                    error_body = msgspec.json.decode(response.body)
+                except msgspec.DecodeError:
+                    pass
+            delay = self.retry_policy.next_delay(
+                retry_state, str(url_method), response.status if response is not None else None,
+                error_body.get("code") if isinstance(error_body, dict) else None, retry_after, error,
+            )
+            if(delay is None):
+                break
+            if(delay > 0):
+                await asyncio.sleep(delay)
 
-    def send(self, url=None, url_method=None, url_params=(), query_params=None, payload=None):
-        pass
+        if(error is not None):
+            raise error
+        if(trace is not None):
+            trace.set_status(response.status)
+        if(response.status >= 400):
+            raise HTTPException(response.status, error_body, response.headers, route=f"{url_method} {url}")
+        if(trace is None):
+            return self.decode_response(route, response, self._decode)
+        decoding = clock()
+        result = self.decode_response(route, response, self._decode)
+        trace.phase(DECODE_RESPONSE, decoding, clock())
+        return result
 
-    def resolve_url():
+    def resolve_url(self, url, webhook, query_params=None):
         """
         Resolves Execute GitHub-Compatible Webhook and Execute Slack-Compatible Webhook Url endpoints
-        which are part of the webhook discord documentation.
+        which are part of the webhook discord documentation, into the absolute url of webhook(a Webhook or
+        any object with id and token) to configure as the payload url on GitHub or as the incoming webhook on Slack.
         """
-        pass
\ No newline at end of file
+        if(url not in (Channel.WebhookUrls.EXECUTE_GITHUB_COMPATIBLE_WEBHOOK, Channel.WebhookUrls.EXECUTE_SLACK_COMPATIBLE_WEBHOOK)):
+            raise ValueError(f"{url} is not a compatible webhook url")
+        if(webhook.token is None):
+            raise ValueError(f"webhook {webhook.id} has no token")
+        return self.base_url + self.format_url(url, {"webhook": webhook}) + self.encode_query(query_params)
@@ -0,0 +1,286 @@
+"""
+Synthetic values of the discord models generated from their type annotations, reproducible from a seed:
+    python -m apx_httpdiscord._synthetic Message --count 1000 --seed 1 --profile worst > messages.jsonl
+"""
+
+import argparse
+import datetime
+import enum
+import importlib
+import random
+import string
+import sys
+import types
+import typing
+import uuid
+
+import msgspec
+
+from ._snowflake import time_snowflake
+
+_ALPHABET = string.ascii_letters + string.digits + " "
+
+#Timestamps of the generated snowflakes and datetimes, in milliseconds since the unix epoch.
+_EARLIEST = 1451606400000  # 2016-01-01
+_LATEST = 1767225600000  # 2026-01-01
+
+#Keyword arguments of SyntheticFactory: required fields only, a typical payload and every field set with long lists.
+PROFILES = {
+    "small": {"list_length": (0, 0), "optional_probability": 0.0, "max_depth": 1},
+    "typical": {"list_length": (0, 3), "optional_probability": 0.5, "max_depth": 3},
+    "worst": {"list_length": (10, 10), "optional_probability": 1.0, "max_depth": 3},
+}
+
+def _namespace(owner):
+    """
+    Names visible to the annotations of a class: its module, then the classes it is nested in and itself.
+    """
+    namespace = dict(vars(sys.modules[owner.__module__]))
+    scope = sys.modules[owner.__module__]
+    for name in owner.__qualname__.split("."):
+        scope = getattr(scope, name, None)
+        if(scope is None):
+            break
+        namespace.update(vars(scope))
+    return namespace
+
+def _root_namespace(annotation):
+    return _namespace(annotation) if isinstance(annotation, type) else {}
+
+def _resolve(annotation, namespace):
+    """
+    Evaluates the forward references of annotation(quoted annotations and quoted names nested in generics)
+    with typing.get_type_hints, as if it annotated a field declared where namespace is visible.
+    """
+    holder = types.SimpleNamespace(__annotations__={"annotation": annotation})
+    return typing.get_type_hints(holder, namespace, include_extras=True)["annotation"]
+
+def _struct_fields(cls):
+    """
+    (name, encoded name, required, annotation) of every field of a Struct, annotations left unevaluated.
+    """
+    annotations = {}
+    for base in reversed(cls.__mro__):
+        annotations.update(vars(base).get("__annotations__", {}))
+    defaults = cls.__struct_defaults__
+    offset = len(cls.__struct_fields__) - len(defaults)
+    return [
+        (name, encoded, index < offset or defaults[index - offset] is msgspec.NODEFAULT, annotations[name])
+        for index, (name, encoded) in enumerate(zip(cls.__struct_fields__, cls.__struct_encode_fields__))
+    ]
+
+class _StructPlan():
+
+    __slots__ = ("tag", "fields")
+
+    def __init__(self):
+        self.tag = None
+        self.fields = []
+
+class SyntheticFactory():
+    """
+    Generates random values of any model type(msgspec Structs and the types their fields are annotated with) by walking
+    their annotations, quoted forward references included, so a broken annotation elsewhere does not stop the others.
+    list_length is the (minimum, maximum) number of items of lists and dicts, optional_probability the chance a field
+    with a default is set and an optional(| None) field is not None. Structs nested deeper than max_depth only get their
+    required fields, and their lists only the required minimum of items, so recursive models stay finite.
+    Fields named id or ending with _id get snowflakes. Annotations are compiled once per Struct into generators,
+    the same seed always yields the same sequence of values.
+    """
+
+    def __init__(self, seed=0, list_length=(0, 3), optional_probability=0.5, max_depth=3):
+        self.random = random.Random(seed)
+        self.list_length = list_length
+        self.optional_probability = optional_probability
+        self.max_depth = max_depth
+        self._structs = {}
+
+    @classmethod
+    def from_profile(cls, profile="typical", seed=0):
+        return cls(seed, **PROFILES[profile])
+
+    def builtins(self, type):
+        """
+        Random value of type as JSON compatible builtins(dicts keyed by the encoded field names, lists, strings...).
+        """
+        return self._compile(type, _root_namespace(type), None)(0)
+
+    def build(self, type):
+        """
+        Random instance of type.
+        """
+        return msgspec.convert(self.builtins(type), type)
+
+    def encode(self, type):
+        """
+        Random JSON body of type.
+        """
+        return msgspec.json.encode(self.builtins(type))
+
+    def iter_encoded(self, type, count):
+        """
+        Yields count random JSON bodies of type.
+        """
+        generate = self._compile(type, _root_namespace(type), None)
+        encode = msgspec.json.Encoder().encode
+        for _ in range(count):
+            yield encode(generate(0))
+
+    def snowflake(self):
+        return time_snowflake(self.random.randint(_EARLIEST, _LATEST), self.random.getrandbits(22))
+
+    def _length(self, low, high, depth):
+        low = max(self.list_length[0], low or 0)
+        if(depth >= self.max_depth):
+            return low
+        high = self.list_length[1] if high is None else min(self.list_length[1], high)
+        return self.random.randint(low, max(low, high))
+
+    def _struct_plan(self, cls):
+        plan = self._structs.get(cls)
+        if(plan is not None):
+            return plan
+        plan = self._structs[cls] = _StructPlan()
+        config = cls.__struct_config__
+        if(config.tag_field is not None):
+            plan.tag = (config.tag_field, config.tag)
+        namespace = _namespace(cls)
+        try:
+            plan.fields = [
+                (encoded, required, self._compile(annotation, namespace, name))
+                for name, encoded, required, annotation in _struct_fields(cls)
+            ]
+        except BaseException:
+            del self._structs[cls]
+            raise
+        return plan
+
+    def _compile(self, annotation, namespace, name, meta=None):
+        """
+        Returns a function of the nesting depth generating a value of annotation.
+        """
+        rng = self.random
+        annotation = _resolve(annotation, namespace)
+        origin = typing.get_origin(annotation)
+        args = typing.get_args(annotation)
+        meta = meta or {}
+
+        if(origin is typing.Annotated):
+            for constraint in args[1:]:
+                if(isinstance(constraint, msgspec.Meta)):
+                    meta = {
+                        field: getattr(constraint, field)
+                        for field in ("ge", "gt", "le", "lt", "min_length", "max_length")
+                        if getattr(constraint, field) is not None
+                    }
+            return self._compile(args[0], namespace, name, meta)
+
+        if(isinstance(annotation, type) and issubclass(annotation, msgspec.Struct)):
+            plan = self._struct_plan(annotation)
+
+            def generate(depth):
+                value = {}
+                if(plan.tag is not None):
+                    value[plan.tag[0]] = plan.tag[1]
+                shallow = depth >= self.max_depth
+                for encoded, required, field in plan.fields:
+                    if(not required and (shallow or rng.random() >= self.optional_probability)):
+                        continue
+                    value[encoded] = field(depth + 1)
+                return value
+            return generate
+
+        if(origin in (typing.Union, types.UnionType)):
+            options = [self._compile(arg, namespace, name, meta) for arg in args if arg is not type(None)]
+            nullable = len(options) < len(args)
+
+            def generate(depth):
+                if(nullable and (depth > self.max_depth or rng.random() >= self.optional_probability)):
+                    return None
+                return rng.choice(options)(depth)
+            return generate
+
+        if(origin is typing.Literal):
+            return lambda depth: rng.choice(args)
+
+        if(origin in (list, set, frozenset, tuple) or annotation in (list, set, frozenset, tuple)):
+            if(origin is tuple and args and args[-1] is not Ellipsis):
+                items = [self._compile(arg, namespace, name) for arg in args]
+                return lambda depth: [item(depth + 1) for item in items]
+            item = self._compile(args[0] if args else typing.Any, namespace, name)
+            low, high = meta.get("min_length"), meta.get("max_length")
+            unique = (origin or annotation) in (set, frozenset)
+
+            def generate(depth):
+                values = [item(depth + 1) for _ in range(self._length(low, high, depth))]
+                if(unique):
+                    #Duplicates would shrink the set below its minimum length.
+                    values = list({msgspec.json.encode(value): value for value in values}.values())
+                return values
+            return generate
+
+        if(origin is dict or annotation is dict):
+            key = self._compile(args[0] if args else str, namespace, None)
+            value = self._compile(args[1] if args else typing.Any, namespace, name)
+            low, high = meta.get("min_length"), meta.get("max_length")
+            return lambda depth: {key(depth + 1): value(depth + 1) for _ in range(self._length(low, high, depth))}
+
+        if(annotation is None or annotation is type(None)):
+            return lambda depth: None
+        if(isinstance(annotation, type) and issubclass(annotation, enum.Enum)):
+            values = [member.value for member in annotation]
+            return lambda depth: rng.choice(values)
+        if(annotation is bool):
+            return lambda depth: rng.random() < 0.5
+        snowflake = name is not None and (name == "id" or name.endswith("_id"))
+        if(annotation is int):
+            if(snowflake):
+                return lambda depth: self.snowflake()
+            low = meta["ge"] if "ge" in meta else meta["gt"] + 1 if "gt" in meta else 0
+            high = meta["le"] if "le" in meta else meta["lt"] - 1 if "lt" in meta else 1 << 16
+            return lambda depth: rng.randint(low, max(low, high))
+        if(annotation is float):
+            low = meta.get("ge", meta.get("gt", 0.0))
+            high = meta.get("le", meta.get("lt", low + 1000.0))
+            return lambda depth: rng.uniform(low, high)
+        if(annotation is str):
+            if(snowflake):
+                return lambda depth: str(self.snowflake())
+            low = meta.get("min_length") or 1
+            high = min(meta.get("max_length", low + 24), low + 24)
+            return lambda depth: "".join(rng.choices(_ALPHABET, k=rng.randint(low, max(low, high))))
+        if(annotation is datetime.datetime):
+            return lambda depth: datetime.datetime.fromtimestamp(rng.randint(_EARLIEST, _LATEST) / 1000, datetime.timezone.utc).isoformat()
+        if(annotation is datetime.date):
+            return lambda depth: datetime.datetime.fromtimestamp(rng.randint(_EARLIEST, _LATEST) / 1000, datetime.timezone.utc).date().isoformat()
+        if(annotation is uuid.UUID):
+            return lambda depth: str(uuid.UUID(int=rng.getrandbits(128)))
+        if(annotation in (bytes, bytearray)):
+            return lambda depth: rng.randbytes(rng.randint(1, 64))
+        if(annotation is typing.Any or annotation is object):
+            return lambda depth: "".join(rng.choices(_ALPHABET, k=rng.randint(1, 24)))
+        raise TypeError(f"cannot synthesize values of {annotation!r}")
+
+def generate(type, count, seed=0, profile="typical"):
+    """
+    Yields count JSON bodies of type from a SyntheticFactory of the given profile, the same for the same seed.
+    """
+    return SyntheticFactory.from_profile(profile, seed).iter_encoded(type, count)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("model", help="qualified name of a model of _datamodels, e.g Message or Channel.ExecuteWebhookJSONParams")
+    parser.add_argument("--count", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--profile", choices=PROFILES, default="typical")
+    args = parser.parse_args()
+
+    model = importlib.import_module(f"{__package__}._datamodels")
+    for name in args.model.split("."):
+        model = getattr(model, name)
+    output = sys.stdout.buffer
+    for body in generate(model, args.count, args.seed, args.profile):
+        output.write(body + b"\n")
+
+if __name__ == "__main__":
+    main()
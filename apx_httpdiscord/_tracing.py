@@ -0,0 +1,103 @@
+"""
+Tracing hooks of the phases of DiscordSupport.send. A tracer is any object with a start(method, route, target) method
+returning a RequestTrace(or None to skip the request), pass it as the tracer of DiscordSupport.
+target is the url path with its token placeholders left unfilled(DiscordSupport.redacted_url), traces never hold
+webhook or interaction tokens.
+Phase timestamps are wall clock nanoseconds(time.time_ns), as expected by OpenTelemetry spans.
+"""
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:
+    otel_trace = None
+
+from ._metrics import RequestMetrics
+
+ENCODE_PAYLOAD = "encode_payload"
+ENCODE_QUERY = "encode_query"
+RATELIMIT_WAIT = "ratelimit_wait"
+CONNECTION_ACQUIRE = "connection_acquire"
+ROUND_TRIP = "round_trip"
+DECODE_RESPONSE = "decode_response"
+
+PHASES = (ENCODE_PAYLOAD, ENCODE_QUERY, RATELIMIT_WAIT, CONNECTION_ACQUIRE, ROUND_TRIP, DECODE_RESPONSE)
+
+class RequestTrace():
+    """
+    Receives the phases of one request. Rate limit wait, connection acquire and round trip are reported once per attempt.
+    """
+
+    def phase(self, name, start_ns, end_ns):
+        pass
+
+    def set_status(self, status):
+        pass
+
+    def end(self, error=None):
+        pass
+
+class _PhaseTrace(RequestTrace):
+
+    __slots__ = ("metrics", "route")
+
+    def __init__(self, metrics, route):
+        self.metrics = metrics
+        self.route = route
+
+    def phase(self, name, start_ns, end_ns):
+        self.metrics.record(*self.route, name, (end_ns - start_ns) / 1e9)
+
+class PhaseMetrics():
+    """
+    Tracer aggregating the duration of every phase into a RequestMetrics, with the phase in place of the status code,
+    e.g to compare the time spent waiting on rate limits and connections with the round trips of a route.
+    """
+
+    def __init__(self, metrics=None):
+        self.metrics = metrics if metrics is not None else RequestMetrics(namespace="apx_discord_phase")
+
+    def start(self, method, route, target):
+        return _PhaseTrace(self.metrics, (method, route))
+
+    def snapshot(self):
+        return self.metrics.snapshot()
+
+class _OpenTelemetryTrace(RequestTrace):
+
+    __slots__ = ("tracer", "span", "context")
+
+    def __init__(self, tracer, span):
+        self.tracer = tracer
+        self.span = span
+        self.context = otel_trace.set_span_in_context(span)
+
+    def phase(self, name, start_ns, end_ns):
+        self.tracer.start_span(name, context=self.context, start_time=start_ns).end(end_time=end_ns)
+
+    def set_status(self, status):
+        self.span.set_attribute("http.response.status_code", status)
+
+    def end(self, error=None):
+        if(error is not None):
+            self.span.record_exception(error)
+            self.span.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR, str(error)))
+        self.span.end()
+
+class OpenTelemetryTracer():
+    """
+    Tracer creating a client span per request with a child span per phase.
+    tracer is an OpenTelemetry Tracer, the tracer of this module from the global tracer provider when omitted.
+    """
+
+    def __init__(self, tracer=None):
+        if(otel_trace is None):
+            raise ImportError("OpenTelemetryTracer requires opentelemetry-api to be installed")
+        self.tracer = tracer or otel_trace.get_tracer(__name__)
+
+    def start(self, method, route, target):
+        span = self.tracer.start_span(
+            f"{method} {route}",
+            kind=otel_trace.SpanKind.CLIENT,
+            attributes={"http.request.method": method, "url.template": route, "url.path": target},
+        )
+        return _OpenTelemetryTrace(self.tracer, span)
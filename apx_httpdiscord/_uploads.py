@@ -0,0 +1,95 @@
+import asyncio
+import os
+
+from ._datamodels import HttpMethods
+from ._errors import AttachmentSizeError
+from ._multipart import MultipartEncoder
+
+MAX_ATTACHMENTS = 10
+
+def _prefetch(location):
+    """
+    Returns the size of a file and asks the kernel to start reading it ahead, so the disk reads of the
+    following files overlap with the network transfer of the current one.
+    """
+    with open(location, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if(hasattr(os, "posix_fadvise")):
+            os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+    return size
+
+class AttachmentUpload():
+    """
+    Sends a message with up to 10 attachments.
+    The files are checked and read ahead in parallel while the payload is encoded, the total size is checked
+    against size_limit(e.g Interaction.attachment_size_limit) before any byte is transferred, and the byte progress
+    of every file is reported through on_progress(file_location, bytes_sent, file_size).
+    The upload is cancelled with cancel(), which closes the connection and the open file.
+    """
+
+    def __init__(self, support, url, url_method=HttpMethods.POST, url_params=(), query_params=None, payload=None,
+                 file_locations=None, size_limit=None, on_progress=None):
+        self.support = support
+        self.url = url
+        self.url_method = url_method
+        self.url_params = url_params
+        self.query_params = query_params
+        self.payload = payload
+        if(file_locations is None):
+            file_locations = getattr(payload, "file_locations", None) or []
+        self.file_locations = list(file_locations)
+        self.size_limit = size_limit
+        self.on_progress = on_progress
+        self.progress = {location: 0 for location in self.file_locations}
+        self.sizes = {}
+        self.task = None
+
+    @property
+    def total_size(self):
+        return sum(self.sizes.values())
+
+    @property
+    def bytes_sent(self):
+        return sum(self.progress.values())
+
+    def _report(self, n, location, sent, size):
+        self.progress[location] = sent
+        if(self.on_progress is not None):
+            self.on_progress(location, sent, size)
+
+    async def prepare(self):
+        """
+        Checks the attachments and encodes the payload, returns the MultipartEncoder of the request.
+        Raises AttachmentSizeError without transferring anything when a limit is exceeded.
+        """
+        if(len(self.file_locations) > MAX_ATTACHMENTS):
+            raise AttachmentSizeError(f"{len(self.file_locations)} attachments exceed the limit of {MAX_ATTACHMENTS} per message")
+
+        sizes = await asyncio.gather(*(asyncio.to_thread(_prefetch, location) for location in self.file_locations))
+        self.sizes = dict(zip(self.file_locations, sizes))
+        if(self.size_limit is not None and self.total_size > self.size_limit):
+            raise AttachmentSizeError(f"attachments total {self.total_size} bytes, exceeding the limit of {self.size_limit} bytes")
+
+        return await asyncio.to_thread(
+            MultipartEncoder, self.payload, self.file_locations, sizes=sizes, on_progress=self._report,
+        )
+
+    async def run(self):
+        encoder = await self.prepare()
+        return await self.support.send(self.url, self.url_method, self.url_params, self.query_params, encoder)
+
+    def start(self):
+        """
+        Starts the upload in a task and returns it, the task result is the decoded response of the route.
+        """
+        if(self.task is None):
+            self.task = asyncio.ensure_future(self.run())
+        return self.task
+
+    def cancel(self):
+        if(self.task is not None):
+            return self.task.cancel()
+        return False
+
+    def __await__(self):
+        return self.start().__await__()
@@ -0,0 +1,173 @@
+import asyncio
+import collections
+import logging
+
+from ._datamodels import HttpMethods, Channel, Embed, JSONErrorCodes
+from ._datamodel_builders import EMBED_DESCRIPTION_LIMIT, EMBEDS_TOTAL_LIMIT, MESSAGE_EMBEDS_LIMIT, MESSAGE_CONTENT_LIMIT
+from ._errors import ApxHttpDiscordError, HTTPException
+from ._retry import RETRYABLE_ERRORS
+
+logger = logging.getLogger(__name__)
+
+def _truncate(line, limit):
+    return line if len(line) <= limit else line[:limit - 1] + "…"
+
+def pack_content(lines):
+    """
+    Pops lines from the front of the deque into one message content of at most MESSAGE_CONTENT_LIMIT characters.
+    Returns the content and the length of the popped lines, a line break included per line.
+    """
+    line = lines.popleft()
+    consumed = len(line) + 1
+    parts = [_truncate(line, MESSAGE_CONTENT_LIMIT)]
+    length = len(parts[0])
+    while(lines and length + 1 + len(lines[0]) <= MESSAGE_CONTENT_LIMIT):
+        line = lines.popleft()
+        parts.append(line)
+        length += 1 + len(line)
+        consumed += len(line) + 1
+    return "\n".join(parts), consumed
+
+def pack_embeds(lines, color=None):
+    """
+    Pops lines from the front of the deque into the descriptions of up to MESSAGE_EMBEDS_LIMIT embeds,
+    within the description limit of each embed and the total embed limit of a message.
+    Returns the embeds and the length of the popped lines, a line break included per line.
+    """
+    embeds = []
+    parts = []
+    length = total = consumed = 0
+    while(lines):
+        line = _truncate(lines[0], EMBED_DESCRIPTION_LIMIT)
+        if(parts and length + 1 + len(line) > EMBED_DESCRIPTION_LIMIT):
+            if(len(embeds) + 1 == MESSAGE_EMBEDS_LIMIT):
+                break
+            embeds.append(Embed(description="\n".join(parts), color=color))
+            parts = []
+            length = 0
+        added = len(line) + (1 if parts else 0)
+        if(total + added > EMBEDS_TOTAL_LIMIT):
+            break
+        consumed += len(lines.popleft()) + 1
+        parts.append(line)
+        length += added
+        total += added
+    if(parts):
+        embeds.append(Embed(description="\n".join(parts), color=color))
+    return embeds, consumed
+
+class _WebhookBuffer():
+
+    __slots__ = ("webhook", "lines", "length", "full", "task")
+
+    def __init__(self, webhook):
+        self.webhook = webhook
+        self.lines = collections.deque()
+        self.length = 0
+        self.full = asyncio.Event()
+        self.task = None
+
+class WebhookSink():
+    """
+    Buffers short messages(log lines, alerts) per webhook and executes them in batches, one request per flush holding
+    up to MESSAGE_EMBEDS_LIMIT embeds(embeds=True) or MESSAGE_CONTENT_LIMIT characters of content.
+    A webhook is flushed every interval seconds, or as soon as its buffer holds more than one request can carry.
+    Each webhook keeps at most max_buffered lines, the oldest lines are dropped beyond that.
+    Failed flushes are logged and their lines counted as dropped, webhooks answering Unknown Webhook stop being flushed.
+    """
+
+    def __init__(self, support, interval=2.0, embeds=True, color=None, username=None, max_buffered=10_000):
+        self.support = support
+        self.interval = interval
+        self.embeds = embeds
+        self.color = color
+        self.username = username
+        self.max_buffered = max_buffered
+        self.sent = 0
+        self.dropped = 0
+        self._buffers = {}
+        self._closed = False
+
+    @property
+    def _capacity(self):
+        return EMBEDS_TOTAL_LIMIT if self.embeds else MESSAGE_CONTENT_LIMIT
+
+    def emit(self, webhook, line):
+        """
+        Buffers line for webhook(a Webhook or any object with id and token), must be called on the event loop thread.
+        """
+        if(self._closed):
+            raise RuntimeError("the sink is closed")
+        buffer = self._buffers.get(webhook.id)
+        if(buffer is None):
+            buffer = self._buffers[webhook.id] = _WebhookBuffer(webhook)
+            buffer.task = asyncio.ensure_future(self._flush_loop(buffer))
+        if(buffer.task.done()):
+            self.dropped += 1
+            return
+        buffer.lines.append(line)
+        buffer.length += len(line) + 1
+        if(len(buffer.lines) > self.max_buffered):
+            buffer.length -= len(buffer.lines.popleft()) + 1
+            self.dropped += 1
+        if(buffer.length > self._capacity):
+            buffer.full.set()
+
+    async def _flush_loop(self, buffer):
+        while(True):
+            try:
+                await asyncio.wait_for(buffer.full.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+            if(not await self._flush(buffer)):
+                return
+            if(self._closed and not buffer.lines):
+                return
+
+    async def _flush(self, buffer):
+        """
+        Sends the buffered lines until the buffer is below a full request, returns False once the webhook is unusable.
+        """
+        buffer.full.clear()
+        while(buffer.lines):
+            count = len(buffer.lines)
+            if(self.embeds):
+                embeds, consumed = pack_embeds(buffer.lines, self.color)
+                payload = Channel.ExecuteWebhookJSONParams(embeds=embeds, username=self.username)
+            else:
+                content, consumed = pack_content(buffer.lines)
+                payload = Channel.ExecuteWebhookJSONParams(content=content, username=self.username)
+            packed = count - len(buffer.lines)
+            buffer.length -= consumed
+            try:
+                await self.support.send(Channel.WebhookUrls.EXECUTE_WEBHOOK, HttpMethods.POST, {"webhook": buffer.webhook}, payload=payload)
+                self.sent += packed
+            except HTTPException as error:
+                self.dropped += packed
+                logger.warning("flushing %d lines to webhook %s failed: %s", packed, buffer.webhook.id, error)
+                if(error.code == JSONErrorCodes.UNKNOWN_WEBHOOK):
+                    self.dropped += len(buffer.lines)
+                    buffer.lines.clear()
+                    buffer.length = 0
+                    return False
+            except (ApxHttpDiscordError, *RETRYABLE_ERRORS) as error:
+                self.dropped += packed
+                logger.warning("flushing %d lines to webhook %s failed: %s", packed, buffer.webhook.id, error)
+            if(buffer.length <= self._capacity and not self._closed):
+                break
+        return True
+
+    async def close(self):
+        """
+        Flushes every buffer and stops the flush tasks.
+        """
+        self._closed = True
+        for buffer in self._buffers.values():
+            buffer.full.set()
+        await asyncio.gather(*(buffer.task for buffer in self._buffers.values()), return_exceptions=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
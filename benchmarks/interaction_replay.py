@@ -0,0 +1,131 @@
+"""
+Replays a recording of interaction requests(apx_httpdiscord._replay.InteractionRecorder) offline through the
+stages of the interactions endpoint: decode -> dispatch -> InteractionResponse encode, and reports the throughput
+and the p50/p95/p99 latency of every stage.
+
+By default every interaction is dispatched to a handler returning the response recorded for it, --app module:attribute
+dispatches to the handlers of an InteractionsApp instead. --rate paces the requests(open loop), 0 replays as fast as possible:
+    python benchmarks/interaction_replay.py recording.bin.gz --rate 2000 --passes 5
+
+--synthesize N writes a recording of N synthetic command and component interactions to replay without a capture:
+    python benchmarks/interaction_replay.py recording.bin.gz --synthesize 10000
+"""
+import argparse
+import asyncio
+import importlib
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import msgspec
+
+from apx_httpdiscord._datamodels import InteractionTypes, InteractionResponse, InteractionCallbackTypes, InteractionCallbackData
+from apx_httpdiscord._interactions_server import INTERACTION_DECODER, RESPONSE_ENCODER, PONG_RESPONSE
+from apx_httpdiscord._replay import InteractionRecorder, read_recording
+
+STAGES = ("decode", "dispatch", "encode", "total")
+
+def synthesize(path, count, seed):
+    rng = random.Random(seed)
+    with InteractionRecorder(path) as recorder:
+        for n in range(count):
+            body = {
+                "id": str(1300000000000000000 + n), "application_id": "1200000000000000000",
+                "guild_id": "1100000000000000000", "channel_id": "1000000000000000000",
+                "member": {"roles": [str(1110000000000000000 + role) for role in range(rng.randrange(5))], "deaf": False, "mute": False, "user": {"id": str(n), "username": f"user{n}", "discriminator": "0"}},
+                "token": "aW50ZXJhY3Rpb246dG9rZW4" * 4, "version": 1, "app_permissions": "2248473465835073", "locale": "en-US",
+                "authorizing_integration_owners": {"0": "1100000000000000000"}, "context": 0, "attachment_size_limit": 26214400,
+            }
+            if(rng.random() < 0.3):
+                body["type"] = InteractionTypes.MESSAGE_COMPONENT
+                body["data"] = {"custom_id": f"page:{rng.randrange(100)}", "component_type": 2}
+                response = InteractionResponse(type=InteractionCallbackTypes.UPDATE_MESSAGE, data=InteractionCallbackData(content=f"page {n}"))
+            else:
+                body["type"] = InteractionTypes.APPLICATION_COMMAND
+                body["data"] = {"id": "1", "name": "report", "type": 1, "options": [{"name": "days", "type": 4, "value": rng.randrange(30)}]}
+                response = InteractionResponse(type=InteractionCallbackTypes.CHANNEL_MESSAGE_WITH_SOURCE, data=InteractionCallbackData(content="x" * rng.randrange(2000)))
+            recorder.record(msgspec.json.encode(body), RESPONSE_ENCODER.encode(response))
+    print(f"wrote {count} synthetic interactions to {path}")
+
+def recorded_dispatch(records):
+    decoder = msgspec.json.Decoder(InteractionResponse)
+    responses = {}
+    for body, response in records:
+        interaction = INTERACTION_DECODER.decode(body)
+        if(interaction.type != InteractionTypes.PING):
+            responses[interaction.id] = decoder.decode(response)
+    async def dispatch(interaction):
+        return responses[interaction.id]
+    return dispatch
+
+def load_dispatch(target):
+    module, _, attribute = target.partition(":")
+    return getattr(importlib.import_module(module), attribute).dispatch
+
+async def replay(records, dispatch, requests, rate):
+    timings = {stage: [] for stage in STAGES}
+    mismatches = 0
+    clock = time.perf_counter
+    started = clock()
+    for n in range(requests):
+        if(rate):
+            delay = started + n / rate - clock()
+            if(delay > 0):
+                await asyncio.sleep(delay)
+        body, recorded = records[n % len(records)]
+
+        t0 = clock()
+        interaction = INTERACTION_DECODER.decode(body)
+        t1 = clock()
+        if(interaction.type == InteractionTypes.PING):
+            t2 = t1
+            encoded = PONG_RESPONSE
+        else:
+            response = await dispatch(interaction)
+            t2 = clock()
+            encoded = RESPONSE_ENCODER.encode(response)
+        t3 = clock()
+
+        timings["decode"].append(t1 - t0)
+        timings["dispatch"].append(t2 - t1)
+        timings["encode"].append(t3 - t2)
+        timings["total"].append(t3 - t0)
+        mismatches += encoded != recorded
+    return timings, clock() - started, mismatches
+
+def report(timings, elapsed, mismatches):
+    requests = len(timings["total"])
+    print(f"requests:    {requests} in {elapsed:.2f}s, {requests / elapsed:,.0f} requests/s")
+    print(f"mismatching responses: {mismatches}")
+    print(f"{'stage':10} {'busy/s':>12} {'p50 us':>9} {'p95 us':>9} {'p99 us':>9}")
+    for stage in STAGES:
+        samples = timings[stage]
+        quantiles = statistics.quantiles(samples, n=100) if len(samples) > 1 else samples * 99
+        busy = sum(samples)
+        throughput = requests / busy if busy else float("inf")
+        print(f"{stage:10} {throughput:>12,.0f} {quantiles[49] * 1e6:>9.1f} {quantiles[94] * 1e6:>9.1f} {quantiles[98] * 1e6:>9.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("recording")
+    parser.add_argument("--app", help="module:attribute of an InteractionsApp dispatching the interactions")
+    parser.add_argument("--rate", type=float, default=0.0, help="requests per second, 0 for unthrottled")
+    parser.add_argument("--passes", type=int, default=1, help="times the recording is replayed")
+    parser.add_argument("--synthesize", type=int, metavar="N", help="write N synthetic interactions to the recording and exit")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if(args.synthesize):
+        return synthesize(args.recording, args.synthesize, args.seed)
+    records = read_recording(args.recording)
+    if(not records):
+        raise SystemExit(f"{args.recording} holds no records")
+    dispatch = load_dispatch(args.app) if args.app else recorded_dispatch(records)
+    report(*asyncio.run(replay(records, dispatch, len(records) * args.passes, args.rate)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Load test harness for the interactions endpoint ASGI application.
+
+In-process mode(default) drives InteractionsApp directly through the ASGI interface and measures the application
+cost per request, which is what sizes the CPU of a pod:
+    python benchmarks/interactions_load.py --concurrency 64 --duration 10 --ping-ratio 0.1
+
+HTTP mode sends signed requests to a running server(e.g uvicorn on the pod under test) and includes the server
+and network overhead. The server must be started with the public key printed by --print-key, and with its replay
+cache disabled(SignatureVerifier(..., replay_cache_size=0)) since the generated requests are sent repeatedly:
+    python benchmarks/interactions_load.py --url http://127.0.0.1:8000/ --seed 1 --concurrency 256
+
+Requires PyNaCl to sign the generated requests.
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import msgspec
+from nacl.signing import SigningKey
+
+from apx_httpdiscord._datamodels import InteractionResponse, InteractionCallbackData, InteractionCallbackTypes
+from apx_httpdiscord._http import HttpConnectionPool
+from apx_httpdiscord._interactions_server import InteractionsApp
+from apx_httpdiscord._signature import SignatureVerifier
+
+PING_BODY = b'{"id":"1","application_id":"2","type":1,"token":"t","version":1,"app_permissions":"0","authorizing_integration_owners":{},"attachment_size_limit":26214400}'
+
+def command_body(n):
+    return msgspec.json.encode({
+        "id": str(1300000000000000000 + n),
+        "application_id": "1200000000000000000",
+        "type": 2,
+        "data": {"id": "1", "name": "report", "type": 1, "options": [{"name": "days", "type": 4, "value": n % 30}]},
+        "guild_id": "1100000000000000000",
+        "channel_id": "1000000000000000000",
+        "member": {"roles": [], "deaf": False, "mute": False, "user": {"id": "9", "username": "user", "discriminator": "0"}},
+        "token": "aW50ZXJhY3Rpb246dG9rZW4" * 4,
+        "version": 1,
+        "app_permissions": "2248473465835073",
+        "locale": "en-US",
+        "authorizing_integration_owners": {"0": "1100000000000000000"},
+        "context": 0,
+        "attachment_size_limit": 26214400,
+    })
+
+def signed_requests(signing_key, count, ping_ratio, rng):
+    requests = []
+    for n in range(count):
+        body = PING_BODY if rng.random() < ping_ratio else command_body(n)
+        timestamp = str(int(time.time())).encode()
+        signature = signing_key.sign(timestamp + body).signature.hex().encode()
+        requests.append((timestamp, signature, body))
+    return requests
+
+def build_app(public_key, workers):
+    #The generated requests are cycled through, so the replay cache is disabled.
+    app = InteractionsApp(public_key, verifier=SignatureVerifier(public_key, max_workers=workers, replay_cache_size=0))
+    response = InteractionResponse(
+        type=InteractionCallbackTypes.CHANNEL_MESSAGE_WITH_SOURCE,
+        data=InteractionCallbackData(content="ok"),
+    )
+
+    @app.handler(2)
+    async def command(interaction):
+        return response
+
+    return app
+
+async def call_app(app, timestamp, signature, body):
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/",
+        "headers": [(b"x-signature-ed25519", signature), (b"x-signature-timestamp", timestamp), (b"content-type", b"application/json")],
+    }
+    sent = []
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+    async def send(message):
+        sent.append(message)
+    await app(scope, receive, send)
+    return sent[0]["status"]
+
+async def call_http(pool, path, timestamp, signature, body):
+    headers = {"Content-Type": "application/json", "X-Signature-Ed25519": signature.decode(), "X-Signature-Timestamp": timestamp.decode()}
+    return (await pool.request("POST", path, headers, body)).status
+
+async def run(args):
+    rng = random.Random(args.seed)
+    signing_key = SigningKey(rng.randbytes(32))
+    public_key = signing_key.verify_key.encode().hex()
+    requests = signed_requests(signing_key, args.requests, args.ping_ratio, rng)
+
+    if(args.url):
+        pool = HttpConnectionPool(args.url, max_connections=args.concurrency)
+        path = "/" + args.url.split("/", 3)[3] if args.url.count("/") >= 3 else "/"
+        call = lambda request: call_http(pool, path, *request)
+    else:
+        app = build_app(public_key, args.workers)
+        call = lambda request: call_app(app, *request)
+
+    latencies = []
+    statuses = {}
+    deadline = time.perf_counter() + args.duration
+
+    async def worker(offset):
+        n = offset
+        while(time.perf_counter() < deadline):
+            request = requests[n % len(requests)]
+            n += args.concurrency
+            started = time.perf_counter()
+            status = await call(request)
+            latencies.append(time.perf_counter() - started)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(offset) for offset in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+    if(args.url):
+        await pool.close()
+
+    latencies.sort()
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    print(f"mode:        {'http ' + args.url if args.url else 'in-process'}")
+    print(f"requests:    {len(latencies)} in {elapsed:.2f}s, statuses {statuses}")
+    print(f"throughput:  {len(latencies) / elapsed:,.0f} requests/s")
+    print(f"latency ms:  p50 {quantiles[49] * 1e3:.3f}  p95 {quantiles[94] * 1e3:.3f}  p99 {quantiles[98] * 1e3:.3f}")
+    return statuses
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="interactions endpoint of a running server, in-process when omitted")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds")
+    parser.add_argument("--requests", type=int, default=2000, help="distinct signed requests to cycle through")
+    parser.add_argument("--workers", type=int, default=None, help="signature verification threads, 0 verifies inline")
+    parser.add_argument("--ping-ratio", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0, help="seeds the signing key and the request mix")
+    parser.add_argument("--print-key", action="store_true", help="print the public key for --seed and exit")
+    args = parser.parse_args()
+    if(args.print_key):
+        print(SigningKey(random.Random(args.seed).randbytes(32)).verify_key.encode().hex())
+        return
+    statuses = asyncio.run(run(args))
+    #Any other status means the run measured an error path rather than the interactions.
+    if(set(statuses) != {200}):
+        print(f"{sum(count for status, count in statuses.items() if status != 200)} responses were not 200")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Overhead of DiscordWebhookHandler on the thread calling logger.error(), compared with a NullHandler and
+with a StreamHandler writing to memory. The handler ships to a local server answering every request after --delay
+seconds, standing in for a slow or rate limited discord:
+    python benchmarks/logging_overhead.py --calls 200000 --delay 1.0
+"""
+import argparse
+import asyncio
+import io
+import logging
+import os
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from apx_httpdiscord._logging import DiscordWebhookHandler, DROP_NEWEST, DROP_OLDEST
+
+def start_slow_server(delay):
+    ready = threading.Event()
+    address = []
+
+    async def handle(reader, writer):
+        while(True):
+            request_line = await reader.readline()
+            if(not request_line):
+                break
+            length = 0
+            while((line := await reader.readline()) != b"\r\n"):
+                name, _, value = line.partition(b":")
+                if(name.lower() == b"content-length"):
+                    length = int(value)
+            await reader.readexactly(length)
+            await asyncio.sleep(delay)
+            writer.write(b"HTTP/1.1 204 No Content\r\ncontent-length: 0\r\n\r\n")
+            await writer.drain()
+        writer.close()
+
+    async def serve():
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        address.append(server.sockets[0].getsockname())
+        ready.set()
+        await server.serve_forever()
+
+    threading.Thread(target=asyncio.run, args=(serve(),), daemon=True).start()
+    ready.wait()
+    return address[0]
+
+def measure(logger, calls):
+    samples = []
+    clock = time.perf_counter_ns
+    for n in range(calls):
+        started = clock()
+        logger.error("request %d failed: %s", n, "upstream timeout")
+        samples.append(clock() - started)
+    return samples
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--delay", type=float, default=1.0, help="seconds the local server takes to answer")
+    parser.add_argument("--capacity", type=int, default=10_000)
+    args = parser.parse_args()
+
+    host, port = start_slow_server(args.delay)
+    cases = [
+        ("NullHandler", logging.NullHandler()),
+        ("StreamHandler(memory)", logging.StreamHandler(io.StringIO())),
+        ("webhook drop_newest", DiscordWebhookHandler("/webhooks/1/token", capacity=args.capacity, overflow=DROP_NEWEST, base_url=f"http://{host}:{port}/api/v10")),
+        ("webhook drop_oldest", DiscordWebhookHandler("/webhooks/2/token", capacity=args.capacity, overflow=DROP_OLDEST, base_url=f"http://{host}:{port}/api/v10")),
+    ]
+
+    print(f"{'handler':24} {'mean ns':>9} {'p50 ns':>9} {'p99 ns':>9} {'max us':>9} {'dropped':>9}")
+    for name, handler in cases:
+        logger = logging.getLogger(f"benchmark.{name}")
+        logger.propagate = False
+        logger.addHandler(handler)
+        samples = measure(logger, args.calls)
+        quantiles = statistics.quantiles(samples, n=100)
+        dropped = getattr(handler, "dropped", 0)
+        print(f"{name:24} {statistics.fmean(samples):>9.0f} {quantiles[49]:>9.0f} {quantiles[98]:>9.0f} {max(samples) / 1e3:>9.0f} {dropped:>9}")
+        if(isinstance(handler, DiscordWebhookHandler)):
+            handler.close(timeout=0)
+
+if __name__ == "__main__":
+    main()
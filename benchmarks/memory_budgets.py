@@ -0,0 +1,154 @@
+"""
+Deep in-memory size of decoded models compared with the budgets of benchmarks/memory_budgets.json, exits with status 1
+when a model change makes an entry exceed its budget, or makes a budgeted entry impossible to build or decode. Entries are the scenarios below(e.g a full Guild with 250 roles
+and 500 emojis) and every model at the typical and worst case profiles of _synthetic:
+    python benchmarks/memory_budgets.py
+    python benchmarks/memory_budgets.py --report --filter "Guild|Message"
+    python benchmarks/memory_budgets.py --update --headroom 0.2
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import tracemalloc
+import zlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import msgspec
+
+from apx_httpdiscord import _datamodels
+from apx_httpdiscord._profiling import deep_sizeof
+from apx_httpdiscord._synthetic import SyntheticFactory
+
+from models import model_types
+
+BUDGETS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "memory_budgets.json")
+
+#name -> (model, profile, {field: (item model, item profile, count)}), the fields are filled with count items.
+SCENARIOS = {
+    "Guild[250 roles, 500 emojis]": (_datamodels.Guild, "typical", {
+        "roles": (_datamodels.Role, "typical", 250),
+        "emojis": (_datamodels.Emoji, "typical", 500),
+        "stickers": (_datamodels.Sticker, "typical", 5),
+    }),
+    "Message[10 embeds, 5 components]": (_datamodels.Message, "typical", {
+        "embeds": (_datamodels.Embed, "worst", 10),
+        "components": (_datamodels.Component, "worst", 5),
+        "mentions": (_datamodels.User, "typical", 20),
+        "reactions": (_datamodels.Reaction, "typical", 20),
+    }),
+}
+
+def scenario_body(name, model, profile, fields):
+    factory = SyntheticFactory.from_profile(profile, zlib.crc32(name.encode()))
+    value = factory.builtins(model)
+    for field, (item_model, item_profile, count) in fields.items():
+        items = SyntheticFactory.from_profile(item_profile, zlib.crc32(f"{name}:{field}".encode()))
+        value[field] = [items.builtins(item_model) for _ in range(count)]
+    return msgspec.json.encode(value)
+
+def measure(model, body):
+    """
+    Deep size of the decoded instance and bytes allocated by the decode which are still held by the instance.
+    """
+    decoder = msgspec.json.Decoder(model)
+    tracemalloc.start()
+    try:
+        instance = decoder.decode(body)
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return deep_sizeof(instance), retained
+
+#Errors of models _synthetic cannot build or msgspec cannot decode, e.g unresolved forward references.
+MEASURE_ERRORS = (TypeError, NameError, ValueError, msgspec.MsgspecError)
+
+def entries(selected):
+    """
+    Yields (name, model, body) of the scenarios and of every model at the typical and worst case profiles
+    for which selected(name) is true, body is the exception raised when the body cannot be built.
+    """
+    for name, (model, profile, fields) in SCENARIOS.items():
+        if(selected(name)):
+            try:
+                yield name, model, scenario_body(name, model, profile, fields)
+            except MEASURE_ERRORS as error:
+                yield name, model, error
+    for qualname, model in model_types().items():
+        for profile in ("typical", "worst"):
+            name = f"{qualname}[{profile}]"
+            if(not selected(name)):
+                continue
+            try:
+                body = SyntheticFactory.from_profile(profile, zlib.crc32(name.encode())).encode(model)
+            except MEASURE_ERRORS as error:
+                body = error
+            yield name, model, body
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budgets", default=BUDGETS_FILE)
+    parser.add_argument("--filter", help="regular expression the entry names must match")
+    parser.add_argument("--report", action="store_true", help="list every entry, not only the budgeted ones")
+    parser.add_argument("--update", action="store_true", help="rewrite the budgets of the budgeted entries and scenarios from this run")
+    parser.add_argument("--headroom", type=float, default=0.25, help="margin of the updated budgets over the measured sizes")
+    args = parser.parse_args()
+
+    budgets = {}
+    if(os.path.exists(args.budgets)):
+        with open(args.budgets) as file:
+            budgets = json.load(file)
+
+    def selected(name):
+        if(args.filter and not re.search(args.filter, name)):
+            return False
+        return args.report or name in budgets or (args.update and name in SCENARIOS)
+
+    over = []
+    failed = []
+    measured = set()
+    print(f"{'entry':52} {'json bytes':>10} {'deep size':>10} {'allocated':>10} {'budget':>10}")
+    for name, model, body in entries(selected):
+        budget = budgets.get(name)
+        measured.add(name)
+        try:
+            if(isinstance(body, Exception)):
+                raise body
+            size, allocated = measure(model, body)
+        except MEASURE_ERRORS as error:
+            if(budget is None):
+                print(f"{name[:52]:52} skipped: {error}")
+            else:
+                print(f"{name[:52]:52} FAILED: {error}")
+                failed.append(name)
+            continue
+        status = ""
+        if(budget is not None and size > budget):
+            status = f"  OVER BUDGET by {size - budget} bytes"
+            over.append(name)
+        print(f"{name[:52]:52} {len(body):>10} {size:>10} {allocated:>10} {budget if budget is not None else '-':>10}{status}")
+        if(args.update and (name in budgets or name in SCENARIOS)):
+            budgets[name] = int(size * (1 + args.headroom))
+
+    #Budgeted entries the models no longer produce, e.g a renamed model.
+    for name in budgets:
+        if(name not in measured and not (args.filter and not re.search(args.filter, name))):
+            print(f"{name[:52]:52} FAILED: no such entry")
+            failed.append(name)
+
+    if(args.update):
+        with open(args.budgets, "w") as file:
+            json.dump(dict(sorted(budgets.items())), file, indent=1)
+            file.write("\n")
+        print(f"budgets written to {args.budgets}")
+    elif(over):
+        print(f"\n{len(over)} entries over budget: {', '.join(over)}")
+    if(failed):
+        print(f"\n{len(failed)} budgeted entries could not be measured: {', '.join(failed)}")
+    if(failed or (over and not args.update)):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Decode and encode throughput and allocations of every msgspec Struct of _datamodels, with synthetic fixtures of
+small(required fields only), typical and worst case(every field set, long lists) sizes.
+Results are stored as JSON(benchmarks/results by default) and compared with a previous run to spot the cost of model edits:
+    python benchmarks/models.py --sizes typical worst --filter "Message|Guild"
+    python benchmarks/models.py --compare benchmarks/results/models-<previous run>.json --threshold 0.1
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import time
+import tracemalloc
+import zlib
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+import msgspec
+
+from apx_httpdiscord import _datamodels
+from apx_httpdiscord._synthetic import SyntheticFactory, PROFILES
+
+def model_types():
+    """
+    Every Struct of _datamodels, nested classes included, by qualified name.
+    """
+    models = {}
+    stack = [value for value in vars(_datamodels).values() if isinstance(value, type)]
+    while(stack):
+        value = stack.pop()
+        if(not issubclass(value, msgspec.Struct) or value is msgspec.Struct or value.__module__ != _datamodels.__name__):
+            continue
+        if(models.setdefault(value.__qualname__, value) is value):
+            stack.extend(nested for nested in vars(value).values() if isinstance(nested, type))
+    return dict(sorted(models.items()))
+
+def fixture(model, size):
+    factory = SyntheticFactory.from_profile(size, zlib.crc32(f"{model.__qualname__}:{size}".encode()))
+    return factory.encode(model)
+
+def per_operation(function, argument, min_time, repeat):
+    """
+    Best time in seconds of one call out of repeat runs lasting at least min_time each.
+    """
+    number = 1
+    while(True):
+        started = time.perf_counter()
+        for _ in range(number):
+            function(argument)
+        elapsed = time.perf_counter() - started
+        if(elapsed >= min_time):
+            break
+        number *= 2 if elapsed <= 0 else max(2, int(min_time / elapsed) + 1)
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        started = time.perf_counter()
+        for _ in range(number):
+            function(argument)
+        best = min(best, (time.perf_counter() - started) / number)
+    return best
+
+def allocations(function, argument):
+    """
+    Peak bytes allocated by one call and bytes still held by its result.
+    """
+    tracemalloc.start()
+    try:
+        result = function(argument)
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak, retained
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(models, sizes, min_time, repeat):
+    results = {}
+    skipped = []
+    encoder = msgspec.json.Encoder()
+    for name, model in models.items():
+        try:
+            decoder = msgspec.json.Decoder(model)
+        except (TypeError, NameError) as error:
+            skipped.append((name, str(error)))
+            continue
+        for size in sizes:
+            try:
+                body = fixture(model, size)
+                instance = decoder.decode(body)
+            except (TypeError, NameError, msgspec.ValidationError) as error:
+                skipped.append((f"{name}[{size}]", str(error)))
+                continue
+            decode_time = per_operation(decoder.decode, body, min_time, repeat)
+            encode_time = per_operation(encoder.encode, instance, min_time, repeat)
+            decode_peak, retained = allocations(decoder.decode, body)
+            encode_peak, _ = allocations(encoder.encode, instance)
+            results[f"{name}[{size}]"] = {
+                "model": name, "size": size, "bytes": len(body),
+                "decode_ns": decode_time * 1e9, "encode_ns": encode_time * 1e9,
+                "decode_mb_s": len(body) / decode_time / 1e6, "encode_mb_s": len(body) / encode_time / 1e6,
+                "decode_peak_bytes": decode_peak, "decode_retained_bytes": retained, "encode_peak_bytes": encode_peak,
+            }
+            print(
+                f"{name[:44]:44} {size:8} {len(body):>9} {decode_time * 1e6:>10.2f} {encode_time * 1e6:>10.2f} "
+                f"{len(body) / decode_time / 1e6:>8.1f} {decode_peak:>10} {retained:>10}",
+                flush=True,
+            )
+    return results, skipped
+
+def compare(results, previous, threshold, selected=lambda entry: True):
+    """
+    Prints the entries whose decode or encode time, or retained bytes, changed by more than threshold(a ratio).
+    Entries of previous missing from results although selected(previous entry) is true(e.g a model which no longer
+    decodes) are regressions too. Returns the number of regressions.
+    """
+    regressions = 0
+    print(f"\ncompared with {previous.get('commit')} of {previous.get('date')}, changes above {threshold:.0%}:")
+    for key, before in previous["results"].items():
+        if(key not in results and selected(before)):
+            regressions += 1
+            print(f"  {key:52} missing from this run")
+    for key, entry in results.items():
+        before = previous["results"].get(key)
+        if(before is None):
+            continue
+        for metric in ("decode_ns", "encode_ns", "decode_retained_bytes"):
+            if(not before[metric]):
+                continue
+            change = entry[metric] / before[metric] - 1
+            if(abs(change) > threshold):
+                regressions += change > 0
+                print(f"  {key:52} {metric:22} {before[metric]:>12.0f} -> {entry[metric]:>12.0f} ({change:+.1%})")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", choices=PROFILES, default=list(PROFILES))
+    parser.add_argument("--filter", help="regular expression the qualified model names must match")
+    parser.add_argument("--min-time", type=float, default=0.02, help="seconds of every timing run")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="results file, benchmarks/results/models-<date>-<commit>.json by default")
+    parser.add_argument("--compare", help="results file of a previous run")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args()
+
+    models = model_types()
+    if(args.filter):
+        models = {name: model for name, model in models.items() if re.search(args.filter, name)}
+
+    print(f"{'model':44} {'size':8} {'bytes':>9} {'decode us':>10} {'encode us':>10} {'dec MB/s':>8} {'dec peak':>10} {'retained':>10}")
+    results, skipped = run(models, args.sizes, args.min_time, args.repeat)
+    for name, error in skipped:
+        print(f"skipped {name}: {error}")
+
+    commit = git_commit()
+    now = datetime.datetime.now(datetime.timezone.utc)
+    output = args.output or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "results", f"models-{now:%Y%m%dT%H%M%S}-{commit or 'unknown'}.json",
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as file:
+        json.dump({
+            "date": now.isoformat(), "commit": commit, "python": platform.python_version(), "msgspec": msgspec.__version__,
+            "platform": platform.platform(), "results": results,
+        }, file, indent=1)
+    print(f"results stored in {output}")
+
+    if(args.compare):
+        with open(args.compare) as file:
+            previous = json.load(file)
+        selected = lambda entry: entry["model"] in models and entry["size"] in args.sizes
+        if(compare(results, previous, args.threshold, selected)):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Routes synthetic interactions through InteractionRouter and through a linear scan of the same registrations,
+the equivalent of an if/elif chain over command names and custom_id prefixes:
+    python benchmarks/router_dispatch.py --interactions 1000000 --commands 50
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import msgspec
+
+from apx_httpdiscord._datamodels import Interaction
+from apx_httpdiscord._router import InteractionRouter
+
+async def handler(interaction, remainder):
+    return None
+
+def build_paths(commands):
+    paths = []
+    for n in range(commands):
+        if(n % 3 == 0):
+            paths.append(f"command{n}")
+        elif(n % 3 == 1):
+            paths.extend(f"command{n} sub{m}" for m in range(5))
+        else:
+            paths.extend(f"command{n} group{g} sub{m}" for g in range(3) for m in range(5))
+    prefixes = [f"component{n}:" for n in range(commands)]
+    return paths, prefixes
+
+def interaction_body(rng, paths, prefixes, n):
+    body = {
+        "id": str(n), "application_id": "1", "token": "t", "version": 1, "app_permissions": "0",
+        "authorizing_integration_owners": {}, "attachment_size_limit": 26214400,
+    }
+    if(rng.random() < 0.5):
+        body["type"] = 3
+        body["data"] = {"custom_id": rng.choice(prefixes) + str(rng.randrange(10 ** 6)), "component_type": 2}
+        return body
+    name, *subcommands = rng.choice(paths).split()
+    options = [{"name": "value", "type": 4, "value": n}]
+    for segment in reversed(subcommands):
+        options = [{"name": segment, "type": 1 if segment.startswith("sub") else 2, "options": options}]
+    body["type"] = 2
+    body["data"] = {"id": "1", "name": name, "type": 1, "options": options}
+    return body
+
+def linear_route(routes, interaction):
+    data = interaction.data
+    if(interaction.type == 3):
+        for interaction_type, prefix, function in routes:
+            if(interaction_type == 3 and data.custom_id.startswith(prefix)):
+                return function
+        return None
+    path = [data.name]
+    options = data.options
+    while(options and options[0].type in (1, 2)):
+        path.append(options[0].name)
+        options = options[0].options
+    path = tuple(path)
+    for interaction_type, key, function in routes:
+        if(interaction_type == 2 and key == path):
+            return function
+    return None
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--interactions", type=int, default=1_000_000)
+    parser.add_argument("--distinct", type=int, default=10_000, help="distinct synthetic interactions cycled through")
+    parser.add_argument("--commands", type=int, default=50, help="top level commands and component prefixes registered")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    paths, prefixes = build_paths(args.commands)
+    router = InteractionRouter()
+    for path in paths:
+        router.command(path, handler)
+    for prefix in prefixes:
+        router.component(prefix, handler)
+    router.compile()
+
+    decoder = msgspec.json.Decoder(list[Interaction])
+    interactions = decoder.decode(msgspec.json.encode([interaction_body(rng, paths, prefixes, n) for n in range(args.distinct)]))
+    batch = [interactions[n % len(interactions)] for n in range(args.interactions)]
+
+    route = router.route
+    started = time.perf_counter()
+    for interaction in batch:
+        if(route(interaction)[0] is None):
+            raise AssertionError("unrouted interaction")
+    tree_elapsed = time.perf_counter() - started
+
+    routes = router._routes
+    started = time.perf_counter()
+    for interaction in batch:
+        if(linear_route(routes, interaction) is None):
+            raise AssertionError("unrouted interaction")
+    linear_elapsed = time.perf_counter() - started
+
+    print(f"routes:      {len(routes)} ({len(paths)} command paths, {len(prefixes)} custom_id prefixes)")
+    print(f"{'':12} {'seconds':>8} {'routes/s':>12} {'ns/route':>9}")
+    for name, elapsed in (("tree", tree_elapsed), ("linear", linear_elapsed)):
+        print(f"{name:12} {elapsed:>8.2f} {args.interactions / elapsed:>12,.0f} {elapsed / args.interactions * 1e9:>9.0f}")
+
+if __name__ == "__main__":
+    main()
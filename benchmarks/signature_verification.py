@@ -0,0 +1,70 @@
+"""
+Throughput of the interaction signature verification stage per thread pool size.
+
+For every worker count the same set of unique signed requests is verified through SignatureVerifier.verify with
+enough concurrent callers to keep the pool busy, then verified again to measure the replay rejection path:
+    python benchmarks/signature_verification.py --requests 20000 --workers 0,1,2,4,8
+
+A worker count of 0 verifies inline on the event loop thread. Requires PyNaCl.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from nacl.signing import SigningKey
+
+from apx_httpdiscord._signature import SignatureVerifier
+
+def signed_requests(signing_key, count, body_size):
+    timestamp = str(int(time.time())).encode()
+    requests = []
+    for n in range(count):
+        body = b'{"type":2,"id":"%d","data":"%s"}' % (n, b"x" * body_size)
+        requests.append((timestamp, body, signing_key.sign(timestamp + body).signature.hex().encode()))
+    return requests
+
+async def measure(verifier, requests, concurrency):
+    accepted = 0
+
+    async def caller(offset):
+        nonlocal accepted
+        for n in range(offset, len(requests), concurrency):
+            valid = await verifier.verify(*requests[n])
+            accepted += valid
+
+    started = time.perf_counter()
+    await asyncio.gather(*(caller(offset) for offset in range(concurrency)))
+    return len(requests) / (time.perf_counter() - started), accepted
+
+async def run(args):
+    signing_key = SigningKey.generate()
+    public_key = signing_key.verify_key.encode().hex()
+    requests = signed_requests(signing_key, args.requests, args.body_size)
+
+    print(f"{'workers':>8} {'verified/s':>12} {'replays rejected/s':>20}")
+    for workers in args.workers:
+        verifier = SignatureVerifier(public_key, max_workers=workers)
+        concurrency = max(1, workers * 4)
+        rate, accepted = await measure(verifier, requests, concurrency)
+        replay_rate, replays_accepted = await measure(verifier, requests, concurrency)
+        verifier.close()
+        assert accepted == len(requests) and replays_accepted == 0
+        print(f"{workers:>8} {rate:>12,.0f} {replay_rate:>20,.0f}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--body-size", type=int, default=1024, help="bytes of padding in each signed body")
+    parser.add_argument(
+        "--workers", default=",".join(str(n) for n in sorted({0, 1, 2, 4, os.cpu_count()})),
+        type=lambda value: [int(n) for n in value.split(",")],
+        help="comma separated thread pool sizes",
+    )
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+import asyncio
+
+class StubSupport():
+    """
+    Stand-in for DiscordSupport recording the sent requests, fail(request) returns the exception to raise or None
+    and respond(request) the result of send.
+    """
+
+    def __init__(self, fail=lambda request: None, delay=0, respond=lambda request: None):
+        self.fail = fail
+        self.delay = delay
+        self.respond = respond
+        self.requests = []
+
+    def encode_payload(self, payload):
+        return b"{}", {}
+
+    async def send(self, url, url_method, url_params=None, query_params=None, payload=None, headers=None):
+        request = (url, url_method, url_params, payload)
+        self.requests.append(request)
+        await asyncio.sleep(self.delay)
+        error = self.fail(request)
+        if(error is not None):
+            raise error
+        return self.respond(request)
@@ -0,0 +1,40 @@
+import pytest
+
+from apx_httpdiscord._autocomplete import AutocompleteIndex
+from apx_httpdiscord._datamodels import Locales
+
+def _values(index, query, locale=None):
+    return [choice.value for choice in index.search(query, locale)]
+
+def test_update_matches_add():
+    entries = [(f"item {n % 7} {n}", n, {Locales.FRENCH: f"objet {n}"}, n % 5) for n in range(200)]
+    added = AutocompleteIndex(locales=[Locales.FRENCH])
+    for entry in entries:
+        added.add(*entry)
+    updated = AutocompleteIndex(locales=[Locales.FRENCH])
+    updated.update(entries[:100])
+    updated.update(entries[100:])
+    for query, locale in (("", None), ("item 3", None), ("itme", None), ("objet 1", Locales.FRENCH)):
+        assert _values(updated, query, locale) == _values(added, query, locale)
+
+def test_update_replaces_entries():
+    index = AutocompleteIndex()
+    index.update([("apple", "a"), ("banana", "b", None, 1)])
+    index.update([("avocado", "b"), ("apricot", "c", None, 2), ("apple pie", "c")])
+    assert len(index) == 3
+    assert _values(index, "a") == ["a", "c", "b"] and _values(index, "apricot") == []
+    index.remove("b")
+    assert _values(index, "") == ["a", "c"]
+
+@pytest.mark.parametrize("bulk", [False, True])
+def test_mixed_value_types(bulk):
+    entries = [("same", 1), ("same", "1"), ("same", 2.5)]
+    index = AutocompleteIndex()
+    if(bulk):
+        index.update(entries)
+    else:
+        for entry in entries:
+            index.add(*entry)
+    assert sorted(_values(index, "same"), key=str) == [1, "1", 2.5]
+    index.remove("1")
+    assert sorted(_values(index, "sa"), key=str) == [1, 2.5]
@@ -0,0 +1,35 @@
+import asyncio
+
+import pytest
+
+from apx_httpdiscord._broadcast import WebhookBroadcaster
+from apx_httpdiscord._datamodels import Webhook
+from apx_httpdiscord._errors import CircuitOpenError
+
+from stubs import StubSupport
+
+WEBHOOKS = [Webhook(id=str(id), type=1, token="token") for id in range(1, 5)]
+
+@pytest.mark.parametrize("error", [
+    ConnectionResetError("reset"), asyncio.TimeoutError(), CircuitOpenError("webhooks/2", 1.0), asyncio.IncompleteReadError(b"", 10),
+])
+def test_broadcast_reports_send_errors(error):
+    support = StubSupport(lambda request: error if request[2]["webhook"].id == "2" else None)
+    broadcaster = WebhookBroadcaster(support, WEBHOOKS, concurrency=2)
+    failure, = asyncio.run(broadcaster.run(None))
+    assert failure.webhook.id == "2" and failure.error is error and not failure.removed
+    assert (broadcaster.delivered, broadcaster.failed) == (3, 1)
+
+def test_broadcast_stops_workers_when_one_raises():
+    support = StubSupport(lambda request: RuntimeError("bug") if request[2]["webhook"].id == "1" else None, delay=0.01)
+    broadcaster = WebhookBroadcaster(support, WEBHOOKS, concurrency=2)
+
+    async def run():
+        with pytest.raises(RuntimeError):
+            await broadcaster.run(None)
+        sent = len(support.requests)
+        await asyncio.sleep(0.05)
+        return sent
+
+    sent = asyncio.run(run())
+    assert len(support.requests) == sent < len(WEBHOOKS)
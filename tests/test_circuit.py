@@ -0,0 +1,86 @@
+import pytest
+
+from apx_httpdiscord import _circuit
+from apx_httpdiscord._circuit import CircuitBreaker, CLOSED, HALF_OPEN, OPEN
+from apx_httpdiscord._errors import CircuitOpenError
+
+BUCKET = ("abcd", "1")
+OTHER = ("abcd", "2")
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(_circuit.time, "monotonic", lambda: now[0])
+    return now
+
+def _fail(breaker, key, times=1):
+    for _ in range(times):
+        breaker.after(key, breaker.before(key), True)
+
+def _state(breaker, key):
+    circuit = breaker.circuits.get(key)
+    return circuit.state if circuit is not None else None
+
+def test_circuit_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3, cooldown=10.0)
+    _fail(breaker, BUCKET, 2)
+    assert _state(breaker, BUCKET) == CLOSED
+    #a success on a closed circuit forgets the failures
+    breaker.after(BUCKET, breaker.before(BUCKET), False)
+    assert _state(breaker, BUCKET) is None
+
+    _fail(breaker, BUCKET, 3)
+    assert _state(breaker, BUCKET) == OPEN
+    clock[0] += 4.0
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.before(BUCKET)
+    assert error.value.retry_after == pytest.approx(6.0) and breaker.rejected == 1
+
+def test_half_open_probes_close_the_circuit(clock):
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=10.0, half_open_probes=1, half_open_successes=2)
+    _fail(breaker, BUCKET)
+    clock[0] += 10.0
+
+    probe = breaker.before(BUCKET)
+    assert probe and _state(breaker, BUCKET) == HALF_OPEN
+    #only half_open_probes requests at a time are let through
+    with pytest.raises(CircuitOpenError):
+        breaker.before(BUCKET)
+    breaker.after(BUCKET, probe, False)
+    assert _state(breaker, BUCKET) == HALF_OPEN
+
+    breaker.after(BUCKET, breaker.before(BUCKET), False)
+    assert _state(breaker, BUCKET) is None
+    assert breaker.before(BUCKET) is False
+
+def test_failed_probe_reopens_with_a_doubled_cooldown(clock):
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=10.0, max_cooldown=25.0)
+    _fail(breaker, BUCKET)
+    for cooldown in (20.0, 25.0):
+        clock[0] += breaker.circuits[BUCKET].cooldown
+        _fail(breaker, BUCKET)
+        assert _state(breaker, BUCKET) == OPEN and breaker.circuits[BUCKET].cooldown == cooldown
+    clock[0] += 24.0
+    with pytest.raises(CircuitOpenError):
+        breaker.before(BUCKET)
+
+def test_cancelled_probe_frees_its_slot(clock):
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=1.0)
+    _fail(breaker, BUCKET)
+    clock[0] += 1.0
+    breaker.after(BUCKET, breaker.before(BUCKET), None)
+    assert _state(breaker, BUCKET) == HALF_OPEN
+    assert breaker.before(BUCKET) is True
+
+def test_circuits_are_isolated_per_bucket(clock):
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=10.0)
+    _fail(breaker, BUCKET, 2)
+    _fail(breaker, OTHER)
+    assert (_state(breaker, BUCKET), _state(breaker, OTHER)) == (OPEN, CLOSED)
+    assert breaker.before(OTHER) is False
+    with pytest.raises(CircuitOpenError):
+        breaker.before(BUCKET)
+
+    snapshot = {(entry["bucket"], entry["major"]): entry for entry in breaker.snapshot()}
+    assert snapshot[BUCKET]["state"] == OPEN and snapshot[BUCKET]["retry_after"] == pytest.approx(10.0)
+    assert snapshot[OTHER]["state"] == CLOSED and snapshot[OTHER]["failures"] == 1
@@ -0,0 +1,27 @@
+from apx_httpdiscord._datamodel_builders import EMBED_DESCRIPTION_LIMIT, EmbedBuilder
+
+def test_description_after_fields_starts_a_new_embed():
+    builder = EmbedBuilder(description="intro\n").add_field("name", "value").append_description("outro")
+    (first, second), = builder.build()
+    assert (first.description, [field.name for field in first.fields]) == ("intro\n", ["name"])
+    assert (second.description, second.fields) == ("outro", [])
+
+def test_overflowing_lines_move_whole():
+    lines = [f"{index:03}" + "x" * 96 + "\n" for index in range(60)]
+    builder = EmbedBuilder()
+    for line in lines:
+        builder.append_description(line)
+    embeds = [embed for message in builder.build() for embed in message]
+    assert len(embeds) == 2
+    assert [line for embed in embeds for line in embed.description.splitlines(keepends=True)] == lines
+    assert all(len(embed.description) <= EMBED_DESCRIPTION_LIMIT for embed in embeds)
+
+def test_overflowing_text_splits_on_line_breaks():
+    lines = ["x" * 99 + "\n"] * 60
+    (first, second), = EmbedBuilder(description="".join(lines)).build()
+    assert first.description == "".join(lines[:40]) and second.description == "".join(lines[40:])
+
+def test_lines_longer_than_an_embed_are_cut():
+    text = "y" * (EMBED_DESCRIPTION_LIMIT + 10)
+    message, = EmbedBuilder(description="short\n").append_description(text).build()
+    assert [embed.description for embed in message] == ["short\n", "y" * EMBED_DESCRIPTION_LIMIT, "y" * 10]
@@ -0,0 +1,31 @@
+import importlib
+
+import msgspec
+import pytest
+
+from apx_httpdiscord import _datamodels
+from apx_httpdiscord._support import ROUTE_OWNERS, iter_routes
+
+@pytest.mark.parametrize("module", ["_datamodels", "_errors", "_http", "_interactions_server", "_multipart", "_support"])
+def test_import(module):
+    importlib.import_module(f"apx_httpdiscord.{module}")
+
+@pytest.mark.parametrize("owner", ROUTE_OWNERS, ids=lambda owner: owner.__name__)
+def test_related_routes(owner):
+    routes = list(iter_routes((owner,)))
+    assert routes
+    for url, method, route in routes:
+        assert isinstance(url, str) and method in _datamodels.HttpMethods
+        assert set(route) == {"url_params", "query_params", "payload", "additional_properties", "statuscode_returntype_map"}
+
+def _route_types():
+    types = {}
+    for _, _, route in iter_routes():
+        for value in (route["query_params"], route["payload"], *route["statuscode_returntype_map"].values()):
+            if(value is not None):
+                types[repr(value)] = value
+    return sorted(types.items())
+
+@pytest.mark.parametrize("model", [model for _, model in _route_types()], ids=[name for name, _ in _route_types()])
+def test_route_types_decode(model):
+    msgspec.json.Decoder(model)
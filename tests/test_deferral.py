@@ -0,0 +1,42 @@
+import asyncio
+import pathlib
+
+import pytest
+
+from apx_httpdiscord._datamodels import Interaction, InteractionCallbackData, InteractionCallbackTypes, InteractionResponse
+from apx_httpdiscord._deferral import ResponseScheduler
+from apx_httpdiscord._interactions_server import INTERACTION_DECODER
+
+from stubs import StubSupport
+
+PAYLOADS = pathlib.Path(__file__).parent / "payloads"
+
+def _deferred(payload, callback_type):
+    interaction = INTERACTION_DECODER.decode((PAYLOADS / payload).read_bytes())
+    support = StubSupport()
+
+    async def handler(interaction):
+        await asyncio.sleep(0.05)
+        return InteractionResponse(type=callback_type, data=InteractionCallbackData(content="done"))
+
+    async def run():
+        scheduler = ResponseScheduler(support, budget=0.01)
+        response = await scheduler.respond(interaction, handler)
+        await scheduler.drain()
+        return response
+
+    return asyncio.run(run()), support.requests
+
+@pytest.mark.parametrize("callback_type, url", [
+    (InteractionCallbackTypes.UPDATE_MESSAGE, Interaction.InteractionUrls.EDIT_ORIGINAL_INTERACTION_RESPONSE),
+    (InteractionCallbackTypes.CHANNEL_MESSAGE_WITH_SOURCE, Interaction.InteractionUrls.CREATE_FOLLOWUP_MESSAGE),
+])
+def test_deferred_component_result(callback_type, url):
+    response, ((sent_url, _, _, payload),) = _deferred("interaction_message_component.json", callback_type)
+    assert response.type == InteractionCallbackTypes.DEFERRED_UPDATE_MESSAGE
+    assert sent_url == url and payload.content == "done"
+
+def test_deferred_command_result_edits_original():
+    response, ((sent_url, _, _, payload),) = _deferred("interaction_chat_input.json", InteractionCallbackTypes.CHANNEL_MESSAGE_WITH_SOURCE)
+    assert response.type == InteractionCallbackTypes.DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE
+    assert sent_url == Interaction.InteractionUrls.EDIT_ORIGINAL_INTERACTION_RESPONSE and payload.content == "done"
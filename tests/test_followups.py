@@ -0,0 +1,95 @@
+import asyncio
+import pathlib
+import time
+
+import msgspec
+import pytest
+
+from apx_httpdiscord._datamodels import Interaction, InteractionCallbackData, InteractionCallbackTypes, InteractionResponse
+from apx_httpdiscord._deferral import ResponseScheduler
+from apx_httpdiscord._errors import InteractionTokenExpiredError
+from apx_httpdiscord._followups import FollowupQueue, TokenTracker
+from apx_httpdiscord._interactions_server import INTERACTION_DECODER
+from apx_httpdiscord._snowflake import snowflake_time, time_snowflake
+
+from stubs import StubSupport
+
+PAYLOADS = pathlib.Path(__file__).parent / "payloads"
+
+def _interaction(created_at, token):
+    """
+    The chat input payload re-issued with an id created at the unix time created_at.
+    """
+    interaction = INTERACTION_DECODER.decode((PAYLOADS / "interaction_chat_input.json").read_bytes())
+    return msgspec.structs.replace(interaction, id=str(time_snowflake(int(created_at * 1000))), token=token)
+
+def test_snowflake_time():
+    assert snowflake_time("1279154412445073449") == pytest.approx(1725044577.466)
+
+def test_tracker_expiry_and_purge():
+    now = time.time()
+    tracker = TokenTracker(lifetime=60)
+    old = _interaction(now - 120, "old")
+    assert tracker.track(old) == pytest.approx(now - 60, abs=0.01)
+    assert tracker.remaining(old, now) < 0
+
+    fresh = _interaction(now, "fresh")
+    assert tracker.remaining(fresh, now) == pytest.approx(60, abs=0.01)
+    #tracking purges the tokens expired in front of the new one
+    assert len(tracker) == 1
+
+def test_expired_tokens_are_dropped_without_sending():
+    now = time.time()
+    support = StubSupport()
+
+    async def run():
+        async with FollowupQueue(support, TokenTracker(lifetime=60), margin=1.0) as queue:
+            late = queue.create_followup(_interaction(now - 59.5, "late"), Interaction.CreateFollowupMessageJSONParams(content="late"))
+            on_time = queue.create_followup(_interaction(now, "on_time"), Interaction.CreateFollowupMessageJSONParams(content="on time"))
+            with pytest.raises(InteractionTokenExpiredError):
+                await late
+            await on_time
+            return queue.dropped, queue.sent
+
+    assert asyncio.run(run()) == (1, 1)
+    assert [payload.content for _, _, _, payload in support.requests] == ["on time"]
+
+def test_earliest_expiry_is_sent_first():
+    now = time.time()
+    support = StubSupport()
+
+    async def run():
+        queue = FollowupQueue(support, TokenTracker(lifetime=900), concurrency=1)
+        futures = [
+            queue.create_followup(_interaction(now - age, str(age)), Interaction.CreateFollowupMessageJSONParams(content=str(age)))
+            for age in (10, 600, 300)
+        ]
+        async with queue:
+            await asyncio.gather(*futures)
+
+    asyncio.run(run())
+    assert [payload.content for _, _, _, payload in support.requests] == ["600", "300", "10"]
+
+def test_deferred_result_is_sent_through_the_followup_queue():
+    interaction = _interaction(time.time(), "deferred")
+    support = StubSupport()
+
+    async def handler(interaction):
+        await asyncio.sleep(0.05)
+        return InteractionResponse(type=InteractionCallbackTypes.CHANNEL_MESSAGE_WITH_SOURCE, data=InteractionCallbackData(content="done"))
+
+    async def run():
+        async with FollowupQueue(support) as queue:
+            scheduler = ResponseScheduler(support, budget=0.01, followups=queue)
+            response = await scheduler.respond(interaction, handler)
+            #the deferral is answered before anything is sent with the token
+            sent_before_drain = len(support.requests)
+            await scheduler.drain()
+            return response, sent_before_drain, queue.sent
+
+    response, sent_before_drain, sent = asyncio.run(run())
+    assert response.type == InteractionCallbackTypes.DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE
+    assert sent_before_drain == 0 and sent == 1
+    ((url, _, url_params, payload),) = support.requests
+    assert url == Interaction.InteractionUrls.EDIT_ORIGINAL_INTERACTION_RESPONSE and payload.content == "done"
+    assert url_params["interaction"] is interaction
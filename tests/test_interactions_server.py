@@ -0,0 +1,99 @@
+import asyncio
+import pathlib
+import time
+
+import msgspec
+import pytest
+
+from apx_httpdiscord._datamodels import (
+    Interaction, InteractionCallbackTypes, InteractionResponse, InteractionTypes, ComponentTypes, Locales,
+    ApplicationIntegrationTypes, AppCommandOptionTypes,
+)
+from apx_httpdiscord._interactions_server import INTERACTION_DECODER, InteractionsApp
+
+PAYLOADS = pathlib.Path(__file__).parent / "payloads"
+
+def test_decode_chat_input_interaction():
+    interaction = INTERACTION_DECODER.decode((PAYLOADS / "interaction_chat_input.json").read_bytes())
+    assert interaction.type == InteractionTypes.APPLICATION_COMMAND
+    assert interaction.guild.locale == Locales.ENGLISH_US
+    assert interaction.authorizing_integration_owners == {ApplicationIntegrationTypes.GUILD_INSTALL: "1144506532375474226"}
+    assert [(option.name, option.type, option.value) for option in interaction.data.options] == [
+        ("sides", AppCommandOptionTypes.INTEGER, 20),
+        ("label", AppCommandOptionTypes.STRING, "initiative"),
+        ("target", AppCommandOptionTypes.USER, "1030837281231409212"),
+    ]
+    member = interaction.data.resolved.members["1030837281231409212"]
+    assert member.roles == ["1144509931419598920"] and member.user is None
+    assert interaction.member.user.username == "mod"
+
+def test_decode_message_component_interaction():
+    interaction = INTERACTION_DECODER.decode((PAYLOADS / "interaction_message_component.json").read_bytes())
+    assert interaction.type == InteractionTypes.MESSAGE_COMPONENT
+    assert interaction.data.component_type == ComponentTypes.BUTTON and interaction.data.custom_id == "poll:yes"
+    assert interaction.user.id == "1030837281231409212" and interaction.member is None
+    row, = interaction.message.components
+    assert [button.custom_id for button in row.components] == ["poll:yes", "poll:no", None]
+    assert interaction.message.embeds[0].fields[0].name == "Ends"
+    assert interaction.message.interaction_metadata.user.username == "apx"
+
+def _call(app, body, headers):
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "POST", "path": "/", "headers": headers}
+    asyncio.run(app(scope, receive, send))
+    return sent[0]["status"], sent[1]["body"]
+
+def test_app_dispatches_signed_interaction():
+    signing = pytest.importorskip("nacl.signing")
+    key = signing.SigningKey.generate()
+    app = InteractionsApp(key.verify_key.encode().hex())
+    received = []
+
+    @app.handler(InteractionTypes.APPLICATION_COMMAND)
+    async def roll(interaction):
+        received.append(interaction)
+        return InteractionResponse(type=InteractionCallbackTypes.CHANNEL_MESSAGE_WITH_SOURCE)
+
+    body = (PAYLOADS / "interaction_chat_input.json").read_bytes()
+    timestamp = str(int(time.time())).encode()
+    signature = key.sign(timestamp + body).signature.hex().encode()
+    status, response = _call(app, body, [(b"x-signature-ed25519", signature), (b"x-signature-timestamp", timestamp)])
+    assert status == 200
+    assert msgspec.json.decode(response)["type"] == InteractionCallbackTypes.CHANNEL_MESSAGE_WITH_SOURCE
+    assert received[0].data.name == "roll"
+
+    status, _ = _call(app, body, [(b"x-signature-ed25519", signature), (b"x-signature-timestamp", timestamp)])
+    assert status == 401
+
+def _signed(key, body):
+    timestamp = str(int(time.time())).encode()
+    return [(b"x-signature-ed25519", key.sign(timestamp + body).signature.hex().encode()), (b"x-signature-timestamp", timestamp)]
+
+def test_app_answers_ping_with_pong():
+    signing = pytest.importorskip("nacl.signing")
+    key = signing.SigningKey.generate()
+    body = b'{"id":"1","application_id":"2","type":1,"token":"t","version":1,"app_permissions":"0","authorizing_integration_owners":{},"attachment_size_limit":26214400}'
+    status, response = _call(InteractionsApp(key.verify_key.encode().hex()), body, _signed(key, body))
+    assert (status, response) == (200, b'{"type":1}')
+
+def test_app_does_not_answer_disconnected_clients():
+    signing = pytest.importorskip("nacl.signing")
+    app = InteractionsApp(signing.SigningKey.generate().verify_key.encode().hex())
+    sent = []
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app({"type": "http", "method": "POST", "path": "/", "headers": []}, receive, send))
+    assert sent == []
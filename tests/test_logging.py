@@ -0,0 +1,70 @@
+import logging
+import threading
+
+import pytest
+
+from apx_httpdiscord import _logging
+from apx_httpdiscord._logging import DiscordWebhookHandler, DROP_NEWEST, FALLBACK
+
+class RecordingSink():
+    lines = []
+
+    def __init__(self, support, **options):
+        pass
+
+    def emit(self, webhook, line):
+        self.lines.append((webhook.id, line))
+
+    async def close(self):
+        pass
+
+@pytest.fixture
+def sink(monkeypatch):
+    monkeypatch.setattr(_logging, "WebhookSink", RecordingSink)
+    monkeypatch.setattr(RecordingSink, "lines", [])
+    return RecordingSink
+
+def _logger(handler):
+    logger = logging.getLogger(f"test_logging.{id(handler)}")
+    logger.propagate = False
+    logger.addHandler(handler)
+    return logger
+
+def test_records_are_formatted_when_logged(sink):
+    handler = DiscordWebhookHandler("https://discord.com/api/webhooks/1/token", poll_interval=0.01)
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    targets = ["a"]
+    _logger(handler).error("failed for %s", targets)
+    targets.append("b")
+    handler.close()
+    assert sink.lines == [("1", "ERROR failed for ['a']")]
+
+def test_unformattable_records_are_reported_and_skipped(sink, monkeypatch):
+    errors = []
+    handler = DiscordWebhookHandler("https://discord.com/api/webhooks/1/token", poll_interval=0.01)
+    monkeypatch.setattr(handler, "handleError", errors.append)
+    logger = _logger(handler)
+    logger.error("%d items", "many")
+    logger.error("done")
+    handler.close()
+    assert [record.msg for record in errors] == ["%d items"] and sink.lines == [("1", "done")]
+
+@pytest.mark.parametrize("overflow", [DROP_NEWEST, FALLBACK])
+def test_dropped_records_are_counted_across_threads(sink, overflow):
+    fallback = logging.NullHandler()
+    handler = DiscordWebhookHandler(
+        "https://discord.com/api/webhooks/1/token", capacity=0, overflow=overflow, fallback_handler=fallback, poll_interval=0.01,
+    )
+    logger = _logger(handler)
+
+    def log():
+        for n in range(2000):
+            logger.error("record %d", n)
+
+    threads = [threading.Thread(target=log) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    handler.close()
+    assert handler.dropped == 8 * 2000 and sink.lines == []
@@ -0,0 +1,37 @@
+import asyncio
+
+import pytest
+
+from apx_httpdiscord._datamodels import Channel, HttpMethods, Interaction, Message, Webhook
+from apx_httpdiscord._mock_server import MockDiscordApp, MockDiscordServer
+from apx_httpdiscord._support import DiscordSupport, iter_routes
+
+@pytest.mark.parametrize("url, methods", [
+    (Interaction.InteractionUrls.EDIT_ORIGINAL_INTERACTION_RESPONSE, {"GET", "PATCH", "DELETE"}),
+    (Interaction.InteractionUrls.EDIT_FOLLOWUP_MESSAGE, {"GET", "PATCH", "DELETE"}),
+    (Channel.WebhookUrls.GET_WEBHOOK, {"GET", "PATCH", "DELETE"}),
+    (Channel.WebhookUrls.EXECUTE_WEBHOOK, {"GET", "PATCH", "DELETE", "POST"}),
+    (Channel.WebhookUrls.CREATE_WEBHOOK, {"GET", "POST"}),
+])
+def test_routes_keep_every_method(url, methods):
+    assert {method for route_url, method, _ in iter_routes() if route_url == url} == methods
+
+def _send(*requests):
+    async def run():
+        async with MockDiscordServer(MockDiscordApp(seed=1)) as server:
+            async with DiscordSupport("token", base_url=server.url) as support:
+                return [await support.send(*request) for request in requests]
+    return asyncio.run(run())
+
+def test_mock_serves_every_method_of_a_url():
+    interaction = {"application.id": "1", "interaction.token": "token"}
+    edited, fetched = _send(
+        (Interaction.InteractionUrls.EDIT_ORIGINAL_INTERACTION_RESPONSE, HttpMethods.PATCH, interaction, None,
+         Interaction.EditOriginalInteractionResponseJSONParams(content="done")),
+        (Interaction.InteractionUrls.GET_ORIGINAL_INTERACTION_RESPONSE, HttpMethods.GET, interaction),
+    )
+    assert isinstance(edited, Message) and isinstance(fetched, Message)
+
+def test_mock_responses_decode_into_route_types():
+    webhook, = _send((Channel.WebhookUrls.GET_WEBHOOK, HttpMethods.GET, {"webhook.id": "1"}))
+    assert isinstance(webhook, Webhook)
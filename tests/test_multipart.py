@@ -0,0 +1,37 @@
+import asyncio
+
+import pytest
+
+from apx_httpdiscord._datamodels import Channel
+from apx_httpdiscord._multipart import MultipartEncoder
+
+def _encoder(tmp_path):
+    location = tmp_path / "report.txt"
+    location.write_bytes(b"x" * 200_000)
+    encoder = MultipartEncoder(Channel.ExecuteWebhookJSONParams(content="report", file_locations=[str(location)]))
+    location.write_bytes(b"x" * 1000)
+    return encoder
+
+async def _drain(reader, writer):
+    await reader.read()
+    writer.close()
+
+def test_write_raises_on_truncated_file(tmp_path):
+    encoder = _encoder(tmp_path)
+
+    async def run():
+        server = await asyncio.start_server(_drain, "127.0.0.1", 0)
+        _, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+        try:
+            await asyncio.wait_for(encoder.write(writer), 5)
+        finally:
+            writer.close()
+            server.close()
+            await server.wait_closed()
+
+    with pytest.raises(ValueError, match="file truncated"):
+        asyncio.run(run())
+
+def test_iter_raises_on_truncated_file(tmp_path):
+    with pytest.raises(ValueError, match="file truncated"):
+        b"".join(_encoder(tmp_path))
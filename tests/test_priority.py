@@ -0,0 +1,86 @@
+import asyncio
+import types
+
+import pytest
+
+from apx_httpdiscord import _ratelimit
+from apx_httpdiscord._datamodels import HttpMethods, Interaction, Guild
+from apx_httpdiscord._priority import (
+    route_priority, BULK_PRIORITY, DEFAULT_PRIORITY, INTERACTION_PRIORITY, MESSAGE_PRIORITY,
+)
+from apx_httpdiscord._ratelimit import Bucket
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(_ratelimit, "time", types.SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+async def _settle():
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+def _exhausted_bucket(aging=2.0):
+    """
+    A bucket of one request per second with no request left in the current window.
+    """
+    bucket = Bucket(("abcd", "1"), aging=aging)
+    bucket.update(1, 0, 1.0)
+    return bucket
+
+def _waiter(bucket, priority, label, granted):
+    async def wait():
+        await bucket.acquire(priority)
+        granted.append(label)
+        bucket.release()
+    return asyncio.ensure_future(wait())
+
+def test_route_priority():
+    assert route_priority(HttpMethods.POST, Interaction.InteractionUrls.CREATE_INTERACTION_RESPONSE) == INTERACTION_PRIORITY
+    assert route_priority("GET", str(Guild.AuditLogUrls.GET_GUILD_AUDIT_LOG)) == BULK_PRIORITY
+    assert route_priority(HttpMethods.GET, Guild.AuditLogUrls.GET_GUILD_AUDIT_LOG.replace("audit", "other")) == DEFAULT_PRIORITY
+
+def test_waiters_are_granted_by_priority_then_arrival(clock):
+    granted = []
+
+    async def run():
+        bucket = _exhausted_bucket()
+        for priority, label in [
+            (BULK_PRIORITY, "bulk"), (DEFAULT_PRIORITY, "default"), (MESSAGE_PRIORITY, "message 1"),
+            (INTERACTION_PRIORITY, "interaction"), (MESSAGE_PRIORITY, "message 2"),
+        ]:
+            _waiter(bucket, priority, label, granted)
+        await _settle()
+        assert granted == [] and len(bucket._waiters) == 5
+        #one request per window
+        for _ in range(5):
+            clock[0] += 1.0
+            bucket._dispatch()
+            await _settle()
+        return bucket
+
+    bucket = asyncio.run(run())
+    assert granted == ["interaction", "message 1", "message 2", "default", "bulk"]
+    assert bucket.inflight == 0 and bucket._waiters == []
+
+def test_bulk_requests_are_not_starved_by_steady_interaction_traffic(clock):
+    granted = []
+    aging = 2.0
+
+    async def run():
+        bucket = _exhausted_bucket(aging)
+        started = clock[0]
+        _waiter(bucket, BULK_PRIORITY, "bulk", granted)
+        #a new interaction callback every window, more than the bucket lets through
+        while("bulk" not in granted):
+            _waiter(bucket, INTERACTION_PRIORITY, f"interaction {clock[0] - started:.0f}", granted)
+            await _settle()
+            clock[0] += 1.0
+            bucket._dispatch()
+            await _settle()
+        return clock[0] - started
+
+    waited = asyncio.run(run())
+    #the bulk request goes once it waited aging seconds per class of difference, plus the window in progress
+    assert waited == (BULK_PRIORITY - INTERACTION_PRIORITY) * aging + 1.0
+    assert granted == [f"interaction {n}" for n in range(6)] + ["bulk"]
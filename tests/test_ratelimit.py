@@ -0,0 +1,93 @@
+import asyncio
+import random
+import time
+
+from apx_httpdiscord._ratelimit import RateLimiter
+
+class _Response():
+    def __init__(self, status, headers, body=b""):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+class _FixedWindowServer():
+    """
+    Counts requests in fixed windows of limit requests starting at the first request after a reset, like discord.
+    """
+
+    def __init__(self, limit, window):
+        self.limit = limit
+        self.window = window
+        self.reset_at = 0.0
+        self.count = 0
+        self.rejected = 0
+
+    def handle(self):
+        now = time.monotonic()
+        if(self.reset_at <= now):
+            self.reset_at = now + self.window
+            self.count = 0
+        if(self.count >= self.limit):
+            self.rejected += 1
+            return _Response(429, {"retry-after": str(self.reset_at - now)})
+        self.count += 1
+        return _Response(200, {
+            "x-ratelimit-limit": str(self.limit),
+            "x-ratelimit-remaining": str(self.limit - self.count),
+            "x-ratelimit-reset-after": f"{self.reset_at - now:.3f}",
+        })
+
+def test_concurrent_requests_crossing_windows_are_not_rate_limited():
+    server = _FixedWindowServer(limit=2, window=0.05)
+    limiter = RateLimiter(global_rate=None)
+    rng = random.Random(0)
+    route_key = ("GET", "/channels/{channel.id}/messages")
+
+    async def request():
+        for _ in range(3):
+            bucket = await limiter.acquire(route_key, "1")
+            await asyncio.sleep(rng.uniform(0.001, 0.01))
+            response = server.handle()
+            await asyncio.sleep(rng.uniform(0.001, 0.01))
+            limiter.release(bucket, route_key, response)
+
+    async def run():
+        await asyncio.gather(*(request() for _ in range(8)))
+
+    asyncio.run(run())
+    assert server.rejected == 0 and limiter.rate_limited == 0
+
+def test_bucket_blocked_before_its_limit_is_known_lets_a_request_through_after_retry_after():
+    limiter = RateLimiter(global_rate=None)
+    route_key = ("POST", "/channels/{channel.id}/messages")
+
+    async def run():
+        bucket = await limiter.acquire(route_key, "1")
+        retry_after = limiter.release(bucket, route_key, _Response(429, {"retry-after": "0.02"}))
+        started = time.monotonic()
+        limiter.release(await asyncio.wait_for(limiter.acquire(route_key, "1"), 1), route_key, None)
+        return retry_after, time.monotonic() - started
+
+    retry_after, waited = asyncio.run(run())
+    assert retry_after == 0.02 and waited >= 0.015
+
+def test_snapshot_counts_requests_and_rate_limits_by_scope():
+    limiter = RateLimiter()
+    route_key = ("POST", "/channels/{channel.id}/messages")
+    headers = {"x-ratelimit-bucket": "abcd", "x-ratelimit-limit": "5", "x-ratelimit-remaining": "4", "x-ratelimit-reset-after": "1"}
+
+    async def run():
+        limiter.release(await limiter.acquire(route_key, "1"), route_key, _Response(200, headers))
+        shared = _Response(429, {**headers, "x-ratelimit-scope": "shared"}, b'{"message": "", "retry_after": 0.01, "global": false}')
+        limiter.release(await limiter.acquire(route_key, "1"), route_key, shared)
+        limiter.release(await limiter.acquire(route_key, "2"), route_key, _Response(429, {}, b'{"message": "", "retry_after": 0.5, "global": true}'))
+        return limiter.snapshot()
+
+    snapshot = asyncio.run(run())
+    assert snapshot["rate_limited"] == 2 and snapshot["rate_limited_scopes"] == {"user": 0, "global": 1, "shared": 1}
+    assert snapshot["global"]["paused_for"] > 0.4
+    bucket, = [bucket for bucket in snapshot["buckets"] if bucket["major"] == "1"]
+    assert (bucket["bucket"], bucket["method"], bucket["route"]) == ("abcd", *route_key)
+    assert (bucket["limit"], bucket["requests"], bucket["inflight"], bucket["queued"]) == (5, 2, 0, 0)
+    assert bucket["rate_limited"] == {"user": 0, "global": 0, "shared": 1}
+    assert limiter.top(1, by="requests")[0]["major"] == "1"
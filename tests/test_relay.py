@@ -0,0 +1,141 @@
+import asyncio
+
+import pytest
+
+from apx_httpdiscord._datamodels import Channel, Webhook
+from apx_httpdiscord._errors import CircuitOpenError
+from apx_httpdiscord._relay import RelayApp, WebhookRelay
+
+from stubs import StubSupport
+
+WEBHOOK = Webhook(id="1", type=1, token="token")
+
+@pytest.mark.parametrize("error", [
+    ConnectionResetError("reset"), asyncio.TimeoutError(), CircuitOpenError("webhooks/1", 1.0), asyncio.IncompleteReadError(b"", 10),
+])
+def test_relay_keeps_forwarding_after_send_errors(error):
+    errors = [error]
+    support = StubSupport(lambda request: errors.pop() if errors else None)
+
+    async def run():
+        relay = WebhookRelay(support, [WEBHOOK])
+        relay.submit_github("1", "issues", b'{"action": "opened"}')
+        await asyncio.sleep(0.01)
+        relay.submit_github("1", "issues", b'{"action": "closed"}')
+        await relay.close()
+        return relay
+
+    relay = asyncio.run(run())
+    assert (relay.forwarded, relay.dropped) == (1, 1)
+    assert [request[3] for request in support.requests] == [b'{"action": "opened"}', b'{"action": "closed"}']
+
+def test_relay_survives_unexpected_errors():
+    errors = [RuntimeError("bug")]
+    support = StubSupport(lambda request: errors.pop() if errors else None)
+
+    async def run():
+        relay = WebhookRelay(support, [WEBHOOK])
+        relay.submit_slack("1", b'["not", "an", "object"]')
+        relay.submit_github("1", "issues", b'{"action": "opened"}')
+        await asyncio.sleep(0.01)
+        relay.submit_github("1", "issues", b'{"action": "closed"}')
+        await relay.close()
+        return relay
+
+    relay = asyncio.run(run())
+    assert (relay.forwarded, relay.dropped) == (1, 2)
+
+def test_relay_accepts_only_configured_webhooks():
+    support = StubSupport()
+
+    async def run():
+        relay = WebhookRelay(support, [WEBHOOK])
+        accepted = relay.submit_slack("2", b'{"text": "hi"}')
+        await relay.close()
+        return relay, accepted
+
+    relay, accepted = asyncio.run(run())
+    assert not accepted and relay.dropped == 1 and not support.requests
+
+def test_relay_bounds_fetched_webhooks():
+    async def run():
+        relay = WebhookRelay(StubSupport(), fetch_unknown=True, max_webhooks=2)
+        accepted = [relay.submit_slack(str(id), b'{"text": "hi"}') for id in range(1, 4)]
+        queues = len(relay._queues)
+        await relay.close()
+        return accepted, queues
+
+    assert asyncio.run(run()) == ([True, True, False], 2)
+
+def _call(app, path, body, headers=(), query_string=b"", messages=None):
+    messages = messages or [{"type": "http.request", "body": body, "more_body": False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    async def run():
+        scope = {"type": "http", "method": "POST", "path": path, "query_string": query_string, "headers": list(headers)}
+        await app(scope, receive, send)
+        await app.relay.close()
+
+    asyncio.run(run())
+    return sent[0]["status"] if sent else None
+
+def test_app_requires_secrets_to_fetch_unknown_webhooks():
+    with pytest.raises(ValueError):
+        RelayApp(WebhookRelay(StubSupport(), fetch_unknown=True), github_secret="secret")
+
+def test_app_rejects_unknown_webhooks_and_bad_tokens():
+    def app():
+        return RelayApp(WebhookRelay(StubSupport(), [WEBHOOK]), slack_token="token")
+
+    assert _call(app(), "/slack/2", b'{"text": "hi"}', query_string=b"token=token") == 404
+    assert _call(app(), "/slack/1", b'{"text": "hi"}', query_string=b"token=wrong") == 401
+    assert _call(app(), "/slack/1", b'{"text": "hi"}') == 401
+    assert _call(app(), "/slack/1", b'{"text": "hi"}', query_string=b"token=token") == 202
+
+def test_app_does_not_answer_disconnected_clients():
+    app = RelayApp(WebhookRelay(StubSupport(), [WEBHOOK]))
+    messages = [{"type": "http.request", "body": b'{"text"', "more_body": True}, {"type": "http.disconnect"}]
+    assert _call(app, "/slack/1", None, messages=messages) is None
+    assert app.relay.dropped == 0 and not app.relay._queues
+
+def test_relay_fetches_unknown_webhooks():
+    support = StubSupport(respond=lambda request: WEBHOOK if request[0] == Channel.WebhookUrls.GET_WEBHOOK else None)
+
+    async def run():
+        relay = WebhookRelay(support, fetch_unknown=True)
+        relay.submit_slack("1", b'{"text": "hi"}')
+        await relay.close()
+        return relay
+
+    relay = asyncio.run(run())
+    assert relay.webhooks["1"] is WEBHOOK and relay.forwarded == 1
+    assert [request[0] for request in support.requests] == [
+        Channel.WebhookUrls.GET_WEBHOOK, Channel.WebhookUrls.EXECUTE_SLACK_COMPATIBLE_WEBHOOK,
+    ]
+
+def test_relay_refetches_webhooks_after_a_failed_fetch():
+    errors = [ConnectionResetError("reset")]
+    support = StubSupport(
+        lambda request: errors.pop() if errors else None,
+        respond=lambda request: WEBHOOK if request[0] == Channel.WebhookUrls.GET_WEBHOOK else None,
+    )
+
+    async def run():
+        relay = WebhookRelay(support, fetch_unknown=True)
+        first = relay.submit_slack("1", b'{"text": "lost"}')
+        await asyncio.sleep(0.01)
+        #the worker which failed to fetch the webhook is gone, the next event starts a new one
+        second = relay.submit_slack("1", b'{"text": "hi"}')
+        await relay.close()
+        return relay, first, second
+
+    relay, first, second = asyncio.run(run())
+    assert first and second
+    assert (relay.forwarded, relay.dropped) == (1, 1) and relay.webhooks["1"] is WEBHOOK
+    assert support.requests[-1][3] == b'{"text": "hi"}'
@@ -0,0 +1,81 @@
+import pytest
+
+from apx_httpdiscord._datamodels import HTTPResponseCodes, JSONErrorCodes
+from apx_httpdiscord._retry import (
+    RetryPolicy, classify, PERMANENT, RETRYABLE, RETRYABLE_IDEMPOTENT, RETRY_AFTER,
+)
+
+@pytest.mark.parametrize("status, code, classification", [
+    (HTTPResponseCodes.TOO_MANY_REQUESTS, None, RETRY_AFTER),
+    (HTTPResponseCodes.GATEWAY_UNAVAILABLE, None, RETRYABLE),
+    (HTTPResponseCodes.SERVICE_UNAVAILABLE, None, RETRYABLE),
+    (HTTPResponseCodes.SERVER_ERROR, None, RETRYABLE_IDEMPOTENT),
+    (504, None, RETRYABLE_IDEMPOTENT),
+    (HTTPResponseCodes.NOT_FOUND, JSONErrorCodes.UNKNOWN_WEBHOOK, PERMANENT),
+    (HTTPResponseCodes.BAD_REQUEST, JSONErrorCodes.SLOWMODE_RATE_LIMIT, RETRY_AFTER),
+    (HTTPResponseCodes.SERVER_ERROR, JSONErrorCodes.GENERAL_ERROR, RETRYABLE_IDEMPOTENT),
+])
+def test_classify(status, code, classification):
+    assert classify(status, code) == classification
+
+@pytest.mark.parametrize("method, retried", [("GET", True), ("PUT", True), ("DELETE", True), ("POST", False), ("PATCH", False)])
+def test_only_idempotent_methods_retry_failures_discord_may_have_processed(method, retried):
+    policy = RetryPolicy(seed=0)
+    assert (policy.next_delay(policy.start(), method, HTTPResponseCodes.SERVER_ERROR) is not None) == retried
+    assert (policy.next_delay(policy.start(), method, error=ConnectionResetError()) is not None) == retried
+    #not processed by discord, safe to send again whatever the method
+    assert policy.next_delay(policy.start(), method, HTTPResponseCodes.GATEWAY_UNAVAILABLE) is not None
+
+def test_retry_unsafe_retries_every_method():
+    policy = RetryPolicy(retry_unsafe=True, seed=0)
+    assert policy.next_delay(policy.start(), "POST", HTTPResponseCodes.SERVER_ERROR) is not None
+
+def test_permanent_failures_and_unexpected_errors_are_not_retried():
+    policy = RetryPolicy(seed=0)
+    assert policy.next_delay(policy.start(), "GET", HTTPResponseCodes.FORBIDDEN) is None
+    assert policy.next_delay(policy.start(), "GET", error=ValueError("bug")) is None
+    assert policy.retried == 0
+
+def test_backoff_is_full_jitter_within_the_exponential_bound():
+    policy = RetryPolicy(base_delay=0.5, max_delay=4.0, seed=1)
+    for retries in range(8):
+        bound = min(4.0, 0.5 * 2 ** retries)
+        delays = [policy.backoff(retries) for _ in range(500)]
+        assert all(0 <= delay <= bound for delay in delays)
+        #jittered over the whole range rather than clustered at the bound
+        assert min(delays) < bound * 0.1 and max(delays) > bound * 0.9
+
+def test_backoff_is_reproducible_from_the_seed():
+    assert [RetryPolicy(seed=7).backoff(3) for _ in range(2)] == [RetryPolicy(seed=7).backoff(3)] * 2
+
+def test_rate_limits_wait_retry_after_up_to_their_own_cap():
+    policy = RetryPolicy(max_retries=0, max_ratelimit_retries=2, seed=0)
+    state = policy.start()
+    assert policy.next_delay(state, "POST", HTTPResponseCodes.TOO_MANY_REQUESTS, retry_after=2.5) == 2.5
+    assert policy.next_delay(state, "POST", HTTPResponseCodes.BAD_REQUEST, JSONErrorCodes.SLOWMODE_RATE_LIMIT, 1.0) == 1.0
+    assert policy.next_delay(state, "POST", HTTPResponseCodes.TOO_MANY_REQUESTS, retry_after=2.5) is None
+    assert (state.ratelimit_retries, state.retries, policy.ratelimit_retried) == (2, 0, 2)
+
+def test_retries_are_capped_per_request():
+    policy = RetryPolicy(max_retries=2, seed=0)
+    state = policy.start()
+    delays = [policy.next_delay(state, "GET", HTTPResponseCodes.GATEWAY_UNAVAILABLE) for _ in range(3)]
+    assert delays[0] is not None and delays[1] is not None and delays[2] is None
+    assert state.retries == 2
+
+def test_retry_budget_is_shared_by_all_requests():
+    policy = RetryPolicy(max_retries=5, retry_ratio=0.5, retry_burst=2.0, seed=0)
+    states = [policy.start() for _ in range(4)]
+    delays = [policy.next_delay(state, "GET", HTTPResponseCodes.GATEWAY_UNAVAILABLE) for state in states]
+    assert [delay is not None for delay in delays] == [True, True, False, False]
+    assert (policy.retried, policy.exhausted) == (2, 2)
+    #every new request adds retry_ratio of a retry to the budget
+    policy.start()
+    policy.start()
+    assert policy.next_delay(policy.start(), "GET", HTTPResponseCodes.GATEWAY_UNAVAILABLE) is not None
+
+def test_no_retry_past_the_request_timeout():
+    policy = RetryPolicy(base_delay=10.0, max_delay=10.0, timeout=0.001, seed=0)
+    state = policy.start()
+    assert policy.next_delay(state, "GET", HTTPResponseCodes.TOO_MANY_REQUESTS, retry_after=1.0) is None
+    assert policy.ratelimit_retried == 0
@@ -0,0 +1,79 @@
+import asyncio
+import json
+import pathlib
+
+import pytest
+
+from apx_httpdiscord._interactions_server import INTERACTION_DECODER
+from apx_httpdiscord._router import InteractionRouter
+
+PAYLOADS = pathlib.Path(__file__).parent / "payloads"
+
+def _interaction(payload, data):
+    raw = json.loads((PAYLOADS / payload).read_text())
+    raw["data"] = data
+    return INTERACTION_DECODER.decode(json.dumps(raw).encode())
+
+def _command(name, options=()):
+    return _interaction("interaction_chat_input.json", {"id": "1144521587004649542", "name": name, "type": 1, "options": list(options)})
+
+def _component(custom_id):
+    return _interaction("interaction_message_component.json", {"component_type": 2, "custom_id": custom_id})
+
+def _handler(name):
+    async def handler(interaction, remainder):
+        return name, remainder
+    return handler
+
+def test_routes_subcommand_groups_and_subcommands():
+    router = InteractionRouter()
+    router.command("admin", _handler("admin"))
+    router.command("admin user ban", _handler("ban"))
+    router.command("admin kick", _handler("kick"))
+
+    target = {"name": "target", "type": 6, "value": "1030837281231409212"}
+    ban = _command("admin", [{"name": "user", "type": 2, "options": [{"name": "ban", "type": 1, "options": [target]}]}])
+    handler, options = router.route(ban)
+    assert asyncio.run(handler(ban, options))[0] == "ban"
+    assert [option.name for option in options] == ["target"]
+
+    name, options = asyncio.run(router(_command("admin", [{"name": "kick", "type": 1, "options": [target]}])))
+    assert name == "kick" and options[0].value == "1030837281231409212"
+
+    name, options = asyncio.run(router(_command("admin", [target])))
+    assert name == "admin" and options[0].name == "target"
+
+def test_missing_handlers_are_not_routed():
+    router = InteractionRouter()
+    router.command("admin user ban", _handler("ban"))
+    router.component("poll:", _handler("poll"))
+
+    assert router.route(_command("roll")) == (None, None)
+    #a group without a handler of its own is not a route
+    assert router.route(_command("admin", [{"name": "user", "type": 2, "options": []}])) == (None, None)
+    assert router.route(_command("admin", [{"name": "user", "type": 2, "options": [{"name": "unban", "type": 1}]}])) == (None, None)
+    assert router.route(_component("vote:yes")) == (None, None)
+    assert asyncio.run(router(_command("roll"))) is None
+
+def test_component_custom_id_matches_longest_prefix():
+    router = InteractionRouter()
+    router.component("poll:", _handler("poll"))
+    router.component("poll:close:", _handler("close"))
+
+    assert asyncio.run(router(_component("poll:yes"))) == ("poll", "yes")
+    assert asyncio.run(router(_component("poll:close:42"))) == ("close", "42")
+    assert asyncio.run(router(_component("poll:clo"))) == ("poll", "clo")
+    assert router.route(_component("pol")) == (None, None)
+
+def test_registration_recompiles_and_rejects_duplicates():
+    router = InteractionRouter()
+    router.component("poll:", _handler("poll"))
+    assert asyncio.run(router(_component("poll:close:42"))) == ("poll", "close:42")
+
+    @router.component("poll:close:")
+    async def close(interaction, remainder):
+        return "close", remainder
+
+    assert asyncio.run(router(_component("poll:close:42"))) == ("close", "42")
+    with pytest.raises(ValueError):
+        router.component("poll:", _handler("again"))
@@ -0,0 +1,39 @@
+import time
+
+import pytest
+
+from apx_httpdiscord._signature import ReplayCache, SignatureVerifier
+
+def test_replay_cache_refuses_pairs_when_full():
+    cache = ReplayCache(window=10, max_entries=2)
+    assert cache.add(b"1", b"a", now=0) and cache.add(b"1", b"b", now=1)
+    assert not cache.add(b"1", b"c", now=2)
+    assert cache.contains(b"1", b"a", now=2) and not cache.add(b"1", b"a", now=2)
+    #Entries leave the cache only once they are out of the window.
+    assert cache.add(b"1", b"c", now=10.5) and not cache.contains(b"1", b"a", now=10.5)
+
+@pytest.fixture
+def key():
+    return pytest.importorskip("nacl.signing").SigningKey.generate()
+
+def _sign(key, body, timestamp=None):
+    timestamp = timestamp or str(int(time.time())).encode()
+    return timestamp, key.sign(timestamp + body).signature.hex().encode()
+
+def test_unsigned_requests_do_not_evict_accepted_pairs(key):
+    verifier = SignatureVerifier(key.verify_key.encode().hex(), max_workers=0, replay_cache_size=2)
+    timestamp, signature = _sign(key, b"{}")
+    assert verifier.verify_sync(timestamp, b"{}", signature)
+    for n in range(10):
+        assert not verifier.verify_sync(timestamp, b"{}", f"{n:0128x}".encode())
+    assert len(verifier.replays) == 1
+    assert not verifier.verify_sync(timestamp, b"{}", signature)
+    assert verifier.replays_rejected == 1
+
+def test_full_replay_cache_rejects_authentic_requests(key):
+    verifier = SignatureVerifier(key.verify_key.encode().hex(), max_workers=0, replay_cache_size=1)
+    timestamp, signature = _sign(key, b"1")
+    assert verifier.verify_sync(timestamp, b"1", signature)
+    timestamp, signature = _sign(key, b"2")
+    assert not verifier.verify_sync(timestamp, b"2", signature)
+    assert verifier.overflow_rejected == 1
@@ -0,0 +1,115 @@
+import asyncio
+
+import msgspec
+import pytest
+
+from apx_httpdiscord._datamodels import Channel, HttpMethods, Webhook
+from apx_httpdiscord._errors import HTTPException
+from apx_httpdiscord._support import DiscordSupport
+
+class FakeDiscord():
+    """
+    HTTP/1.1 server answering every request with the (status, JSON body) returned by respond(method, target),
+    the requests are kept as (method, target, headers, body).
+    """
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.requests = []
+        self.server = None
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.server.close()
+        await self.server.wait_closed()
+
+    @property
+    def url(self):
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}/api/v10"
+
+    async def _handle(self, reader, writer):
+        try:
+            while(request_line := await reader.readline()):
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while((line := await reader.readline()) not in (b"\r\n", b"")):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                self.requests.append((method, target, headers, body))
+                status, data = self.respond(method, target)
+                payload = msgspec.json.encode(data) if data is not None else b""
+                writer.write(
+                    f"HTTP/1.1 {status} X\r\nContent-Type: application/json\r\nContent-Length: {len(payload)}\r\n\r\n".encode()
+                    + payload
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+WEBHOOK = {"id": "10", "type": 1, "channel_id": "20", "name": "hook", "token": "secret"}
+
+def test_send_decodes_route_return_type():
+    async def run():
+        async with FakeDiscord(lambda method, target: (200, [WEBHOOK])) as discord:
+            async with DiscordSupport("token", base_url=discord.url) as support:
+                result = await support.send(Channel.WebhookUrls.GET_CHANNEL_WEBHOOKS, HttpMethods.GET, {"channel.id": 20})
+        return result, discord.requests
+
+    result, requests = asyncio.run(run())
+    assert isinstance(result[0], Webhook) and result[0].token == "secret"
+    method, target, headers, _ = requests[0]
+    assert (method, target) == ("GET", "/api/v10/channels/20/webhooks")
+    assert headers["authorization"] == "Bot token"
+
+def test_send_raises_http_exception():
+    async def run():
+        async with FakeDiscord(lambda method, target: (404, {"code": 10015, "message": "Unknown Webhook"})) as discord:
+            async with DiscordSupport("token", base_url=discord.url) as support:
+                await support.send(Channel.WebhookUrls.GET_CHANNEL_WEBHOOKS, HttpMethods.GET, {"channel.id": 20})
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(run())
+    assert error.value.status == 404 and error.value.code == 10015
+
+def test_send_streams_file_locations(tmp_path):
+    location = tmp_path / "report.txt"
+    location.write_bytes(b"x" * 200_000)
+    payload = Channel.ExecuteWebhookJSONParams(content="report", file_locations=[str(location)])
+
+    async def run():
+        async with FakeDiscord(lambda method, target: (204, None)) as discord:
+            async with DiscordSupport(base_url=discord.url) as support:
+                await support.send(Channel.WebhookUrls.EXECUTE_WEBHOOK, HttpMethods.POST, {"webhook": WEBHOOK}, payload=payload)
+        return discord.requests
+
+    (method, target, headers, body), = asyncio.run(run())
+    assert (method, target) == ("POST", "/api/v10/webhooks/10/secret")
+    assert headers["content-type"].startswith("multipart/form-data; boundary=")
+    assert int(headers["content-length"]) == len(body)
+    assert b'name="files[0]"; filename="report.txt"' in body and b"x" * 200_000 in body
+    assert b'"filename":"report.txt","id":0' in body and b"file_locations" not in body
+
+def test_traced_urls_do_not_hold_tokens():
+    started = []
+
+    class Tracer():
+        def start(self, method, route, target):
+            started.append((method, route, target))
+
+    async def run():
+        async with FakeDiscord(lambda method, target: (204, None)) as discord:
+            async with DiscordSupport("token", base_url=discord.url, tracer=Tracer()) as support:
+                webhook = Webhook(id="10", type=1, token="secret")
+                await support.send(Channel.WebhookUrls.DELETE_WEBHOOK_WITH_TOKEN, HttpMethods.DELETE, {"webhook": webhook})
+        return discord.requests
+
+    (_, target, _, _), = asyncio.run(run())
+    assert target == "/api/v10/webhooks/10/secret"
+    assert started == [("DELETE", Channel.WebhookUrls.DELETE_WEBHOOK_WITH_TOKEN, "/webhooks/10/{webhook.token}")]
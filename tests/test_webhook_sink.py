@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+
+from apx_httpdiscord._datamodels import Webhook
+from apx_httpdiscord._errors import CircuitOpenError
+from apx_httpdiscord._webhook_sink import WebhookSink
+
+from stubs import StubSupport
+
+WEBHOOK = Webhook(id="1", type=1, token="token")
+
+@pytest.mark.parametrize("error", [
+    ConnectionResetError("reset"), asyncio.TimeoutError(), CircuitOpenError("webhooks/1", 1.0), asyncio.IncompleteReadError(b"", 10),
+])
+def test_sink_keeps_flushing_after_send_errors(error):
+    errors = [error]
+    support = StubSupport(lambda request: errors.pop() if errors else None)
+
+    async def run():
+        async with WebhookSink(support, interval=0.01) as sink:
+            sink.emit(WEBHOOK, "first")
+            await asyncio.sleep(0.05)
+            sink.emit(WEBHOOK, "second")
+        return sink
+
+    sink = asyncio.run(run())
+    assert (sink.sent, sink.dropped) == (1, 1)
+    assert support.requests[-1][3].embeds[0].description == "second"
+
+@pytest.mark.parametrize("embeds", [True, False])
+def test_sink_tracks_buffered_length(embeds):
+    support = StubSupport()
+    lines = [f"{n:04} " + "x" * (n % 300) for n in range(400)]
+
+    async def run():
+        sink = WebhookSink(support, interval=60, embeds=embeds)
+        for line in lines:
+            sink.emit(WEBHOOK, line)
+        await asyncio.sleep(0.01)
+        buffer = sink._buffers[WEBHOOK.id]
+        assert support.requests and buffer.lines
+        assert buffer.length == sum(len(line) + 1 for line in buffer.lines)
+        await sink.close()
+        return sink
+
+    sink = asyncio.run(run())
+    assert (sink.sent, sink.dropped) == (len(lines), 0)
+    if(embeds):
+        sent = [line for request in support.requests for embed in request[3].embeds for line in embed.description.split("\n")]
+    else:
+        sent = [line for request in support.requests for line in request[3].content.split("\n")]
+    assert sent == lines